@@ -7,19 +7,27 @@ Extracts data BEFORE swiping to capture all visible profiles
 """
 
 import sys
+import atexit
 import json
+import logging
 import csv
+import io
 import argparse
 import os
 import time
 import random
 import re
 import subprocess
+import queue
+import hashlib
 import tempfile
 import shutil
+import threading
+import traceback
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
+from collections import Counter, deque
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
 
@@ -29,12 +37,27 @@ try:
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, TimeoutException, ElementClickInterceptedException
+    from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, TimeoutException, ElementClickInterceptedException, StaleElementReferenceException
 except ImportError as e:
     print(f"[X] Error: Missing required package: {e}")
     print("[+] Please install requirements: cd .. && uv pip install selenium undetected-chromedriver")
     raise RuntimeError(f"Missing required package: {e}") from e
 
+try:
+    import orjson  # Optional: Rust-backed JSON encoding on the per-profile hot path
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # Optional: much faster fingerprint hashing when installed
+except ImportError:
+    xxhash = None
+
+try:
+    import zstandard as zstd  # Optional: compress debug HTML dumps
+except ImportError:
+    zstd = None
+
 # Color output (simple ASCII for cross-platform compatibility)
 GREEN = "[OK]"
 RED = "[X]"
@@ -47,9 +70,33 @@ except Exception:
     BrowserLauncher = None
 
 # Safe print function that handles Unicode encoding errors
+# Verbose diagnostics go through a logger so the per-iteration fingerprint
+# chatter costs nothing unless DEBUG is enabled (via --debug)
+log = logging.getLogger('bumble')
+if not log.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(_log_handler)
+log.setLevel(logging.INFO)
+
+
+# Per-profile status prints are pure overhead for daemon/CI runs; setting
+# BUMBLE_QUIET=1 silences everything routed through safe_print while leaving
+# warnings/errors printed directly. The single-write fast path also skips
+# print's per-argument handling in the hot loop.
+_VERBOSE = not os.environ.get('BUMBLE_QUIET')
+
+
 def safe_print(*args, **kwargs):
-    """Print function that safely handles Unicode characters on Windows"""
+    """Print function that safely handles Unicode characters on Windows.
+    Silenced entirely when BUMBLE_QUIET is set."""
+    if not _VERBOSE:
+        return
     try:
+        if len(args) == 1 and not kwargs and type(args[0]) is str:
+            # Fast path for the common single-message call
+            sys.stdout.write(args[0] + '\n')
+            return
         print(*args, **kwargs)
     except UnicodeEncodeError:
         # Fallback: encode to ASCII with error handling
@@ -65,16 +112,401 @@ def safe_print(*args, **kwargs):
         print(*encoded_args, **kwargs)
 
 
+def _dedup_append(lst: List, seen: set, value) -> bool:
+    """Append value to lst if truthy and not seen before (O(1) membership via set)."""
+    if value and value not in seen:
+        seen.add(value)
+        lst.append(value)
+        return True
+    return False
+
+
+# Precompiled patterns for bio-based job/education extraction
+# Cheap substring anchors let us skip the regex entirely on non-matching bios
+_EDU_ANCHORS = ('University', 'College', 'School', 'Institute')
+_EDU_RE = re.compile(r'([A-Z][^,\n]*(?:University|College|School|Institute)[^,\n]*)')
+_JOB_KEYWORD_RE = re.compile(r'\b(?:at|designer|engineer|manager|developer|director|specialist|analyst)\b', re.I)
+
+# Single-roundtrip text extraction: textContent, innerText, then nested-div fallback
+# Replaces the old 3-method (.text / execute_script / nested div) per-element fallback
+# Single C-level alternation scans instead of per-keyword substring loops
+# Chrome version / age parsing patterns, compiled once at import
+_RE_REG_VERSION = re.compile(r'version\\s+REG_SZ\\s+(\\d+)')
+_RE_CHROME_MAJOR = re.compile(r'(\\d+)\\.')
+_RE_BROWSER_VERSION_ERR = re.compile(r'Current browser version is (\\d+)\\.')
+_RE_AGE = re.compile(r'(\d{2})')
+
+_PREF_RE = re.compile(r"relationship|something casual|don't know yet|friendship|network", re.I)
+_FROM_LOC_RE = re.compile(r'lives in|from|🇺🇸|🇬🇧|🇨🇦|🇲🇽|🇦🇺', re.I)
+
+_GET_TEXT_JS = (
+    "return (arguments[0].textContent || arguments[0].innerText || "
+    "((arguments[0].querySelector('div.p-3, div') || {}).textContent) || '').trim();"
+)
+
+# Runtime profile-guided ordering: selectors that hit before are probed first,
+# skipping wasted find_elements roundtrips on the losers
+_SELECTOR_STATS = Counter()
+
+
+def _by_hit_count(selectors):
+    """Order a selector list so previously-successful selectors come first."""
+    return sorted(selectors, key=lambda s: -_SELECTOR_STATS[s])
+
+
+
+# HEAD-probe candidate settings URLs from inside the page: one async script
+# instead of a full page load (and readyState wait) per candidate
+_SETTINGS_PROBE_JS = """
+var urls = arguments[0];
+var done = arguments[arguments.length - 1];
+(async () => {
+    for (const u of urls) {
+        try {
+            const r = await fetch(u, {method: 'HEAD', redirect: 'manual'});
+            if (r.status < 400) { done(u); return; }
+        } catch (e) {}
+    }
+    done(null);
+})();
+"""
+
+def _probe_settings_url(browser, urls: List[str]) -> Optional[str]:
+    """Return the first settings URL that answers a HEAD probe, or None."""
+    try:
+        browser.set_script_timeout(5)
+        return browser.execute_async_script(_SETTINGS_PROBE_JS, urls)
+    except Exception:
+        return None
+
+
+def _wait_loaded(browser, timeout: float = 5) -> None:
+    """Wait for document.readyState == 'complete' instead of a blind sleep."""
+    try:
+        WebDriverWait(browser, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except Exception:
+        # Page may still be usable; don't let a slow resource block us
+        pass
+
+
+def _wait_for_app(browser, timeout: float = 15) -> None:
+    """Wait until the app URL is active and the document has finished loading."""
+    try:
+        WebDriverWait(browser, timeout).until(
+            lambda d: '/app' in d.current_url
+            and d.execute_script("return document.readyState") == "complete"
+        )
+    except Exception:
+        pass
+
+
+def _wait_for_encounters_card(browser, timeout: float = 10) -> None:
+    """Wait for a profile card to appear instead of sleeping a fixed delay."""
+    try:
+        WebDriverWait(browser, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, '.encounters-story-viewer, .encounters-card, article.encounters-album'))
+        )
+    except TimeoutException:
+        pass
+
+
+# Last selector that matched for each set_location probe, keyed by probe name.
+# Cached at module level so it survives browser restarts within a run.
+_LAST_WORKING_SELECTORS: Dict[str, str] = {}
+
+_FIRST_VISIBLE_SELECTOR_JS = """
+for (const s of arguments[0]) {
+    try {
+        const e = document.querySelector(s);
+        if (e && e.offsetParent !== null) return s;
+    } catch (err) {}
+}
+return null;
+"""
+
+_CLICK_FIRST_VISIBLE_JS = """
+for (const s of arguments[0]) {
+    try {
+        const e = document.querySelector(s);
+        if (e && e.offsetParent !== null && !e.disabled) { e.click(); return s; }
+    } catch (err) {}
+}
+return null;
+"""
+
+def _click_first_visible(browser, cache_key: str, selectors: List[str]) -> Optional[str]:
+    """
+    Find + visibility + enabled + click in a single in-page pass instead of
+    four webdriver round trips per candidate. Returns the clicked selector
+    (cached under cache_key for next time) or None.
+    """
+    last = _LAST_WORKING_SELECTORS.get(cache_key)
+    if last and last in selectors and selectors[0] != last:
+        selectors = [last] + [sel for sel in selectors if sel != last]
+    try:
+        clicked = browser.execute_script(_CLICK_FIRST_VISIBLE_JS, selectors)
+    except Exception:
+        clicked = None
+    if clicked:
+        _LAST_WORKING_SELECTORS[cache_key] = clicked
+    return clicked
+
+
+def _find_first_visible_selector(browser, cache_key: str, selectors: List[str]) -> Optional[str]:
+    """
+    Probe a list of CSS selectors in ONE in-page DOM pass and return the first
+    that matches a visible element, or None. The winning selector is cached
+    under cache_key and probed first on subsequent calls.
+    """
+    last = _LAST_WORKING_SELECTORS.get(cache_key)
+    if last and last in selectors and selectors[0] != last:
+        selectors = [last] + [sel for sel in selectors if sel != last]
+    try:
+        found = browser.execute_script(_FIRST_VISIBLE_SELECTOR_JS, selectors)
+    except Exception:
+        found = None
+    if found:
+        _LAST_WORKING_SELECTORS[cache_key] = found
+    return found
+
+def _safe_text(browser, elem) -> Optional[str]:
+    """Element text with a single JS fallback, replacing nested try/except towers."""
+    try:
+        text = elem.text.strip()
+        if text:
+            return text
+    except Exception:
+        pass
+    try:
+        text = browser.execute_script(_GET_TEXT_JS, elem)
+        return text or None
+    except Exception:
+        return None
+
+
+# Event-driven DOM readiness: resolves as soon as the first badge node appears
+# instead of sleeping the fixed worst case
+_WAIT_FOR_BADGES_JS = """
+    const cb = arguments[arguments.length - 1];
+    const timeoutMs = arguments[0];
+    if (document.querySelector('.encounters-story-about__badge')) return cb(true);
+    const obs = new MutationObserver(() => {
+        if (document.querySelector('.encounters-story-about__badge')) {
+            obs.disconnect();
+            cb(true);
+        }
+    });
+    obs.observe(document.body, {childList: true, subtree: true});
+    setTimeout(() => { obs.disconnect(); cb(false); }, timeoutMs);
+"""
+
+
+def _wait_for_badges(browser, timeout: float = 1.5) -> bool:
+    """Wait for the first profile badge via MutationObserver, capped at timeout seconds."""
+    try:
+        browser.set_script_timeout(timeout + 1)
+        return bool(browser.execute_async_script(_WAIT_FOR_BADGES_JS, int(timeout * 1000)))
+    except Exception:
+        # Fall back to the old coarse wait if async scripts are unavailable
+        time.sleep(1)
+        return False
+
+
+# Installed once per page: lets the browser reuse its compiled-selector cache
+# across calls instead of paying Python->wire->parse cost per element
+_QUERY_TEXTS_JS = (
+    "window.__q = window.__q || function(s){"
+    "return Array.from(document.querySelectorAll(s), "
+    "function(e){return (e.textContent || e.innerText || '').trim();});};"
+    "return window.__q(arguments[0]);"
+)
+
+
+def _query_texts(browser, selector: str) -> List[str]:
+    """Return trimmed text for every element matching selector in one JS call."""
+    try:
+        return browser.execute_script(_QUERY_TEXTS_JS, selector) or []
+    except Exception:
+        return []
+
+
+# One-shot page sweep: harvests every repeated-element section in a single wire
+# call (badges, question answers, from-location pills, Spotify artists, town and
+# distance widgets). Selectors mirror the per-element fallback paths below.
+_PROFILE_EXTRACT_JS = """
+    const getText = (el) => el ? (el.textContent || el.innerText || '').trim() : '';
+    const collect = (selector) => Array.from(document.querySelectorAll(selector), getText).filter(Boolean);
+    const questions = {};
+    for (const section of document.querySelectorAll('.encounters-story-section--question')) {
+        const title = getText(section.querySelector('.encounters-story-section__heading-title h2, .encounters-story-section__heading-title'));
+        const answer = getText(section.querySelector('.encounters-story-about__text, .encounters-story-section__content p, .encounters-story-section__content'));
+        if (title && answer) {
+            questions[title] = answer;
+        }
+    }
+    return {
+        badges: collect('.encounters-story-about__badge .pill__title, .encounters-story-section--about .pill__title, .encounters-story-about__badge, .pill[data-qa-role="pill"] .pill__title'),
+        questions: questions,
+        pills: collect('.location-widget__pill .pill__title, .location-widget__info .pill__title'),
+        spotify: collect('.spotify-widget__artist .spotify-widget__artist-name'),
+        towns: collect('.location-widget__town'),
+        distances: collect('.location-widget__distance')
+    };
+"""
+
+
+# Shared Chrome flags (ChromeOptions objects themselves cannot be reused)
+_UC_FLAGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+)
+
+# Patched chromedriver binary from the first uc.Chrome launch, reused on
+# restarts so uc skips the download/patch sequence (~1-3s per restart)
+_UC_DRIVER_PATH = None
+
+
+# Debug HTML dumps are opt-in: each one serializes the full DOM and writes
+# megabytes to disk. Set from the --debug CLI flag via scrape_profiles.
+_DEBUG_DUMPS = False
+
+
+# One wire call answers the daily-limit blocker check: presence, visibility
+# and the CTA title come back together instead of via nested find_element
+_BLOCKER_CHECK_JS = """
+    const b = document.querySelector('.encounters-user__blocker, [data-qa-role="encounters-blocker-vote-quota"]');
+    if (!b) return null;
+    const t = b.querySelector('[data-qa-role="cta-box-title"], .cta-box__title');
+    return {
+        visible: b.offsetParent !== null,
+        title: (t && t.innerText ? t.innerText : '').toLowerCase()
+    };
+"""
+
+
+def check_daily_limit(browser) -> Optional[Dict]:
+    """
+    Probe the swipe-limit blocker in a single in-page call.
+    Returns {'visible': bool, 'title': str} when the blocker exists, else None.
+    """
+    try:
+        return browser.execute_script(_BLOCKER_CHECK_JS)
+    except Exception as e:
+        print(f"{YELLOW} Error checking for swipe limit: {e}")
+        return None
+
+
+# End-state indicators checked against the visible page text in-page, so we
+# never ship the multi-MB page_source over the wire just to substring-scan it
+_END_INDICATORS = [
+    'no more profiles', 'out of people', 'no one new',
+    'no one around', 'all caught up', 'see you tomorrow',
+    'come back tomorrow', 'no matches', 'empty state',
+    'end of the line', 'hit the end', 'vote quota',
+    'upgrade to bumble boost', 'wait until tomorrow',
+]
+_DAILY_LIMIT_INDICATORS = frozenset(
+    ('end of the line', 'hit the end', 'vote quota', 'wait until tomorrow'))
+
+_END_STATE_JS = """
+    const text = (document.body ? document.body.innerText : '').toLowerCase();
+    return arguments[0].filter(s => text.includes(s));
+"""
+
+
+# One wire call collects src/data-src for every candidate image selector,
+# replacing two get_attribute round trips per image element
+_IMAGE_SRC_JS = """
+    const out = [];
+    const seen = new Set();
+    for (const sel of arguments[0]) {
+        let els;
+        try {
+            els = document.querySelectorAll(sel);
+        } catch (err) {
+            continue;
+        }
+        for (const img of els) {
+            const src = img.getAttribute('src') || img.getAttribute('data-src');
+            if (src && !seen.has(src)) {
+                seen.add(src);
+                out.push(src);
+            }
+        }
+    }
+    return out;
+"""
+
+
+# Everything the bio loop needs from a candidate element in one wire call:
+# its visible text, its own class, and the enclosing story-section's class
+# (three separate get_attribute/text round trips otherwise)
+_BIO_ELEM_INFO_JS = """
+    const el = arguments[0];
+    const section = el.closest('section.encounters-story-section');
+    return {
+        text: (el.innerText || '').trim(),
+        own_class: el.getAttribute('class') || '',
+        section_class: section ? (section.getAttribute('class') || '') : null
+    };
+"""
+
+
+# Page-structure inspection in one wire call: every probe selector's count
+# plus up to three tag/class/text samples, instead of 40+ element round trips
+_INSPECT_PAGE_JS = """
+    const result = {buttons: document.querySelectorAll('button').length, probes: []};
+    for (const s of arguments[0]) {
+        try {
+            const els = Array.from(document.querySelectorAll(s));
+            if (!els.length) continue;
+            result.probes.push({
+                selector: s,
+                count: els.length,
+                samples: els.slice(0, 3).map(e => ({
+                    tag: e.tagName.toLowerCase(),
+                    cls: (e.className && e.className.slice) ? e.className.slice(0, 50) : '',
+                    text: (e.innerText || '').slice(0, 100)
+                }))
+            });
+        } catch (err) {}
+    }
+    return result;
+"""
+
+
+# One in-page sweep for the fingerprint fallback (used when full extraction
+# failed): all fields in a single wire call instead of five find_element trips
+_PARTIAL_FINGERPRINT_JS = """
+    const text = sel => {
+        const e = document.querySelector(sel);
+        return e ? e.innerText.trim() : null;
+    };
+    const texts = sel => Array.from(document.querySelectorAll(sel))
+        .map(e => e.innerText.trim()).filter(t => t);
+    return {
+        age: text('.encounters-story-profile__age'),
+        location: text('.location-widget__town'),
+        badges: texts('.encounters-story-about__badge .pill__title'),
+        qa_keys: texts('.encounters-story-section--question .encounters-story-section__heading-title'),
+        image_urls: Array.from(document.querySelectorAll('.encounters-album__photo img'))
+            .slice(0, 3).map(img => img.src).filter(src => src)
+    };
+"""
+
+
 def create_chrome_options(headless: bool) -> uc.ChromeOptions:
     """Create a new ChromeOptions object (cannot be reused)."""
     options = uc.ChromeOptions()
     # Use --headless=old instead of --headless=new (more reliable on Windows)
     if headless:
         options.add_argument('--headless=old')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    for flag in _UC_FLAGS:
+        options.add_argument(flag)
     return options
 
 
@@ -90,7 +522,7 @@ def detect_chrome_version(headless: bool) -> Optional[int]:
                     capture_output=True, text=True, timeout=5
                 )
                 if result.returncode == 0:
-                    match = re.search(r'version\\s+REG_SZ\\s+(\\d+)', result.stdout)
+                    match = _RE_REG_VERSION.search(result.stdout)
                     if match:
                         chrome_version = int(match.group(1))
                         print(f"{CYAN} Detected Chrome version: {chrome_version}")
@@ -98,12 +530,7 @@ def detect_chrome_version(headless: bool) -> Optional[int]:
                 print(f"{YELLOW} Could not detect Chrome version from registry: {e}")
                 # Try alternative method: check Chrome executable
                 try:
-                    chrome_paths = [
-                        os.path.expanduser('~\\AppData\\Local\\Google\\Chrome\\Application\\chrome.exe'),
-                        'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
-                        'C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe',
-                    ]
-                    for chrome_path in chrome_paths:
+                    for chrome_path in _CHROME_EXE_CANDIDATES:
                         if os.path.exists(chrome_path):
                             version_args = [chrome_path, '--version']
                             if headless:
@@ -113,7 +540,7 @@ def detect_chrome_version(headless: bool) -> Optional[int]:
                                 capture_output=True, text=True, timeout=5
                             )
                             if result.returncode == 0:
-                                match = re.search(r'(\\d+)\\.', result.stdout)
+                                match = _RE_CHROME_MAJOR.search(result.stdout)
                                 if match:
                                     chrome_version = int(match.group(1))
                                     print(f"{CYAN} Detected Chrome version from executable: {chrome_version}")
@@ -125,8 +552,63 @@ def detect_chrome_version(headless: bool) -> Optional[int]:
     return chrome_version
 
 
+_CHROME_VERSION_CACHE = Path.home() / '.cache' / 'bumble_scraper' / 'chrome_version.json'
+
+_CHROME_EXE_CANDIDATES = (
+    os.path.expanduser('~\\AppData\\Local\\Google\\Chrome\\Application\\chrome.exe'),
+    'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
+    'C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe',
+)
+
+
+def _chrome_cache_key() -> str:
+    """Identify the installed Chrome by executable path and mtime."""
+    for chrome_path in _CHROME_EXE_CANDIDATES:
+        try:
+            return f"{chrome_path}:{os.path.getmtime(chrome_path)}"
+        except OSError:
+            continue
+    return 'registry'
+
+
+def invalidate_chrome_version_cache() -> None:
+    """Drop the cached Chrome version (e.g. after a driver/version mismatch)."""
+    try:
+        _CHROME_VERSION_CACHE.unlink()
+    except OSError:
+        pass
+
+
+def get_cached_chrome_version(headless: bool) -> Optional[int]:
+    """
+    Chrome major version, cached across runs.
+
+    Detection spawns reg query / chrome.exe --version subprocesses, so the
+    result is persisted keyed by the executable's path+mtime and reused until
+    Chrome itself is updated.
+    """
+    cache_key = _chrome_cache_key()
+    try:
+        with open(_CHROME_VERSION_CACHE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('key') == cache_key and cached.get('version'):
+            return int(cached['version'])
+    except (OSError, ValueError):
+        pass
+
+    chrome_version = detect_chrome_version(headless)
+    if chrome_version:
+        try:
+            _CHROME_VERSION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with open(_CHROME_VERSION_CACHE, 'w', encoding='utf-8') as f:
+                json.dump({'key': cache_key, 'version': chrome_version}, f)
+        except OSError:
+            pass
+    return chrome_version
+
+
 def extract_chrome_version_from_error(error_msg: str) -> Optional[int]:
-    match = re.search(r'Current browser version is (\\d+)\\.', error_msg)
+    match = _RE_BROWSER_VERSION_ERR.search(error_msg)
     if match:
         try:
             return int(match.group(1))
@@ -135,6 +617,33 @@ def extract_chrome_version_from_error(error_msg: str) -> Optional[int]:
     return None
 
 
+# Remembers the last location applied through the settings flow so repeat runs
+# can skip the settings navigation + double page reload when nothing changed.
+_LOCATION_STATE_FILE = Path.home() / '.cache' / 'bumble_scraper' / 'location_state.json'
+_LOCATION_STATE_TTL = 24 * 60 * 60  # Re-apply after a day even if unchanged
+
+
+def _location_recently_set(location: str) -> bool:
+    """Return True if `location` was applied within the TTL on a previous run."""
+    try:
+        with open(_LOCATION_STATE_FILE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return (state.get('last_location') == location
+                and (time.time() - float(state.get('ts', 0))) < _LOCATION_STATE_TTL)
+    except Exception:
+        return False
+
+
+def _remember_location(location: str) -> None:
+    """Persist the location we just applied so the next run can skip it."""
+    try:
+        _LOCATION_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_LOCATION_STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'last_location': location, 'ts': time.time()}, f)
+    except Exception:
+        pass  # Cache miss next run, nothing lost
+
+
 def clear_uc_driver_cache():
     """Best-effort cleanup for undetected-chromedriver cache on Windows."""
     cache_dirs = []
@@ -169,6 +678,7 @@ def clear_uc_driver_cache():
 
 def get_browser(headless: bool, chrome_version: Optional[int] = None, prefer_launcher: bool = False):
     """Create a browser instance using shared logic and optional BrowserLauncher."""
+    global _UC_DRIVER_PATH
     if prefer_launcher and BrowserLauncher:
         try:
             launcher = BrowserLauncher(headless=headless)
@@ -178,7 +688,7 @@ def get_browser(headless: bool, chrome_version: Optional[int] = None, prefer_lau
             print(f"{YELLOW} BrowserLauncher failed, falling back to direct launch: {e}")
 
     if chrome_version is None:
-        chrome_version = detect_chrome_version(headless)
+        chrome_version = get_cached_chrome_version(headless)
 
     max_attempts = 3
     attempt = 0
@@ -197,10 +707,17 @@ def get_browser(headless: bool, chrome_version: Optional[int] = None, prefer_lau
             user_data_dir = tempfile.mkdtemp(prefix="bumble-uc-")
             options.add_argument(f"--user-data-dir={user_data_dir}")
 
-            if chrome_version:
-                browser = uc.Chrome(options=options, version_main=chrome_version, headless=headless, use_subprocess=not headless)
-            else:
-                browser = uc.Chrome(options=options, version_main=None, headless=headless, use_subprocess=not headless)
+            uc_kwargs = {}
+            if _UC_DRIVER_PATH:
+                uc_kwargs['driver_executable_path'] = _UC_DRIVER_PATH
+            browser = uc.Chrome(options=options, version_main=chrome_version,
+                                headless=headless, use_subprocess=not headless, **uc_kwargs)
+
+            try:
+                if browser.service and browser.service.path:
+                    _UC_DRIVER_PATH = browser.service.path
+            except Exception:
+                pass
 
             browser._bumble_user_data_dir = user_data_dir
             return browser, chrome_version
@@ -221,6 +738,8 @@ def get_browser(headless: bool, chrome_version: Optional[int] = None, prefer_lau
                     print(f"{CYAN} Detected actual Chrome version from error: {actual_chrome_version}")
                     if chrome_version != actual_chrome_version:
                         chrome_version = actual_chrome_version
+                        _UC_DRIVER_PATH = None
+                        invalidate_chrome_version_cache()
                         clear_uc_driver_cache()
                     print(f"{CYAN} Retrying with correct Chrome version: {chrome_version}")
                     if attempt < max_attempts:
@@ -231,6 +750,8 @@ def get_browser(headless: bool, chrome_version: Optional[int] = None, prefer_lau
                 actual_chrome_version = extract_chrome_version_from_error(error_msg)
                 if actual_chrome_version and chrome_version != actual_chrome_version:
                     chrome_version = actual_chrome_version
+                    _UC_DRIVER_PATH = None
+                    invalidate_chrome_version_cache()
                     clear_uc_driver_cache()
                     print(f"{CYAN} Detected actual Chrome version from error: {chrome_version}")
                 retry_delay = random.uniform(0.5, 1.5)
@@ -241,8 +762,20 @@ def get_browser(headless: bool, chrome_version: Optional[int] = None, prefer_lau
             raise
 
 
+# Parsed cookie files keyed by (path, mtime): restarts reuse the parse
+# instead of re-reading the file, and edits on disk still invalidate
+_COOKIE_CACHE: Dict[tuple, List[Dict]] = {}
+
+
 def load_cookies_from_file(cookie_file: str) -> Optional[List[Dict]]:
     """Load cookies from JSON file extracted by extract_bumble_cookies.py"""
+    try:
+        cache_key = (cookie_file, os.path.getmtime(cookie_file))
+        cached = _COOKIE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+    except OSError:
+        cache_key = None
     try:
         with open(cookie_file, 'r', encoding='utf-8') as f:
             cookies = json.load(f)
@@ -256,6 +789,8 @@ def load_cookies_from_file(cookie_file: str) -> Optional[List[Dict]]:
             return None
         
         print(f"{GREEN} Loaded {len(cookies)} cookies from {cookie_file}")
+        if cache_key is not None:
+            _COOKIE_CACHE[cache_key] = cookies
         return cookies
     except FileNotFoundError:
         print(f"{RED} Error: Cookie file not found: {cookie_file}")
@@ -372,7 +907,6 @@ def inject_cookies_to_browser(browser: webdriver.Chrome, cookies: List[Dict]) ->
             
     except Exception as e:
         print(f"{RED} Error injecting cookies: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -465,7 +999,8 @@ def dismiss_consent_iframe(browser: webdriver.Chrome) -> bool:
         return False
 
 
-def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optional[Dict]:
+def extract_profile_data(browser: webdriver.Chrome, gender: str = None,
+                         seen_fingerprints: Optional[set] = None) -> Optional[Dict]:
     """
     Extract profile data from the current visible profile card.
     Returns None if no profile is visible.
@@ -473,6 +1008,9 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
     Args:
         browser: Selenium WebDriver instance
         gender: Optional gender to set for the profile (e.g., "female", "male", "non-binary")
+        seen_fingerprints: Optional set of quick fingerprints from earlier profiles.
+            When the cheap name/age/bio fingerprint matches, extraction returns a
+            '_duplicate'-flagged dict immediately, skipping the expensive sweeps.
     """
     try:
         # Wait for profile card to be visible
@@ -513,13 +1051,14 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
         except Exception as e:
             print(f"{YELLOW} Error during section check: {e}")
         
-        # Save current HTML for debugging
-        try:
-            with open('bumble_profile_debug.html', 'w', encoding='utf-8') as f:
-                f.write(browser.page_source)
-            print(f"{CYAN} Saved profile page HTML to bumble_profile_debug.html")
-        except Exception:
-            pass
+        # Save current HTML for debugging (opt-in: full DOM serialization)
+        if _DEBUG_DUMPS:
+            try:
+                with open('bumble_profile_debug.html', 'w', encoding='utf-8') as f:
+                    f.write(browser.page_source)
+                print(f"{CYAN} Saved profile page HTML to bumble_profile_debug.html")
+            except Exception:
+                pass
         
         # Try multiple selectors for profile card - updated based on actual Bumble structure
         # Found: article.encounters-album contains the FIRST VISIBLE PROFILE with name/age
@@ -535,7 +1074,7 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
         ]
         
         profile_element = None
-        for selector in profile_selectors:
+        for selector in _by_hit_count(profile_selectors):
             try:
                 elements = browser.find_elements(By.CSS_SELECTOR, selector)
                 if elements:
@@ -544,6 +1083,7 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                         try:
                             if elem.is_displayed() and elem.text:
                                 profile_element = elem
+                                _SELECTOR_STATS[selector] += 1
                                 print(f"{GREEN} Found profile element using selector: {selector}")
                                 print(f"{CYAN} Element tag: {profile_element.tag_name}")
                                 print(f"{CYAN} Element classes: {profile_element.get_attribute('class')}")
@@ -606,11 +1146,7 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
             for selector in name_selectors:
                 try:
                     name_elem = browser.find_element(By.CSS_SELECTOR, selector)
-                    # Try textContent first (more reliable than .text)
-                    try:
-                        name_text = browser.execute_script("return arguments[0].textContent;", name_elem).strip()
-                    except:
-                        name_text = name_elem.text.strip()
+                    name_text = _safe_text(browser, name_elem)
                     
                     if name_text and 2 <= len(name_text) <= 50:
                         profile_data["name"] = name_text
@@ -648,8 +1184,7 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                     age_elem = browser.find_element(By.CSS_SELECTOR, selector)
                     age_text = age_elem.text.strip()
                     # Remove comma and extract number (format: ", 28" or "28")
-                    import re
-                    age_match = re.search(r'(\d{2})', age_text)
+                    age_match = _RE_AGE.search(age_text)
                     if age_match:
                         age = int(age_match.group(1))
                         if 18 <= age <= 99:
@@ -661,7 +1196,6 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
             
             # Fallback: try regex on article text if direct selectors failed
             if not profile_data.get("name") or not profile_data.get("age"):
-                import re
                 # Try both .text and JavaScript textContent for article text
                 try:
                     article_text = browser.execute_script("return arguments[0].textContent;", profile_element)
@@ -698,7 +1232,6 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
         # Age should already be extracted above, but add fallback if missing
         if "age" not in profile_data or profile_data["age"] is None:
             try:
-                import re
                 article_text = profile_element.text
                 # Find two-digit number (likely age) in first 500 chars
                 age_match = re.search(r'\b(\d{2})\b', article_text[:500])
@@ -717,7 +1250,13 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
             # DEBUG: Log all sections found on page to see structure
             all_sections = browser.find_elements(By.CSS_SELECTOR, 'section.encounters-story-section')
             if all_sections:
-                section_classes = [s.get_attribute('class') for s in all_sections]
+                # Batch the class reads into one wire call instead of one per section
+                try:
+                    section_classes = browser.execute_script(
+                        "return arguments[0].map(function(s) { return s.getAttribute('class'); });",
+                        all_sections)
+                except Exception:
+                    section_classes = [s.get_attribute('class') for s in all_sections]
                 print(f"{CYAN} Found {len(all_sections)} sections: {section_classes}")
 
             bio_selectors = [
@@ -733,22 +1272,26 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                     bio_elems = browser.find_elements(By.CSS_SELECTOR, selector)
                     for bio_elem in bio_elems:
                         try:
-                            # Log every potential bio element found
-                            raw_text = bio_elem.text.strip()
+                            # One wire call per element: text + own class + section class
+                            # (was three round trips: .text, ancestor lookup, get_attribute)
+                            try:
+                                info = browser.execute_script(_BIO_ELEM_INFO_JS, bio_elem) or {}
+                            except Exception:
+                                info = {}
+                            raw_text = (info.get('text') if info else bio_elem.text or '').strip()
                             if not raw_text:
                                 continue
-                                
-                            # Get parent section class to log context
-                            section_class = "unknown-section"
-                            try:
-                                parent = bio_elem.find_element(By.XPATH, './ancestor::section[contains(@class, "encounters-story-section")]')
-                                section_class = parent.get_attribute('class') or ''
+
+                            # Parent section class for logging context
+                            section_class = info.get('section_class')
+                            if section_class is not None:
                                 print(f"{CYAN} Found potential bio text in {section_class}: {raw_text[:50]}...")
-                            except:
+                            else:
+                                section_class = "unknown-section"
                                 print(f"{CYAN} Found potential bio text (no section): {raw_text[:50]}...")
-                            
+
                             # PRIORITIZE specific bio class
-                            is_specific_bio_class = 'encounters-story-about__text' in (bio_elem.get_attribute('class') or '')
+                            is_specific_bio_class = 'encounters-story-about__text' in (info.get('own_class') or '')
                             
                             # Check if this is in the "About" section
                             is_about_section = 'encounters-story-section--about' in section_class
@@ -812,10 +1355,24 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
             print(f"{YELLOW} Error extracting bio: {e}")
             profile_data["bio"] = None
         
+        # Quick duplicate short-circuit: a cheap name/age/bio fingerprint lets us
+        # bail out before the badge/Q&A/pill sweeps when we're looping on a
+        # profile we already extracted
+        if seen_fingerprints is not None and (profile_data.get("name") or profile_data.get("bio")):
+            quick_fingerprint = (
+                f"quick:{profile_data.get('name')}|{profile_data.get('age')}|"
+                f"{(profile_data.get('bio') or '')[:64]}"
+            )
+            if quick_fingerprint in seen_fingerprints:
+                print(f"{YELLOW} Duplicate profile detected early (quick fingerprint) - skipping full extraction")
+                profile_data["_fingerprint"] = quick_fingerprint
+                profile_data["_duplicate"] = True
+                return profile_data
+            seen_fingerprints.add(quick_fingerprint)
+
         # Extract social handles from bio
         if profile_data.get("bio"):
             try:
-                import re
                 bio_lower = profile_data["bio"].lower()
                 
                 # Instagram
@@ -855,7 +1412,6 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
             search_text = album_text if album_text else profile_element.text
             
             # Look for job pattern: "Job Title at Company" or "Job Title"
-            import re
             job_patterns = [
                 r'([A-Z][^,\n]*(?:Designer|Engineer|Manager|Developer|Director|Specialist|Analyst|Coordinator|Consultant|Executive|Officer)[^,\n]*(?:at\s+[A-Z][^,\n]+)?)',
                 r'([A-Z][^,\n]*at\s+[A-Z][^,\n]+)',
@@ -878,7 +1434,6 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
         # Extract education - look for badges with "Undergraduate degree" or university names
         # Also check encounters-story-about badges
         try:
-            import re
             # Check badges/pills for education
             badge_selectors = [
                 '.encounters-story-about__badge',
@@ -900,10 +1455,10 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
             
             # Also search article text for university patterns
             article_text = profile_element.text
-            university_pattern = r'([A-Z][^,\n]*(?:University|College|School|Institute|State University|Tech)[^,\n]*)'
-            uni_matches = re.findall(university_pattern, article_text)
-            if uni_matches:
-                education_texts.extend(uni_matches)
+            if any(anchor in article_text for anchor in _EDU_ANCHORS):
+                uni_matches = _EDU_RE.findall(article_text)
+                if uni_matches:
+                    education_texts.extend(uni_matches)
             
             if education_texts:
                 # Get first unique education entry
@@ -948,29 +1503,38 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                     return False
                 return True
             
-            # First try to get images from the album (main profile images)
+            # One in-page sweep over the album plus all fallback selectors;
+            # Python only runs the photo filter over the returned strings
+            candidate_srcs = []
             try:
-                album_elem = browser.find_element(By.CSS_SELECTOR, 'article.encounters-album')
-                images = album_elem.find_elements(By.TAG_NAME, 'img')
-                for img in images:
-                    src = img.get_attribute('src') or img.get_attribute('data-src')
+                candidate_srcs = browser.execute_script(
+                    _IMAGE_SRC_JS, ['article.encounters-album img'] + image_selectors) or []
+            except Exception:
+                candidate_srcs = []
+            if candidate_srcs:
+                for src in candidate_srcs:
                     if src and src not in seen_urls and is_profile_photo(src):
                         image_urls.append(src)
                         seen_urls.add(src)
-            except:
-                pass
-            
-            # Fallback: try other selectors
-            for selector in image_selectors:
-                try:
-                    images = browser.find_elements(By.CSS_SELECTOR, selector)
-                    for img in images:
-                        src = img.get_attribute('src') or img.get_attribute('data-src')
-                        if src and src not in seen_urls and is_profile_photo(src):
-                            image_urls.append(src)
-                            seen_urls.add(src)
-                except:
-                    continue
+            else:
+                # Fallback: per-element extraction if the sweep failed
+                for selector in ['article.encounters-album img'] + image_selectors:
+                    try:
+                        images = browser.find_elements(By.CSS_SELECTOR, selector)
+                        for img in images:
+                            # Single round trip instead of two get_attribute calls
+                            try:
+                                src = browser.execute_script(
+                                    "var el = arguments[0];"
+                                    "return el.getAttribute('src') || el.getAttribute('data-src');",
+                                    img)
+                            except Exception:
+                                src = img.get_attribute('src') or img.get_attribute('data-src')
+                            if src and src not in seen_urls and is_profile_photo(src):
+                                image_urls.append(src)
+                                seen_urls.add(src)
+                    except:
+                        continue
             
             # Limit to first 3 profile photos
             image_urls = image_urls[:3]
@@ -982,59 +1546,46 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
             print(f"{YELLOW} Error extracting images: {e}")
             profile_data["image_urls"] = []
         
+        # Bulk DOM sweep: one wire call harvests badges, Q&A, from-location pills,
+        # Spotify artists and location widgets instead of per-element roundtrips
+        bulk_sections = None
+        try:
+            # Resolve as soon as badges render (typically ~100-300ms) rather than
+            # paying a fixed settle sleep per profile
+            _wait_for_badges(browser)
+            bulk_sections = browser.execute_script(_PROFILE_EXTRACT_JS)
+            if not isinstance(bulk_sections, dict):
+                bulk_sections = None
+        except Exception as e:
+            print(f"{YELLOW} Bulk section sweep failed, falling back to per-element extraction: {e}")
+
         # Extract location/distance - Bumble uses location-widget
         # HTML structure: .location-widget__town (city) and .location-widget__distance (distance)
         # Search entire page, not just profile_element
         try:
-            # Wait a bit for location section to load
-            time.sleep(1)
-            
             location_parts = []
+            seen_location_parts = set()
             
             # Extract city name
             try:
-                town_elems = browser.find_elements(By.CSS_SELECTOR, '.location-widget__town')
-                for town_elem in town_elems:
-                    # Try multiple methods to get text
-                    town_text = None
-                    try:
-                        town_text = town_elem.text.strip()
-                    except:
-                        pass
-                    
-                    if not town_text or len(town_text) < 1:
-                        try:
-                            town_text = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", town_elem)
-                            town_text = town_text.strip() if town_text else ''
-                        except:
-                            pass
-                    
-                    if town_text and town_text not in location_parts:
-                        location_parts.append(town_text)
+                if bulk_sections is not None:
+                    town_texts = bulk_sections.get('towns') or []
+                else:
+                    town_texts = _query_texts(browser, '.location-widget__town')
+                for town_text in town_texts:
+                    if _dedup_append(location_parts, seen_location_parts, town_text):
                         print(f"{CYAN} Found location town: {town_text}")
             except Exception as e:
                 print(f"{YELLOW} Error finding town: {e}")
             
             # Extract distance
             try:
-                distance_elems = browser.find_elements(By.CSS_SELECTOR, '.location-widget__distance')
-                for distance_elem in distance_elems:
-                    # Try multiple methods to get text
-                    distance_text = None
-                    try:
-                        distance_text = distance_elem.text.strip()
-                    except:
-                        pass
-                    
-                    if not distance_text or len(distance_text) < 1:
-                        try:
-                            distance_text = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", distance_elem)
-                            distance_text = distance_text.strip() if distance_text else ''
-                        except:
-                            pass
-                    
-                    if distance_text and distance_text not in location_parts:
-                        location_parts.append(distance_text)
+                if bulk_sections is not None:
+                    distance_texts = bulk_sections.get('distances') or []
+                else:
+                    distance_texts = _query_texts(browser, '.location-widget__distance')
+                for distance_text in distance_texts:
+                    if _dedup_append(location_parts, seen_location_parts, distance_text):
                         print(f"{CYAN} Found location distance: {distance_text}")
             except Exception as e:
                 print(f"{YELLOW} Error finding distance: {e}")
@@ -1048,20 +1599,8 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                 ]
                 
                 for selector in location_selectors:
-                    try:
-                        loc_elems = browser.find_elements(By.CSS_SELECTOR, selector)
-                        for loc_elem in loc_elems:
-                            try:
-                                loc_text = loc_elem.text.strip()
-                                if not loc_text:
-                                    loc_text = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", loc_elem)
-                                    loc_text = loc_text.strip() if loc_text else ''
-                                if loc_text and loc_text not in location_parts:
-                                    location_parts.append(loc_text)
-                            except:
-                                continue
-                    except:
-                        continue
+                    for loc_text in _query_texts(browser, selector):
+                        _dedup_append(location_parts, seen_location_parts, loc_text)
             
             if location_parts:
                 profile_data["location"] = ' | '.join(location_parts)
@@ -1071,7 +1610,6 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                 print(f"{CYAN} No location found")
         except Exception as e:
             print(f"{YELLOW} Error extracting location: {e}")
-            import traceback
             traceback.print_exc()
             profile_data["location"] = None
         
@@ -1084,7 +1622,6 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                 '[class*="badge"][class*="intentions"]',  # Intentions badge
             ]
             
-            preference_keywords = ['relationship', 'something casual', 'don\'t know yet', 'friendship', 'network']
             preferences = []
             
             for selector in badge_selectors:
@@ -1092,7 +1629,7 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                     badges = profile_element.find_elements(By.CSS_SELECTOR, selector)
                     for badge in badges:
                         badge_text = badge.text.strip()
-                        if any(keyword in badge_text.lower() for keyword in preference_keywords):
+                        if _PREF_RE.search(badge_text):
                             preferences.append(badge_text)
                 except:
                     continue
@@ -1107,34 +1644,31 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
         # Extract job/profession from bio text (usually first line after name/age)
         if not profile_data.get("job") and profile_data.get("bio"):
             try:
-                bio_lines = profile_data["bio"].split('\n')
-                if bio_lines:
-                    # First non-empty line might be job
-                    first_line = bio_lines[0].strip()
-                    # Check if it looks like a job (contains "at", "Designer", "Engineer", etc.)
-                    job_keywords = ['at ', 'designer', 'engineer', 'manager', 'developer', 'director', 'specialist', 'analyst']
-                    if any(keyword in first_line.lower() for keyword in job_keywords):
-                        profile_data["job"] = first_line
-                        print(f"{CYAN} Extracted job: {profile_data['job']}")
+                # First non-empty line might be job
+                first_line = profile_data["bio"].split('\n', 1)[0].strip()
+                # Check if it looks like a job (contains "at", "Designer", "Engineer", etc.)
+                if first_line and _JOB_KEYWORD_RE.search(first_line):
+                    profile_data["job"] = first_line
+                    print(f"{CYAN} Extracted job: {profile_data['job']}")
             except Exception:
                 pass
-        
+
         # Extract education (usually contains "University", "College", "School")
         if not profile_data.get("education") and profile_data.get("bio"):
             try:
-                import re
-                education_pattern = r'([A-Z][^,\n]*(?:University|College|School|Institute)[^,\n]*)'
-                matches = re.findall(education_pattern, profile_data["bio"])
-                if matches:
-                    profile_data["education"] = matches[0].strip()
-                    print(f"{CYAN} Extracted education: {profile_data['education']}")
+                bio = profile_data["bio"]
+                # Cheap substring check before running the regex
+                if any(anchor in bio for anchor in _EDU_ANCHORS):
+                    matches = _EDU_RE.findall(bio)
+                    if matches:
+                        profile_data["education"] = matches[0].strip()
+                        print(f"{CYAN} Extracted education: {profile_data['education']}")
             except Exception:
                 pass
         
         # If we still don't have a name, try extracting from entire article text
         if not profile_data.get("name"):
             try:
-                import re
                 article_text = profile_element.text
                 # Try simple pattern: first word before comma
                 name_pattern = r'^([^,\n]+),'
@@ -1149,74 +1683,36 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
         # Search entire page, not just profile_element
         # Badges are in .encounters-story-about__badge within the About section
         try:
-            # Wait a bit for badges to load
-            time.sleep(1)
-            
-            badge_selectors = [
-                '.encounters-story-about__badge .pill__title',  # Primary: badge titles in About section
-                '.encounters-story-section--about .pill__title',  # Alternative
-                '.encounters-story-about__badge',  # Fallback
-                '.pill[data-qa-role="pill"] .pill__title',
-            ]
-            
+            if bulk_sections is not None:
+                badge_texts = bulk_sections.get('badges') or []
+            else:
+                badge_selectors = [
+                    '.encounters-story-about__badge .pill__title',  # Primary: badge titles in About section
+                    '.encounters-story-section--about .pill__title',  # Alternative
+                    '.encounters-story-about__badge',  # Fallback
+                    '.pill[data-qa-role="pill"] .pill__title',
+                ]
+                badge_texts = []
+                for selector in _by_hit_count(badge_selectors):
+                    selector_texts = _query_texts(browser, selector)
+                    print(f"{CYAN} Found {len(selector_texts)} badge elements with selector: {selector}")
+                    if selector_texts:
+                        _SELECTOR_STATS[selector] += 1
+                    badge_texts.extend(selector_texts)
+
             all_badges = []
             seen_badges = set()
-            for selector in badge_selectors:
-                try:
-                    badges = browser.find_elements(By.CSS_SELECTOR, selector)
-                    print(f"{CYAN} Found {len(badges)} badge elements with selector: {selector}")
-                    for badge in badges:
-                        try:
-                            # Try multiple methods to get badge text
-                            badge_text = None
-                            
-                            # Method 1: Direct text property
-                            try:
-                                badge_text = badge.text.strip()
-                            except:
-                                pass
-                            
-                            # Method 2: JavaScript textContent (more reliable)
-                            if not badge_text or len(badge_text) < 1:
-                                try:
-                                    badge_text = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", badge)
-                                    if badge_text:
-                                        # Handle encoding issues with emojis
-                                        badge_text = badge_text.encode('utf-8', errors='ignore').decode('utf-8', errors='ignore').strip()
-                                except:
-                                    pass
-                            
-                            # Method 3: Try nested div with p-3 class
-                            if not badge_text or len(badge_text) < 1:
-                                try:
-                                    nested_div = badge.find_element(By.CSS_SELECTOR, 'div.p-3, div[class*="p-3"], div')
-                                    badge_text = nested_div.text.strip() if nested_div else ''
-                                    if not badge_text:
-                                        badge_text = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", nested_div)
-                                        badge_text = badge_text.strip() if badge_text else ''
-                                except:
-                                    pass
-                            
-                            # Skip if it's an image URL or empty
-                            if not badge_text or badge_text.startswith('http') or len(badge_text) < 1:
-                                continue
-                            
-                            # Skip if it's just whitespace or very short
-                            if len(badge_text) < 2:
-                                continue
-                            
-                            # Normalize and deduplicate
-                            badge_lower = badge_text.lower()
-                            if badge_lower not in seen_badges:
-                                seen_badges.add(badge_lower)
-                                all_badges.append(badge_text)
-                                safe_print(f"{CYAN}   Added badge: {badge_text}")
-                        except Exception as e:
-                            safe_print(f"{YELLOW}   Error processing badge: {e}")
-                            continue
-                except Exception as e:
-                    print(f"{YELLOW} Error with selector {selector}: {e}")
+            for badge_text in badge_texts:
+                # Skip if it's an image URL, empty, or just whitespace
+                if not badge_text or badge_text.startswith('http') or len(badge_text) < 2:
                     continue
+
+                # Normalize and deduplicate
+                badge_lower = badge_text.lower()
+                if badge_lower not in seen_badges:
+                    seen_badges.add(badge_lower)
+                    all_badges.append(badge_text)
+                    safe_print(f"{CYAN}   Added badge: {badge_text}")
             
             if all_badges:
                 profile_data["badges"] = all_badges
@@ -1226,59 +1722,49 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                 print(f"{YELLOW} No badges found")
         except Exception as e:
             print(f"{YELLOW} Error extracting badges: {e}")
-            import traceback
             traceback.print_exc()
             profile_data["badges"] = []
         
         # Extract question answers (e.g., "Two truths and a lie", "My simple pleasures are")
         # Search entire page, not just profile_element
         try:
-            # Wait a bit for question sections to load
-            time.sleep(1)
-            
-            question_sections = browser.find_elements(By.CSS_SELECTOR, '.encounters-story-section--question')
-            print(f"{CYAN} Found {len(question_sections)} question section(s)")
             questions_answers = {}
+            if bulk_sections is not None:
+                questions_answers = {
+                    title: answer
+                    for title, answer in (bulk_sections.get('questions') or {}).items()
+                    if title and answer
+                }
+                for question_title in questions_answers:
+                    print(f"{CYAN}   Extracted Q&A: {question_title[:40]}...")
+                question_sections = []
+            else:
+                question_sections = browser.find_elements(By.CSS_SELECTOR, '.encounters-story-section--question')
+                print(f"{CYAN} Found {len(question_sections)} question section(s)")
             
             for i, section in enumerate(question_sections):
                 try:
-                    # Get question title - try multiple methods
+                    # Get question title (primary selector, then alternative)
                     question_title = None
-                    try:
-                        question_title_elem = section.find_element(By.CSS_SELECTOR, '.encounters-story-section__heading-title h2')
-                        question_title = question_title_elem.text.strip() if question_title_elem else None
-                        if not question_title:
-                            question_title = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", question_title_elem)
-                            question_title = question_title.strip() if question_title else None
-                    except:
-                        # Try alternative selector
+                    for title_selector in ('.encounters-story-section__heading-title h2',
+                                           '.encounters-story-section__heading-title'):
                         try:
-                            question_title_elem = section.find_element(By.CSS_SELECTOR, '.encounters-story-section__heading-title')
-                            question_title = question_title_elem.text.strip() if question_title_elem else None
-                            if not question_title:
-                                question_title = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", question_title_elem)
-                                question_title = question_title.strip() if question_title else None
+                            question_title = _safe_text(browser, section.find_element(By.CSS_SELECTOR, title_selector))
                         except:
-                            pass
+                            question_title = None
+                        if question_title:
+                            break
                     
-                    # Get answer text - try multiple methods
+                    # Get answer text (primary selector, then alternative)
                     answer_text = None
-                    try:
-                        answer_elem = section.find_element(By.CSS_SELECTOR, '.encounters-story-about__text')
-                        answer_text = answer_elem.text.strip() if answer_elem else None
-                        if not answer_text:
-                            answer_text = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", answer_elem)
-                            answer_text = answer_text.strip() if answer_text else None
-                    except:
-                        # Try alternative selector
+                    for answer_selector in ('.encounters-story-about__text',
+                                            '.encounters-story-section__content p, .encounters-story-section__content'):
                         try:
-                            answer_elem = section.find_element(By.CSS_SELECTOR, '.encounters-story-section__content p, .encounters-story-section__content')
-                            answer_text = answer_elem.text.strip() if answer_elem else None
-                            if not answer_text:
-                                answer_text = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", answer_elem)
-                                answer_text = answer_text.strip() if answer_text else None
+                            answer_text = _safe_text(browser, section.find_element(By.CSS_SELECTOR, answer_selector))
                         except:
-                            pass
+                            answer_text = None
+                        if answer_text:
+                            break
                     
                     if question_title and answer_text:
                         questions_answers[question_title] = answer_text
@@ -1295,24 +1781,26 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                 print(f"{CYAN} No question answers found")
         except Exception as e:
             print(f"{YELLOW} Error extracting question answers: {e}")
-            import traceback
             traceback.print_exc()
             profile_data["question_answers"] = {}
         
         # Extract Spotify artists - search entire page
         try:
             spotify_artists = []
-            spotify_widget = browser.find_elements(By.CSS_SELECTOR, '.spotify-widget__artist')
-            
-            for artist in spotify_widget:
-                try:
-                    # Don't require is_displayed() - elements might be in DOM but not visible
-                    artist_name_elem = artist.find_element(By.CSS_SELECTOR, '.spotify-widget__artist-name')
-                    artist_name = artist_name_elem.text.strip() if artist_name_elem else None
-                    if artist_name and artist_name not in spotify_artists:
-                        spotify_artists.append(artist_name)
-                except:
-                    continue
+            seen_artists = set()
+            if bulk_sections is not None:
+                artist_names = bulk_sections.get('spotify') or []
+            else:
+                # Don't require is_displayed() - elements might be in DOM but not visible
+                artist_names = []
+                for artist in browser.find_elements(By.CSS_SELECTOR, '.spotify-widget__artist'):
+                    try:
+                        artist_name_elem = artist.find_element(By.CSS_SELECTOR, '.spotify-widget__artist-name')
+                        artist_names.append(artist_name_elem.text.strip() if artist_name_elem else None)
+                    except:
+                        continue
+            for artist_name in artist_names:
+                _dedup_append(spotify_artists, seen_artists, artist_name)
             
             if spotify_artists:
                 profile_data["spotify_artists"] = spotify_artists
@@ -1333,66 +1821,34 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
             ]
             
             from_locations = []
-            for selector in from_location_selectors:
-                try:
-                    pills = browser.find_elements(By.CSS_SELECTOR, selector)
-                    print(f"{CYAN} Found {len(pills)} pill(s) with selector: {selector}")
-                    for pill in pills:
-                        try:
-                            # Try multiple methods to get text
-                            pill_text = None
-                            
-                            # Method 1: Direct text property
-                            try:
-                                pill_text = pill.text.strip()
-                            except:
-                                pass
-                            
-                            # Method 2: JavaScript textContent
-                            if not pill_text or len(pill_text) < 1:
-                                try:
-                                    pill_text = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", pill)
-                                    if pill_text:
-                                        # Handle encoding issues with emojis
-                                        pill_text = pill_text.encode('utf-8', errors='ignore').decode('utf-8', errors='ignore').strip()
-                                except:
-                                    pass
-                            
-                            # Method 3: Try nested div
-                            if not pill_text or len(pill_text) < 1:
-                                try:
-                                    nested_div = pill.find_element(By.CSS_SELECTOR, 'div.p-3, div[class*="p-3"], div')
-                                    pill_text = nested_div.text.strip() if nested_div else ''
-                                    if not pill_text:
-                                        pill_text = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", nested_div)
-                                        if pill_text:
-                                            # Handle encoding issues with emojis
-                                            pill_text = pill_text.encode('utf-8', errors='ignore').decode('utf-8', errors='ignore').strip()
-                                except:
-                                    pass
-                            
-                            # Check for location indicators (flags, "Lives in", "From")
-                            if pill_text and any(indicator in pill_text.lower() for indicator in ['lives in', 'from', '🇺🇸', '🇬🇧', '🇨🇦', '🇲🇽', '🇦🇺']):
-                                from_locations.append(pill_text)
-                                safe_print(f"{CYAN} Found from location: {pill_text}")
-                        except Exception as e:
-                            safe_print(f"{YELLOW} Error processing pill: {e}")
-                            continue
-                    if from_locations:
-                        break
-                except Exception as e:
-                    print(f"{YELLOW} Error with selector {selector}: {e}")
-                    continue
-            
-            # Also check badges for location info (sometimes it's there)
-            # This is more reliable since badges are already extracted with proper encoding
-            # Check badges even if direct extraction found something, to ensure we get the best match
-            if profile_data.get("badges"):
+            seen_from_locations = set()
+            if bulk_sections is not None:
+                pill_texts = bulk_sections.get('pills') or []
+            else:
+                pill_texts = []
+                for selector in _by_hit_count(from_location_selectors):
+                    pill_texts = _query_texts(browser, selector)
+                    print(f"{CYAN} Found {len(pill_texts)} pill(s) with selector: {selector}")
+                    if pill_texts:
+                        _SELECTOR_STATS[selector] += 1
+                        break  # Skip remaining selectors once we have pills
+
+            for pill_text in pill_texts:
+                # Check for location indicators (flags, "Lives in", "From")
+                # Keep every matching pill: "Lives in" and "From" can both
+                # appear, and the preference logic below picks between them
+                if pill_text and _FROM_LOC_RE.search(pill_text):
+                    if _dedup_append(from_locations, seen_from_locations, pill_text):
+                        safe_print(f"{CYAN} Found from location: {pill_text}")
+
+            # Fall back to badges for location info (sometimes it's there)
+            # Badges are already extracted with proper encoding, so no extra wire calls
+            if not from_locations and profile_data.get("badges"):
                 for badge in profile_data["badges"]:
                     badge_lower = badge.lower()
                     # Look for "from" location (not "lives in")
                     if 'from' in badge_lower and 'lives in' not in badge_lower:
-                        from_locations.append(badge)
+                        _dedup_append(from_locations, seen_from_locations, badge)
                         safe_print(f"{CYAN} Found from location in badges: {badge}")
                         break  # Take first "From" location found
             
@@ -1412,7 +1868,6 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
                 print(f"{CYAN} No from location found")
         except Exception as e:
             print(f"{YELLOW} Error extracting from location: {e}")
-            import traceback
             traceback.print_exc()
             profile_data["from_location"] = None
         
@@ -1435,7 +1890,6 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
         # Final attempt: Try to extract name from the entire article text using regex
         if not profile_data.get("name"):
             try:
-                import re
                 # Get full article text
                 try:
                     article_text = browser.execute_script("return arguments[0].textContent;", profile_element)
@@ -1476,13 +1930,15 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
             profile_data["name"] = f"Unknown_{age}_{city}".replace(' ', '_')[:50]
             profile_data["_name_placeholder"] = True  # Flag to indicate this is a placeholder
             print(f"{YELLOW} Warning: Could not extract name - using placeholder: {profile_data['name']}")
-            print(f"{YELLOW} Debug: Extracted fields: {[k for k in profile_data.keys() if k not in ['extracted_at', '_fingerprint', '_name_placeholder']]}")
-        
-        # Remove fingerprint from profile_data before returning (it's internal)
-        profile_data.pop("_fingerprint", None)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("%s Debug: Extracted fields: %s", YELLOW,
+                          [k for k in profile_data.keys() if k not in ['extracted_at', '_fingerprint', '_name_placeholder']])
         
+        # Keep _fingerprint on the dict so the scrape loop can reuse it for
+        # loop detection instead of recomputing; it is stripped before saving.
+
         # Print extracted data summary
-        print(f"{GREEN} Profile extracted: {profile_data.get('name', 'Unknown')} ({profile_data.get('age', '?')})")
+        safe_print(f"{GREEN} Profile extracted: {profile_data.get('name', 'Unknown')} ({profile_data.get('age', '?')})")
         
         return profile_data
         
@@ -1494,12 +1950,40 @@ def extract_profile_data(browser: webdriver.Chrome, gender: str = None) -> Optio
         return None
 
 
+# Like/pass buttons persist across consecutive encounter frames, so the swipe
+# helpers reuse the last WebElement for a short window instead of re-walking
+# the DOM every iteration. Stale references fall back to a fresh lookup.
+_SWIPE_BTN_CACHE: Dict[str, tuple] = {}  # action -> (element, monotonic ts)
+_SWIPE_BTN_TTL = 2.0
+
+
+def _click_cached_swipe_btn(action: str) -> bool:
+    """Click the cached button for `action` if fresh; False on miss/stale."""
+    cached = _SWIPE_BTN_CACHE.get(action)
+    if not cached or time.monotonic() - cached[1] >= _SWIPE_BTN_TTL:
+        return False
+    try:
+        cached[0].click()
+        _SWIPE_BTN_CACHE[action] = (cached[0], time.monotonic())
+        return True
+    except StaleElementReferenceException:
+        _SWIPE_BTN_CACHE.pop(action, None)
+        return False
+    except Exception:
+        # Detached, intercepted, or browser restarted - drop it and re-locate
+        _SWIPE_BTN_CACHE.pop(action, None)
+        return False
+
+
 def swipe_right(browser: webdriver.Chrome) -> bool:
     """
     Swipe right (like) on the current profile.
     Returns True if swipe was successful, False otherwise.
     """
     try:
+        if _click_cached_swipe_btn('like'):
+            safe_print(f"{GREEN} Swiped right (reused like button)")
+            return True
         dismiss_consent_iframe(browser)
         # Selector for the like button - found in actual HTML:
         # <div class="encounters-action tooltip-activator encounters-action--like" 
@@ -1523,7 +2007,8 @@ def swipe_right(browser: webdriver.Chrome) -> bool:
         try:
             like_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, like_button_selector)))
             like_button.click()
-            print(f"{GREEN} Swiped right (like button clicked)")
+            _SWIPE_BTN_CACHE['like'] = (like_button, time.monotonic())
+            safe_print(f"{GREEN} Swiped right (like button clicked)")
             return True
         except ElementClickInterceptedException:
             if dismiss_consent_iframe(browser):
@@ -1535,7 +2020,7 @@ def swipe_right(browser: webdriver.Chrome) -> bool:
             pass
         
         # Try alternative selectors
-        for selector in alternative_selectors:
+        for selector in _by_hit_count(alternative_selectors):
             try:
                 like_button = browser.find_element(By.CSS_SELECTOR, selector)
                 if like_button.is_displayed() and like_button.is_enabled():
@@ -1546,6 +2031,7 @@ def swipe_right(browser: webdriver.Chrome) -> bool:
                             like_button.click()
                         else:
                             raise
+                    _SELECTOR_STATS[selector] += 1
                     print(f"{GREEN} Swiped right (alternative selector: {selector})")
                     return True
             except (NoSuchElementException, ElementNotInteractableException, ElementClickInterceptedException):
@@ -1593,6 +2079,9 @@ def swipe_left(browser: webdriver.Chrome) -> bool:
     Returns True if swipe was successful, False otherwise.
     """
     try:
+        if _click_cached_swipe_btn('dislike'):
+            safe_print(f"{RED} Swiped left (reused dislike button)")
+            return True
         dismiss_consent_iframe(browser)
         # Selector for the dislike/pass button
         dislike_button_selector = '.encounters-action.encounters-action--dislike[data-qa-role="encounters-action-dislike"]'
@@ -1617,7 +2106,8 @@ def swipe_left(browser: webdriver.Chrome) -> bool:
         try:
             dislike_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, dislike_button_selector)))
             dislike_button.click()
-            print(f"{RED} Swiped left (dislike button clicked)")
+            _SWIPE_BTN_CACHE['dislike'] = (dislike_button, time.monotonic())
+            safe_print(f"{RED} Swiped left (dislike button clicked)")
             return True
         except ElementClickInterceptedException:
             if dismiss_consent_iframe(browser):
@@ -1629,7 +2119,7 @@ def swipe_left(browser: webdriver.Chrome) -> bool:
             pass
         
         # Try alternative selectors
-        for selector in alternative_selectors:
+        for selector in _by_hit_count(alternative_selectors):
             try:
                 dislike_button = browser.find_element(By.CSS_SELECTOR, selector)
                 if dislike_button.is_displayed() and dislike_button.is_enabled():
@@ -1640,6 +2130,7 @@ def swipe_left(browser: webdriver.Chrome) -> bool:
                             dislike_button.click()
                         else:
                             raise
+                    _SELECTOR_STATS[selector] += 1
                     print(f"{RED} Swiped left (alternative selector: {selector})")
                     return True
             except (NoSuchElementException, ElementNotInteractableException, ElementClickInterceptedException):
@@ -1682,67 +2173,103 @@ def swipe_left(browser: webdriver.Chrome) -> bool:
         return False
 
 
+# One wire call probes every continue-button selector (plus a text-match
+# fallback) and clicks the first visible, enabled hit
+_MATCH_POPUP_JS = """
+    // Cheap guard: no match popup on screen (the common case) exits before
+    // the selector cascade runs
+    if (!document.querySelector('.encounters-match__cta, [data-testid="match-popup"], [data-testid="continue-button"]')) {
+        return null;
+    }
+    const selectors = arguments[0];
+    for (const s of selectors) {
+        let el = null;
+        try {
+            el = document.querySelector(s);
+        } catch (e) {
+            continue;
+        }
+        if (el && el.offsetParent !== null && !el.disabled) {
+            el.click();
+            return s;
+        }
+    }
+    const continueBtn = Array.from(document.querySelectorAll('button'))
+        .find(b => /continue/i.test(b.textContent) && b.offsetParent !== null && !b.disabled);
+    if (continueBtn) {
+        continueBtn.click();
+        return 'text:continue';
+    }
+    return null;
+"""
+
+_MATCH_POPUP_SELECTORS = [
+    # Primary selector for continue button (from original bumbleAutoLiker.js)
+    "#main > div > div.page__layout > main > div.page__content-inner > article > div > footer > div.encounters-match__cta > div:nth-child(2) > button",
+    'button[data-testid="continue-button"]',
+    '.encounters-match__cta button',
+    'button.continue-button',
+]
+
+
 def handle_match_popup(browser: webdriver.Chrome) -> bool:
     """
     Handle match popup or continue button after a match.
     Returns True if handled, False otherwise.
     """
     try:
-        # Selector for continue button (from original bumbleAutoLiker.js)
-        continue_button_selector = "#main > div > div.page__layout > main > div.page__content-inner > article > div > footer > div.encounters-match__cta > div:nth-child(2) > button"
-        
-        alternative_selectors = [
-            'button[data-testid="continue-button"]',
-            'button:contains("Continue")',
-            '.encounters-match__cta button',
-            'button.continue-button',
-        ]
-        
-        # Try primary selector
-        try:
-            continue_button = browser.find_element(By.CSS_SELECTOR, continue_button_selector)
-            if continue_button.is_displayed() and continue_button.is_enabled():
-                continue_button.click()
-                print(f"{CYAN} Clicked continue button (match popup)")
-                time.sleep(1)
-                return True
-        except NoSuchElementException:
-            pass
-        
-        # Try alternative selectors
-        for selector in alternative_selectors:
+        clicked = browser.execute_script(_MATCH_POPUP_JS, _MATCH_POPUP_SELECTORS)
+        if clicked:
+            print(f"{CYAN} Clicked continue button (match popup: {clicked})")
+            # Wait for the popup to actually go away instead of a fixed 1s
             try:
-                if ':contains(' in selector:
-                    # Use JavaScript for :contains pseudo-selector
-                    browser.execute_script(f"""
-                        const buttons = Array.from(document.querySelectorAll('button'));
-                        const continueBtn = buttons.find(btn => btn.textContent.includes('Continue') || btn.textContent.includes('continue'));
-                        if (continueBtn) {{
-                            continueBtn.click();
-                            return true;
-                        }}
-                        return false;
-                    """)
-                    print(f"{CYAN} Clicked continue button (JavaScript)")
-                    time.sleep(1)
-                    return True
-                else:
-                    continue_button = browser.find_element(By.CSS_SELECTOR, selector)
-                    if continue_button.is_displayed() and continue_button.is_enabled():
-                        continue_button.click()
-                        print(f"{CYAN} Clicked continue button (alternative selector)")
-                        time.sleep(1)
-                        return True
-            except (NoSuchElementException, ElementNotInteractableException):
-                continue
-        
+                WebDriverWait(browser, 2).until(
+                    EC.invisibility_of_element_located((By.CSS_SELECTOR, '.encounters-match__cta'))
+                )
+            except TimeoutException:
+                pass
+            return True
         return False
-        
-    except Exception as e:
+    except Exception:
         # Match popup is optional, don't fail if it doesn't exist
         return False
 
 
+# Coordinates/timezones for major cities, hoisted so each geolocation call is a
+# pure dict lookup instead of rebuilding the tables
+_CITY_COORDS = {
+    'seattle': (47.6062, -122.3321),
+    'seattle, wa': (47.6062, -122.3321),
+    'seattle, washington': (47.6062, -122.3321),
+    'new york': (40.7128, -74.0060),
+    'new york, ny': (40.7128, -74.0060),
+    'los angeles': (34.0522, -118.2437),
+    'los angeles, ca': (34.0522, -118.2437),
+    'chicago': (41.8781, -87.6298),
+    'chicago, il': (41.8781, -87.6298),
+    'san francisco': (37.7749, -122.4194),
+    'san francisco, ca': (37.7749, -122.4194),
+    'denver': (39.7392, -104.9903),
+    'denver, co': (39.7392, -104.9903),
+    'austin': (30.2672, -97.7431),
+    'austin, tx': (30.2672, -97.7431),
+    'miami': (25.7617, -80.1918),
+    'miami, fl': (25.7617, -80.1918),
+}
+_DEFAULT_COORDS = _CITY_COORDS['seattle']
+
+_CITY_TZ = {
+    'seattle': 'America/Los_Angeles',
+    'denver': 'America/Denver',
+    'new york': 'America/New_York',
+    'los angeles': 'America/Los_Angeles',
+    'chicago': 'America/Chicago',
+    'san francisco': 'America/Los_Angeles',
+    'austin': 'America/Chicago',
+    'miami': 'America/New_York',
+}
+
+
 def set_location_geolocation(browser: webdriver.Chrome, location: str) -> bool:
     """
     Set location using browser geolocation API (alternative method).
@@ -1757,86 +2284,57 @@ def set_location_geolocation(browser: webdriver.Chrome, location: str) -> bool:
     """
     try:
         print(f"{CYAN} Attempting to set location via geolocation API: {location}")
-        
-        # Common coordinates for major cities (fallback if geocoding fails)
-        city_coordinates = {
-            'seattle': {'latitude': 47.6062, 'longitude': -122.3321},
-            'seattle, wa': {'latitude': 47.6062, 'longitude': -122.3321},
-            'seattle, washington': {'latitude': 47.6062, 'longitude': -122.3321},
-            'new york': {'latitude': 40.7128, 'longitude': -74.0060},
-            'new york, ny': {'latitude': 40.7128, 'longitude': -74.0060},
-            'los angeles': {'latitude': 34.0522, 'longitude': -118.2437},
-            'los angeles, ca': {'latitude': 34.0522, 'longitude': -118.2437},
-            'chicago': {'latitude': 41.8781, 'longitude': -87.6298},
-            'chicago, il': {'latitude': 41.8781, 'longitude': -87.6298},
-            'san francisco': {'latitude': 37.7749, 'longitude': -122.4194},
-            'san francisco, ca': {'latitude': 37.7749, 'longitude': -122.4194},
-            'denver': {'latitude': 39.7392, 'longitude': -104.9903},
-            'denver, co': {'latitude': 39.7392, 'longitude': -104.9903},
-            'austin': {'latitude': 30.2672, 'longitude': -97.7431},
-            'austin, tx': {'latitude': 30.2672, 'longitude': -97.7431},
-            'miami': {'latitude': 25.7617, 'longitude': -80.1918},
-            'miami, fl': {'latitude': 25.7617, 'longitude': -80.1918},
-        }
-        
+
         location_lower = location.lower().strip()
-        coords = city_coordinates.get(location_lower)
-        
+        city_key = location_lower.split(',', 1)[0].strip()
+        coords = _CITY_COORDS.get(location_lower) or _CITY_COORDS.get(city_key)
+
         if not coords:
-            # Try to extract city name (remove state/country)
-            city_name = location.split(',')[0].strip().lower()
-            coords = city_coordinates.get(city_name)
-            
-            if not coords:
-                print(f"{YELLOW} Location '{location}' not in predefined list.")
-                print(f"{YELLOW} Supported cities: Seattle, New York, Los Angeles, Chicago, San Francisco, Denver, Austin, Miami")
-                print(f"{YELLOW} Using Seattle coordinates as fallback. For other cities, add coordinates to city_coordinates dict.")
-                coords = {'latitude': 47.6062, 'longitude': -122.3321}
-        
+            print(f"{YELLOW} Location '{location}' not in predefined list.")
+            print(f"{YELLOW} Supported cities: Seattle, New York, Los Angeles, Chicago, San Francisco, Denver, Austin, Miami")
+            print(f"{YELLOW} Using Seattle coordinates as fallback. For other cities, add coordinates to _CITY_COORDS dict.")
+            coords = _DEFAULT_COORDS
+
+        latitude, longitude = coords
+
         # Set geolocation using Chrome DevTools Protocol
-        print(f"{CYAN} Setting geolocation to: {coords['latitude']}, {coords['longitude']}")
+        print(f"{CYAN} Setting geolocation to: {latitude}, {longitude}")
         
-        # Grant geolocation permission first
-        try:
-            browser.execute_cdp_cmd('Browser.grantPermissions', {
-                'origin': 'https://bumble.com',
-                'permissions': ['geolocation']
-            })
-            browser.execute_cdp_cmd('Browser.grantPermissions', {
-                'origin': 'https://www.bumble.com',
-                'permissions': ['geolocation']
-            })
-        except:
-            pass  # Permissions may already be granted
+        # Grant geolocation permission first (once per browser instance;
+        # each grant is a CDP round trip, so skip when already done).
+        # The app always runs on www.bumble.com, so a single grant for that
+        # origin suffices - bumble.com is a separate origin we never script.
+        if not getattr(browser, '_geolocation_granted', False):
+            try:
+                browser.execute_cdp_cmd('Browser.grantPermissions', {
+                    'origin': 'https://www.bumble.com',
+                    'permissions': ['geolocation']
+                })
+                browser._geolocation_granted = True
+            except:
+                pass  # Permissions may already be granted
         
         # Set geolocation override
         browser.execute_cdp_cmd('Emulation.setGeolocationOverride', {
-            'latitude': coords['latitude'],
-            'longitude': coords['longitude'],
+            'latitude': latitude,
+            'longitude': longitude,
             'accuracy': 100
         })
         
-        # Also set timezone to match location (helps with location detection)
+        # Also set timezone to match location (helps with location detection);
+        # skip the CDP call when the override for this timezone is already active
         try:
-            # Get timezone for location
-            timezone_map = {
-                'seattle': 'America/Los_Angeles',
-                'denver': 'America/Denver',
-                'new york': 'America/New_York',
-                'los angeles': 'America/Los_Angeles',
-                'chicago': 'America/Chicago',
-                'san francisco': 'America/Los_Angeles',
-                'austin': 'America/Chicago',
-                'miami': 'America/New_York',
-            }
-            location_lower = location.lower().strip()
-            city_name = location_lower.split(',')[0].strip()
-            timezone = timezone_map.get(city_name, 'America/Los_Angeles')
-            
-            browser.execute_cdp_cmd('Emulation.setTimezoneOverride', {
-                'timezoneId': timezone
-            })
-            print(f"{CYAN} Also set timezone to: {timezone}")
+            timezone = _CITY_TZ.get(city_key, 'America/Los_Angeles')
+            if getattr(browser, '_timezone_override', None) != timezone:
+                browser.execute_cdp_cmd('Emulation.setTimezoneOverride', {
+                    'timezoneId': timezone
+                })
+                browser._timezone_override = timezone
+                print(f"{CYAN} Also set timezone to: {timezone}")
+            # Matching locale helps the geolocation story hold together
+            if not getattr(browser, '_locale_override_set', False):
+                browser.execute_cdp_cmd('Emulation.setLocaleOverride', {'locale': 'en-US'})
+                browser._locale_override_set = True
         except Exception as e:
             print(f"{YELLOW} Could not set timezone: {e}")
         
@@ -1867,7 +2365,7 @@ def set_location(browser: webdriver.Chrome, location: str) -> bool:
         if set_location_geolocation(browser, location):
             print(f"{CYAN} Location set via geolocation API, refreshing page...")
             browser.refresh()
-            time.sleep(3)
+            _wait_loaded(browser, 5)
             return True
         
         # Navigate to settings page
@@ -1889,16 +2387,30 @@ def set_location(browser: webdriver.Chrome, location: str) -> bool:
         ]
         
         settings_accessed = False
-        for url in settings_urls:
+        # Probe all candidates with in-page HEAD requests first so we only
+        # pay for one real navigation instead of up to five
+        good_url = _probe_settings_url(browser, settings_urls)
+        if good_url:
             try:
-                browser.get(url)
-                time.sleep(3)
+                browser.get(good_url)
+                _wait_loaded(browser, 2)
                 if 'settings' in browser.current_url.lower() or 'preferences' in browser.current_url.lower():
                     print(f"{GREEN} Accessed settings page: {browser.current_url}")
                     settings_accessed = True
-                    break
             except:
-                continue
+                pass
+        if not settings_accessed and not good_url:
+            # Probe unavailable (e.g. cross-origin page): fall back to navigating
+            for url in settings_urls:
+                try:
+                    browser.get(url)
+                    _wait_loaded(browser, 2)
+                    if 'settings' in browser.current_url.lower() or 'preferences' in browser.current_url.lower():
+                        print(f"{GREEN} Accessed settings page: {browser.current_url}")
+                        settings_accessed = True
+                        break
+                except:
+                    continue
         
         if not settings_accessed:
             # Try to find settings button on main page
@@ -1915,17 +2427,10 @@ def set_location(browser: webdriver.Chrome, location: str) -> bool:
                     '.settings-button',
                 ]
                 
-                for selector in settings_selectors:
-                    try:
-                        settings_btn = browser.find_element(By.CSS_SELECTOR, selector)
-                        if settings_btn.is_displayed():
-                            settings_btn.click()
-                            time.sleep(3)
-                            settings_accessed = True
-                            print(f"{GREEN} Clicked settings button")
-                            break
-                    except:
-                        continue
+                if _click_first_visible(browser, 'settings', settings_selectors):
+                    time.sleep(3)
+                    settings_accessed = True
+                    print(f"{GREEN} Clicked settings button")
             except:
                 pass
         
@@ -1936,7 +2441,7 @@ def set_location(browser: webdriver.Chrome, location: str) -> bool:
                 # First, make sure we're on the app page
                 if 'app' not in browser.current_url:
                     browser.get("https://www.bumble.com/app")
-                    time.sleep(3)
+                    _wait_loaded(browser, 5)
                 
                 # Look for filter button - Bumble has a filters button on the main app page
                 filter_selectors = [
@@ -1949,17 +2454,10 @@ def set_location(browser: webdriver.Chrome, location: str) -> bool:
                     'a[href*="settings"]',
                 ]
                 
-                for selector in filter_selectors:
-                    try:
-                        filter_btn = browser.find_element(By.CSS_SELECTOR, selector)
-                        if filter_btn.is_displayed():
-                            filter_btn.click()
-                            time.sleep(2)
-                            print(f"{GREEN} Opened filters/settings")
-                            settings_accessed = True
-                            break
-                    except:
-                        continue
+                if _click_first_visible(browser, 'filters', filter_selectors):
+                    time.sleep(2)
+                    print(f"{GREEN} Opened filters/settings")
+                    settings_accessed = True
             except Exception as e:
                 print(f"{YELLOW} Error accessing filters: {e}")
         
@@ -1989,50 +2487,42 @@ def set_location(browser: webdriver.Chrome, location: str) -> bool:
         ]
         
         location_set = False
-        for selector in location_selectors:
+        selector = _find_first_visible_selector(browser, 'location_input', location_selectors)
+        if selector:
             try:
                 location_input = browser.find_element(By.CSS_SELECTOR, selector)
-                if location_input.is_displayed():
-                    print(f"{GREEN} Found location input: {selector}")
-                    # Clear and set location
-                    location_input.clear()
-                    location_input.send_keys(location)
-                    time.sleep(1)
-                    
-                    # Try to submit or select from dropdown
-                    location_input.send_keys(Keys.RETURN)
+                print(f"{GREEN} Found location input: {selector}")
+                # Clear and set location
+                location_input.clear()
+                location_input.send_keys(location)
+                time.sleep(1)
+                
+                # Try to submit or select from dropdown
+                location_input.send_keys(Keys.RETURN)
+                time.sleep(2)
+                
+                # Look for save/apply button
+                save_selectors = [
+                    'button[type="submit"]',
+                    'button[class*="save"]',
+                    'button[class*="apply"]',
+                    'button[aria-label*="Save" i]',
+                    'button[aria-label*="Apply" i]',
+                ]
+                
+                if _click_first_visible(browser, 'save_button', save_selectors):
                     time.sleep(2)
-                    
-                    # Look for save/apply button
-                    save_selectors = [
-                        'button[type="submit"]',
-                        'button[class*="save"]',
-                        'button[class*="apply"]',
-                        'button[aria-label*="Save" i]',
-                        'button[aria-label*="Apply" i]',
-                    ]
-                    
-                    for save_selector in save_selectors:
-                        try:
-                            save_btn = browser.find_element(By.CSS_SELECTOR, save_selector)
-                            if save_btn.is_displayed():
-                                save_btn.click()
-                                time.sleep(2)
-                                print(f"{GREEN} Clicked save/apply button")
-                                break
-                        except:
-                            continue
-                    
-                    location_set = True
-                    break
+                    print(f"{GREEN} Clicked save/apply button")
+                
+                location_set = True
             except:
-                continue
+                pass
         
         if location_set:
             print(f"{GREEN} Location set to: {location}")
             # Navigate back to app page
             browser.get("https://www.bumble.com/app")
-            time.sleep(3)
+            _wait_loaded(browser, 5)
             return True
         else:
             print(f"{YELLOW} Could not find location input field.")
@@ -2045,7 +2535,7 @@ def set_location(browser: webdriver.Chrome, location: str) -> bool:
             print(f"{YELLOW} See TRAVEL_MODE.md for detailed information about location options.")
             # Navigate back to app page
             browser.get("https://www.bumble.com/app")
-            time.sleep(3)
+            _wait_loaded(browser, 5)
             return False
             
     except Exception as e:
@@ -2053,24 +2543,244 @@ def set_location(browser: webdriver.Chrome, location: str) -> bool:
         # Navigate back to app page
         try:
             browser.get("https://www.bumble.com/app")
-            time.sleep(3)
+            _wait_loaded(browser, 5)
         except:
             pass
         return False
 
 
+# Minimal environment for the Notion save script, computed once instead of
+# copying the full process environment on every save. Add variables here if
+# the TS script grows new requirements.
+_NOTION_ENV_BASE = {
+    k: os.environ[k]
+    for k in (
+        'PATH', 'PATHEXT', 'NOTION_TOKEN', 'NOTION_DATABASE_ID',
+        'HOME', 'USERPROFILE', 'APPDATA', 'LOCALAPPDATA', 'SYSTEMROOT',
+        'NODE_PATH', 'TMPDIR', 'TEMP', 'TMP',
+    )
+    if k in os.environ
+}
+
+
+def _notion_env(merge_duplicates: bool = False, force_save: bool = False) -> Dict:
+    """Build the env for a Notion save from the precomputed allowlist."""
+    env_vars = dict(_NOTION_ENV_BASE)
+    if merge_duplicates:
+        env_vars['NOTION_UPDATE_DUPLICATES'] = 'true'
+    if force_save:
+        env_vars['NOTION_SKIP_DUPLICATES'] = 'false'
+    return env_vars
+
+
+# Precompiled classifiers for the Notion script's output (per-profile path;
+# avoids a .lower() allocation per save)
+_NOTION_SUCCESS_RE = re.compile(r'\u2705 Saved:|\u23ed\ufe0f\s+Duplicate:')
+_NOTION_SOFT_FAIL_RE = re.compile(r'duplicate|validation|Skipping profile', re.IGNORECASE)
+
+
+def _dumps_bytes(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _dumps_indent_bytes(obj) -> bytes:
+    """Serialize to pretty-printed UTF-8 JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data):
+    """Parse JSON from str/bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _last_nonempty(output: str) -> str:
+    """
+    Return the last non-empty output line (skipping the script's own
+    '✅ Loaded' banner) by scanning backwards, without building a list of
+    every line per save.
+    """
+    end = len(output)
+    while end > 0:
+        start = output.rfind('\n', 0, end)
+        candidate = output[start + 1:end].strip()
+        if candidate and not candidate.startswith('✅ Loaded'):
+            return candidate
+        end = start
+    return ''
+
+
+def _find_backend_root() -> Path:
+    """Find backend root (parent of submodules) relative to this file."""
+    current_dir = Path(__file__).resolve()
+    # Go up: Scraper -> bumble-auto-liker -> submodules -> backend
+    # Path structure: backend/submodules/bumble-auto-liker/Scraper/bumble_profile_scraper.py
+    return current_dir.parent.parent.parent.parent
+
+
+class NotionWriter:
+    """
+    Persistent Node tsx worker for Notion saves.
+
+    Spawning `pnpm tsx` per profile pays ~1-3s of node boot + TS compile on
+    every save. This keeps ONE subprocess alive for the whole run: profiles
+    are streamed to it as newline-delimited JSON on stdin and result statuses
+    are read back one line at a time from stdout. If the worker dies (or the
+    script doesn't support --stream), callers fall back to the per-call path.
+    """
+
+    def __init__(self, script_path: Path, backend_root: Path, merge_duplicates: bool = False, force_save: bool = False):
+        self.script_path = script_path
+        self.backend_root = backend_root
+        self.merge_duplicates = merge_duplicates
+        self.force_save = force_save
+        self.proc = None
+        self._lock = threading.Lock()
+
+    def _build_env(self) -> Dict:
+        return _notion_env(self.merge_duplicates, self.force_save)
+
+    def start(self) -> bool:
+        """Spawn the streaming worker. Returns True if it came up."""
+        for launcher in (['pnpm', 'tsx'], ['npx', 'tsx']):
+            try:
+                self.proc = subprocess.Popen(
+                    launcher + [str(self.script_path), '--stream'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    bufsize=1,  # line-buffered: one JSON line in, one result line out
+                    cwd=str(self.backend_root),
+                    env=self._build_env()
+                )
+                return True
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"{YELLOW} [WARN] Could not start Notion stream worker: {e}")
+                return False
+        return False
+
+    def is_alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def save(self, profile_data: Dict) -> Optional[str]:
+        """
+        Stream one profile to the worker and return its result line.
+        Returns None if the worker is dead or the exchange failed (caller
+        should fall back to the per-call subprocess path).
+        """
+        if not self.is_alive():
+            return None
+        try:
+            with self._lock:
+                self.proc.stdin.write(_dumps_bytes(profile_data).decode('utf-8'))
+                self.proc.stdin.write('\n')
+                self.proc.stdin.flush()
+                result_line = self.proc.stdout.readline()
+            if not result_line:
+                # Worker exited mid-exchange
+                self.close()
+                return None
+            return result_line.strip()
+        except Exception:
+            self.close()
+            return None
+
+    def close(self):
+        if self.proc is not None:
+            try:
+                if self.proc.stdin:
+                    self.proc.stdin.close()
+                self.proc.terminate()
+            except Exception:
+                pass
+            self.proc = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+_NOTION_WRITER: Optional[NotionWriter] = None
+_NOTION_WRITER_FAILED = False
+
+
+def _get_notion_writer(script_path: Path, backend_root: Path, merge_duplicates: bool, force_save: bool) -> Optional[NotionWriter]:
+    """Lazily start (and cache) the streaming Notion worker for this run."""
+    global _NOTION_WRITER, _NOTION_WRITER_FAILED
+    if _NOTION_WRITER_FAILED:
+        return None
+    if _NOTION_WRITER is not None and _NOTION_WRITER.is_alive():
+        return _NOTION_WRITER
+    writer = NotionWriter(script_path, backend_root, merge_duplicates=merge_duplicates, force_save=force_save)
+    if writer.start():
+        _NOTION_WRITER = writer
+        return writer
+    # Don't retry the spawn on every profile if pnpm/npx is missing
+    _NOTION_WRITER_FAILED = True
+    return None
+
+
+class _TokenBucket:
+    """
+    Minimal monotonic-clock token bucket. acquire() blocks until a token is
+    available, allowing short bursts up to `capacity` while enforcing `rate`
+    requests per second on average.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared limiter for every Notion request (2 req/s, burst of 4): stays under
+# Notion's limit so bursts never trigger server-side 429 backoff cascades
+_NOTION_BUCKET = _TokenBucket(rate=2.0, capacity=4)
+
+
 def save_profile_to_notion(profile_data: Dict, backend_root: str = None, merge_duplicates: bool = False, force_save: bool = False) -> bool:
     """
     Save a profile to Notion using the Node.js script with retry logic.
+    Uses a persistent streaming worker when available (amortizes node/tsx
+    startup across the run), falling back to a per-profile subprocess.
+    All callers share _NOTION_BUCKET so requests stay within Notion's rate
+    limit regardless of which path issues them.
     Returns True if successful, False otherwise.
     """
     try:
-        # Find backend root (parent of submodules)
+        _NOTION_BUCKET.acquire()
         if not backend_root:
-            current_dir = Path(__file__).resolve()
-            # Go up: Scraper -> bumble-auto-liker -> submodules -> backend
-            # Path structure: backend/submodules/bumble-auto-liker/Scraper/bumble_profile_scraper.py
-            backend_root = current_dir.parent.parent.parent.parent
+            backend_root = _find_backend_root()
         
         script_path = Path(backend_root) / 'scripts' / 'save-bumble-profile-to-notion.ts'
         
@@ -2078,20 +2788,35 @@ def save_profile_to_notion(profile_data: Dict, backend_root: str = None, merge_d
             print(f"{YELLOW} [WARN] Notion save script not found at {script_path}, skipping Notion save")
             return False
         
-        # Convert profile data to JSON
-        profile_json = json.dumps(profile_data, ensure_ascii=False)
+        # Fast path: stream through the long-lived worker
+        writer = _get_notion_writer(script_path, Path(backend_root), merge_duplicates, force_save)
+        if writer is not None:
+            result_line = writer.save(profile_data)
+            if result_line is not None:
+                if '✅ Saved:' in result_line:
+                    print(f"{CYAN} {result_line.replace('✅ Saved:', 'Saved to Notion:')}")
+                    return True
+                if '⏭️' in result_line or 'duplicate' in result_line.lower():
+                    print(f"{CYAN} {result_line}")
+                    return True
+                if '❌' in result_line or 'error' in result_line.lower():
+                    profile_name = profile_data.get('name', 'Unknown')
+                    print(f"{RED} [FAIL] Failed to save {profile_name} to Notion: {result_line}")
+                    return False
+                if result_line:
+                    print(f"{CYAN} Saved to Notion: {result_line}")
+                return True
+            # Worker died mid-save: fall through to the per-call path
+        
+        # Convert profile data to JSON (orjson-backed when available)
+        profile_json = _dumps_bytes(profile_data).decode('utf-8')
         
         # Call Node.js script via subprocess
         # Use pnpm or node directly
         result = None
         try:
             # Prepare environment variables
-            env_vars = os.environ.copy()
-            if merge_duplicates:
-                env_vars['NOTION_UPDATE_DUPLICATES'] = 'true'
-            
-            if force_save:
-                env_vars['NOTION_SKIP_DUPLICATES'] = 'false'
+            env_vars = _notion_env(merge_duplicates, force_save)
 
             # Try pnpm first (if available)
             result = subprocess.run(
@@ -2108,13 +2833,7 @@ def save_profile_to_notion(profile_data: Dict, backend_root: str = None, merge_d
         except FileNotFoundError:
             # Fallback to npx with tsx
             try:
-                env_vars = os.environ.copy()
-                if merge_duplicates:
-                    env_vars['NOTION_UPDATE_DUPLICATES'] = 'true'
-                
-                if force_save:
-                    env_vars['NOTION_SKIP_DUPLICATES'] = 'false'
-                    
+                env_vars = _notion_env(merge_duplicates, force_save)
                 result = subprocess.run(
                     ['npx', 'tsx', str(script_path)],
                     input=profile_json,
@@ -2137,12 +2856,11 @@ def save_profile_to_notion(profile_data: Dict, backend_root: str = None, merge_d
         if result and result.returncode == 0:
             # Check output for success/duplicate messages
             output = result.stdout.strip()
-            if '✅ Saved:' in output or '⏭️  Duplicate:' in output:
+            if _NOTION_SUCCESS_RE.search(output):
                 # Print without the script's own log prefix to avoid duplication
-                lines = [line for line in output.split('\n') if line.strip() and not line.startswith('✅ Loaded')]
-                if lines:
+                last_line = _last_nonempty(output)
+                if last_line:
                     # Replace "Saved:" with "Saved to Notion:"
-                    last_line = lines[-1]
                     if '✅ Saved:' in last_line:
                         last_line = last_line.replace('✅ Saved:', 'Saved to Notion:')
                     print(f"{CYAN} {last_line}")  # Print last line (the result)
@@ -2155,10 +2873,10 @@ def save_profile_to_notion(profile_data: Dict, backend_root: str = None, merge_d
         elif result:
             error_output = result.stderr.strip() or result.stdout.strip()
             # Don't print error if it's just a duplicate or validation error (these are expected)
-            if 'duplicate' in error_output.lower() or 'validation' in error_output.lower() or 'Skipping profile' in error_output:
-                lines = [line for line in error_output.split('\n') if line.strip() and not line.startswith('✅ Loaded')]
-                if lines:
-                    print(f"{CYAN} {lines[-1]}")
+            if _NOTION_SOFT_FAIL_RE.search(error_output):
+                last_line = _last_nonempty(error_output)
+                if last_line:
+                    print(f"{CYAN} {last_line}")
                 return True
             else:
                 # Real error - show better feedback with emojis
@@ -2187,59 +2905,154 @@ def save_profile_to_notion(profile_data: Dict, backend_root: str = None, merge_d
         return False
 
 
+class _FingerprintSet:
+    """
+    Set of seen fingerprints with a Bloom-filter front end.
+
+    Most lookups are for fingerprints never seen before; the Bloom probe
+    answers those from a fixed bytearray without touching the exact set.
+    Stdlib-only (no pybloom dependency): k bit positions are derived from
+    the fingerprint's own hash. False positives just fall through to the
+    exact set, so membership answers stay correct.
+    """
+
+    def __init__(self, size_bits: int = 1 << 17, num_probes: int = 4):
+        self._bits = bytearray(size_bits // 8)
+        self._size = size_bits
+        self._probes = num_probes
+        self._exact = set()
+
+    def _positions(self, fingerprint: str):
+        try:
+            h = int(fingerprint[:16], 16)  # fingerprints are hex digests
+        except ValueError:
+            h = hash(fingerprint) & 0xFFFFFFFFFFFFFFFF
+        for i in range(self._probes):
+            yield (h >> (i * 13)) % self._size
+
+    def __contains__(self, fingerprint) -> bool:
+        for pos in self._positions(fingerprint):
+            if not (self._bits[pos >> 3] >> (pos & 7)) & 1:
+                return False
+        return fingerprint in self._exact
+
+    def add(self, fingerprint) -> None:
+        for pos in self._positions(fingerprint):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self._exact.add(fingerprint)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+
+def _debug_fingerprint_str(profile_data: Dict) -> str:
+    """Human-readable canonical form of a profile fingerprint, for logging."""
+    # Extract key identifying features
+    age = profile_data.get("age", "unknown")
+    location = profile_data.get("location", "unknown")
+    
+    # Sort badges for consistent fingerprinting. These fields are always
+    # exactly list/dict when present, so exact type checks beat isinstance
+    badges = profile_data.get("badges")
+    badges_str = ",".join(sorted(badges)) if type(badges) is list else ""
+
+    # Use question answer keys (not values, as they might vary)
+    qa = profile_data.get("question_answers")
+    qa_keys_str = ",".join(sorted(qa.keys())) if type(qa) is dict else ""
+
+    # Image URLs count
+    image_urls = profile_data.get("image_urls")
+    image_count = len(image_urls) if type(image_urls) is list else 0
+    
+    return "|".join([
+        f"age:{age}",
+        f"loc:{location}",
+        f"badges:{badges_str}",
+        f"qa:{qa_keys_str}",
+        f"imgs:{image_count}"
+    ])
+
+
+def _save_worker(save_queue: "queue.Queue", jsonl_writer, merge_duplicates: bool,
+                 force_save: bool, backup_failures: list) -> None:
+    """
+    Drain queued save work off the scrape thread. Items are (kind, profile)
+    tuples: 'backup' appends to the session JSONL writer, 'notion' uploads
+    to Notion (rate limiting is handled by _NOTION_BUCKET inside
+    save_profile_to_notion). Backup appends that fail are recorded in
+    backup_failures so the scrape thread knows the JSONL file has gaps and
+    keeps the end-of-run rewrite. A None item shuts the worker down.
+    """
+    while True:
+        item = save_queue.get()
+        if item is None:
+            save_queue.task_done()
+            break
+        kind, profile = item
+        try:
+            if kind == 'backup':
+                name_display = profile.get('name', 'Unknown')
+                if jsonl_writer is not None and jsonl_writer.write(profile):
+                    if profile.get("_name_placeholder"):
+                        safe_print(f"{CYAN} [SAVE] Saved to JSON backup (placeholder name): {name_display} ({profile.get('age', '?')})")
+                    else:
+                        safe_print(f"{CYAN} [SAVE] Saved to JSON backup: {name_display} ({profile.get('age', '?')})")
+                else:
+                    backup_failures.append(name_display)
+                    safe_print(f"{RED} [FAIL] Failed to save {name_display} to JSON backup")
+            else:  # 'notion'
+                save_profile_to_notion(profile, merge_duplicates=merge_duplicates, force_save=force_save)
+        except Exception as e:
+            if kind == 'backup':
+                backup_failures.append(profile.get('name', 'Unknown'))
+            print(f"{YELLOW} Save worker error for {profile.get('name', 'Unknown')}: {e}")
+        save_queue.task_done()
+
+
 def create_profile_fingerprint(profile_data: Dict) -> str:
     """
     Create a unique fingerprint for a profile based on extracted data.
     Used to detect when we're extracting the same profile repeatedly.
     
+    The canonical feature string is hashed to a fixed 16-char hex digest
+    (xxh3 when xxhash is installed, blake2b otherwise) so dedupe sets hold
+    small fixed-size keys instead of ~200-char strings. Use
+    _debug_fingerprint_str for a readable form.
+    
     Args:
         profile_data: Dictionary containing extracted profile data
         
     Returns:
-        A string fingerprint representing the profile
+        A 16-character hex digest representing the profile
     """
     try:
-        # Extract key identifying features
-        age = profile_data.get("age", "unknown")
-        location = profile_data.get("location", "unknown")
-        
-        # Sort badges for consistent fingerprinting
-        badges = sorted(profile_data.get("badges", [])) if isinstance(profile_data.get("badges"), list) else []
-        badges_str = ",".join(badges)
-        
-        # Use question answer keys (not values, as they might vary)
-        qa_keys = sorted(profile_data.get("question_answers", {}).keys()) if isinstance(profile_data.get("question_answers"), dict) else []
-        qa_keys_str = ",".join(qa_keys)
-        
-        # Image URLs count
-        image_count = len(profile_data.get("image_urls", [])) if isinstance(profile_data.get("image_urls"), list) else 0
-        
-        # Create fingerprint
-        fingerprint_parts = [
-            f"age:{age}",
-            f"loc:{location}",
-            f"badges:{badges_str}",
-            f"qa:{qa_keys_str}",
-            f"imgs:{image_count}"
-        ]
-        
-        return "|".join(fingerprint_parts)
+        canonical = _debug_fingerprint_str(profile_data).encode('utf-8')
+        if xxhash is not None:
+            return f"{xxhash.xxh3_64_intdigest(canonical):016x}"
+        return hashlib.blake2b(canonical, digest_size=8).hexdigest()
     except Exception as e:
         print(f"{YELLOW} Error creating profile fingerprint: {e}")
         return "error"
 
 
+# Reused across dumps so zstd keeps its internal thread pool warm
+_STUCK_HTML_CCTX = None
+
+
 def save_stuck_profile_html(browser: webdriver.Chrome, profile_count: int) -> str:
     """
     Save the current browser page HTML to a file for debugging stuck profiles.
+    Dumps are zstd-compressed when the zstandard package is installed (page
+    sources run 1-5 MB each and compress ~10x); otherwise raw HTML is written.
     
     Args:
         browser: Selenium WebDriver instance
         profile_count: Current profile count for filename
         
     Returns:
-        Path to the saved HTML file
+        Path to the saved file
     """
+    global _STUCK_HTML_CCTX
     try:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"bumble_stuck_profile_{timestamp}_profile{profile_count}.html"
@@ -2247,9 +3060,15 @@ def save_stuck_profile_html(browser: webdriver.Chrome, profile_count: int) -> st
         # Get page source
         page_source = browser.page_source
         
-        # Save to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(page_source)
+        if zstd is not None:
+            if _STUCK_HTML_CCTX is None:
+                _STUCK_HTML_CCTX = zstd.ZstdCompressor(level=3, threads=-1)
+            filename += '.zst'
+            with open(filename, 'wb') as f, _STUCK_HTML_CCTX.stream_writer(f) as writer:
+                writer.write(page_source.encode('utf-8'))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(page_source)
         
         print(f"{YELLOW} Saved stuck profile HTML to: {filename}")
         return filename
@@ -2293,7 +3112,7 @@ def restart_browser(browser: webdriver.Chrome, cookie_file: str = None, headless
         
         # Navigate to app
         new_browser.get("https://www.bumble.com/app")
-        time.sleep(3)
+        _wait_loaded(new_browser, 5)
         
         # Reload cookies if provided
         if cookie_file:
@@ -2303,11 +3122,12 @@ def restart_browser(browser: webdriver.Chrome, cookie_file: str = None, headless
                     print(f"{GREEN} Cookies reloaded successfully")
                     # Refresh page after cookies
                     new_browser.get("https://www.bumble.com/app")
-                    time.sleep(3)
+                    _wait_loaded(new_browser, 5)
         
-        # Set location if provided
-        if location:
-            set_location(new_browser, location)
+        # Set location if provided (skipped when a recent run already applied it)
+        if location and not _location_recently_set(location):
+            if set_location(new_browser, location):
+                _remember_location(location)
         
         return new_browser
         
@@ -2316,13 +3136,79 @@ def restart_browser(browser: webdriver.Chrome, cookie_file: str = None, headless
         raise
 
 
+# Fixed CSV schema. Positional rows via csv.writer avoid the per-profile
+# dict copy (and DictWriter's per-row field mapping) the old path paid.
+_CSV_FIELDNAMES = ('extracted_at', 'name', 'age', 'bio', 'job', 'education',
+                   'location', 'from_location', 'preferences', 'badges',
+                   'question_answers', 'spotify_artists', 'image_urls')
+
+# Reduced schema used by the Ctrl+C partial save
+_CSV_PARTIAL_FIELDNAMES = ('extracted_at', 'name', 'age', 'bio', 'job', 'education',
+                           'location', 'preferences', 'image_urls')
+
+
+def _write_profiles_csv(path: str, profiles: List[Dict], fieldnames=_CSV_FIELDNAMES) -> None:
+    """
+    Write profiles to `path` as CSV: positional rows built per `fieldnames`,
+    list/dict fields joined to single cells, encoded once through an
+    in-memory text wrapper and flushed to the file in one binary write.
+    Shared by the normal save and the Ctrl+C partial save.
+    """
+    join = '; '.join
+    qa_join = ' | '.join
+
+    def row_of(p):
+        out = []
+        for k in fieldnames:
+            v = p.get(k)
+            tv = type(v)
+            if tv is list:
+                out.append(join(str(x) for x in v))
+            elif tv is dict:
+                out.append(qa_join(f"{q}: {a}" for q, a in v.items()))
+            elif v is None:
+                out.append('')
+            else:
+                out.append(v)
+        return out
+
+    buf = io.BytesIO()
+    tw = io.TextIOWrapper(buf, encoding='utf-8', newline='', write_through=False)
+    if profiles:
+        writer = csv.writer(tw)
+        writer.writerow(fieldnames)
+        writer.writerows(row_of(p) for p in profiles)
+    tw.flush()
+    with open(path, 'wb') as f:
+        f.write(buf.getvalue())
+
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Write `data` to `path` via a temp file + os.replace so a crash mid-write
+    can never leave a torn file. The atomic rename gives crash consistency
+    without any fsync in the hot path.
+    """
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
 def save_profile_to_json(profile_data: Dict, json_file: str) -> bool:
     """
-    Save a single profile to JSON file incrementally (append mode).
-    Creates file if it doesn't exist, appends if it does.
+    Save a single profile to JSON file incrementally.
+    JSONL targets append one object per line (O(1) per profile); legacy .json
+    targets fall back to the full read-modify-rewrite.
     Returns True if successful, False otherwise.
     """
     try:
+        if json_file.endswith('.jsonl'):
+            with open(json_file, 'ab') as f:
+                f.write(_dumps_bytes(profile_data))
+                f.write(b'\n')
+            return True
+
         # Read existing profiles if file exists
         existing_profiles = []
         if Path(json_file).exists():
@@ -2336,20 +3222,123 @@ def save_profile_to_json(profile_data: Dict, json_file: str) -> bool:
         
         # Add new profile
         existing_profiles.append(profile_data)
-        
-        # Write back to file
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_profiles, f, indent=2, ensure_ascii=False)
-        
+
+        # Write back to file (atomic: a crash can't tear the live backup)
+        _atomic_write_bytes(json_file, _dumps_indent_bytes(existing_profiles))
+
         return True
     except Exception as e:
         print(f"{YELLOW} Error saving profile to JSON: {e}")
         return False
 
-def scrape_worker(worker_id, total_workers, args_dict):
+
+class _JsonlBackupWriter:
+    """
+    Append-only JSONL backup handle held open for the whole scrape session.
+    One buffered file descriptor instead of an open/append/close cycle per
+    profile; each line is flushed after writing so the backup stays valid
+    NDJSON even on a crash or Ctrl+C.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, 'ab')
+
+    def write(self, profile_data: Dict) -> bool:
+        """Append one profile as a JSON line. Returns True on success."""
+        try:
+            self._fh.write(_dumps_bytes(profile_data))
+            self._fh.write(b'\n')
+            self._fh.flush()
+            return True
+        except Exception as e:
+            print(f"{YELLOW} Error saving profile to JSON: {e}")
+            return False
+
+    def close(self):
+        try:
+            self._fh.close()
+        except Exception:
+            pass
+
+
+def flush_profiles_to_json(profiles: List[Dict], json_file: str) -> bool:
+    """Write the full in-memory profile list to a JSON array file in one pass."""
+    try:
+        _atomic_write_bytes(json_file, _dumps_indent_bytes(profiles))
+        return True
+    except Exception as e:
+        print(f"{YELLOW} Error flushing profiles to JSON: {e}")
+        return False
+
+
+def convert_jsonl_to_json(jsonl_file: str, json_file: str = None) -> Optional[str]:
+    """
+    Consolidate an append-only JSONL backup into a regular JSON array file.
+    Returns the path to the JSON file, or None on failure.
+    """
+    try:
+        profiles = []
+        with open(jsonl_file, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    profiles.append(_loads(line))
+        if not json_file:
+            if jsonl_file.endswith('.jsonl'):
+                json_file = jsonl_file[:-len('.jsonl')] + '.json'
+            else:
+                json_file = jsonl_file + '.json'
+        _atomic_write_bytes(json_file, _dumps_indent_bytes(profiles))
+        return json_file
+    except Exception as e:
+        print(f"{YELLOW} Error consolidating JSONL backup: {e}")
+        return None
+
+
+# Browsers launched for workers are parked here between invocations so a
+# re-invoked worker skips the 1-3s Chromium launch; keyed by worker id
+_DRIVER_CACHE: Dict[int, object] = {}
+
+
+def _cleanup_driver_cache():
+    for drv in _DRIVER_CACHE.values():
+        try:
+            drv.quit()
+        except Exception:
+            pass
+    _DRIVER_CACHE.clear()
+
+
+atexit.register(_cleanup_driver_cache)
+
+
+def _checkout_cached_driver(worker_slot):
+    """Pop a parked browser for this worker, discarding it if it has died."""
+    cached = _DRIVER_CACHE.pop(worker_slot, None)
+    if cached is None:
+        return None
+    try:
+        cached.current_url  # liveness probe
+        return cached
+    except Exception:
+        try:
+            cached.quit()
+        except Exception:
+            pass
+        return None
+
+
+def scrape_worker(worker_id, total_workers, shared_args, overrides=None):
     """
     Worker function for parallel scraping.
+
+    shared_args can be a read-only mapping (e.g. MappingProxyType) shared by
+    every worker; per-worker values go in overrides. The merge below is the
+    only copy made, so callers no longer need to hand each worker its own
+    dict.
     """
+    args_dict = {**shared_args, **(overrides or {})}
     # Stagger starts to avoid undetected_chromedriver conflicts
     if total_workers > 1:
         stagger_time = worker_id * args_dict.get('stagger', 5)
@@ -2389,13 +3378,14 @@ def scrape_worker(worker_id, total_workers, args_dict):
             merge_duplicates=args_dict.get('merge_duplicates', False),
             force_save=args_dict.get('force_save', False),
             require_bio=args_dict.get('require_bio', False),
-            chrome_version=args_dict.get('chrome_version')
+            chrome_version=args_dict.get('chrome_version'),
+            debug=args_dict.get('debug', False),
+            worker_slot=worker_id
         )
         print(f"{GREEN} [Worker {worker_id}] Completed successfully.")
         return True
     except Exception as e:
         print(f"{RED} [Worker {worker_id}] Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -2406,7 +3396,8 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                     save_to_notion: bool = False, gender: str = None, dislike: bool = False,
                     upload_images: bool = False, merge_duplicates: bool = False, force_save: bool = False,
                     login_mode: bool = False, require_bio: bool = False,
-                    chrome_version: Optional[int] = None):
+                    chrome_version: Optional[int] = None, debug: bool = False,
+                    worker_slot: Optional[int] = None):
     """
     Scrape Bumble profiles by extracting data before swiping right.
     
@@ -2423,7 +3414,12 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
         gender: Optional gender to set for all scraped profiles (e.g., "female", "male", "non-binary")
         dislike: If True, swipe left (dislike/pass) instead of right (like)
         upload_images: If True, upload profile images to S3 for permanent storage
+        debug: If True, write page/profile HTML dumps to disk for inspection
     """
+    global _DEBUG_DUMPS
+    _DEBUG_DUMPS = debug
+    if debug:
+        log.setLevel(logging.DEBUG)
     s3_handler = None
     if upload_images:
         try:
@@ -2439,7 +3435,11 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
     browser = None
     all_profiles = []
     json_backup_file = None
+    jsonl_writer = None
+    save_queue = None
     profile_count = 0
+    incremental_ok = True  # Any failed incremental save forces the final rewrite
+    backup_failures = []  # Filled by the save worker; checked after the drain
 
     try:
         if login_mode:
@@ -2487,17 +3487,23 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
             print(f"{CYAN} Running in headless mode (no visible browser window)")
         print(f"{CYAN} Auto-detecting Chrome version and downloading compatible ChromeDriver...")
         
-        browser, chrome_version = get_browser(headless=headless, chrome_version=chrome_version, prefer_launcher=False)
-        browser.maximize_window()
-        
-        # Execute script to hide webdriver property
-        browser.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-            'source': '''
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-            '''
-        })
+        if worker_slot is not None:
+            browser = _checkout_cached_driver(worker_slot)
+            if browser is not None:
+                print(f"{CYAN} Reusing browser parked by worker {worker_slot}")
+        if not browser:
+            browser, chrome_version = get_browser(headless=headless, chrome_version=chrome_version, prefer_launcher=False)
+            browser.maximize_window()
+
+            # Execute script to hide webdriver property (persists for the
+            # session, so a reused browser doesn't need it re-applied)
+            browser.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+                'source': '''
+                    Object.defineProperty(navigator, 'webdriver', {
+                        get: () => undefined
+                    });
+                '''
+            })
         
         # Try cookie-based authentication first (recommended)
         logged_in = False
@@ -2518,7 +3524,7 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
         if not logged_in:
             print(f"{CYAN} Navigating to Bumble...")
             browser.get("https://www.bumble.com")
-            time.sleep(5)
+            _wait_loaded(browser, 10)
             
             # Check if we're on login page or landing page
             current_url = browser.current_url.lower()
@@ -2540,7 +3546,7 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
             print(f"{CYAN} Navigating to encounters page...")
             try:
                 browser.get("https://www.bumble.com/app")
-                time.sleep(5)
+                _wait_for_app(browser, 15)
                 print(f"{CYAN} URL after navigation: {browser.current_url}")
                 print(f"{CYAN} Page title: {browser.title}")
             except Exception as e:
@@ -2560,7 +3566,9 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
         # - However, Travel Mode is NOT available on Bumble Web (only mobile app)
         # - For web scraping, you need a VPN/proxy with target city IP address
         # - See TRAVEL_MODE.md for more details
-        if location:
+        if location and _location_recently_set(location):
+            print(f"{CYAN} Location '{location}' already applied recently; skipping settings reload")
+        elif location:
             print(f"{CYAN} Attempting to set location to: {location}")
             print(f"{YELLOW} Note: Bumble primarily uses IP-based geolocation for matching.")
             print(f"{YELLOW} 'Lives in' location in profile settings is different from search/matching location.")
@@ -2577,8 +3585,10 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                 browser.get("https://www.bumble.com")
                 time.sleep(2)
                 browser.get("https://www.bumble.com/app")
-                time.sleep(5)  # Wait longer for location to take effect
+                _wait_for_app(browser, 15)
+                _wait_for_encounters_card(browser, 10)  # Cards back = location applied
                 print(f"{CYAN} App page refreshed. Profiles shown may still be based on IP address.")
+                _remember_location(location)
             else:
                 print(f"{YELLOW} Location setting failed. Bumble may require manual location change in settings.")
                 print(f"{YELLOW} If you manually set 'Lives in' to Seattle, note that this may not change matching location.")
@@ -2587,24 +3597,21 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
             # Wait a bit after setting location
             time.sleep(3)
         
-        # Save HTML for debugging (first time)
-        try:
-            with open('bumble_page_debug.html', 'w', encoding='utf-8') as f:
-                f.write(browser.page_source)
-            print(f"{CYAN} Saved page HTML to bumble_page_debug.html for inspection")
-        except Exception as e:
-            print(f"{YELLOW} Could not save HTML: {e}")
+        # Save HTML for debugging (first time, opt-in via --debug)
+        if _DEBUG_DUMPS:
+            try:
+                with open('bumble_page_debug.html', 'w', encoding='utf-8') as f:
+                    f.write(browser.page_source)
+                print(f"{CYAN} Saved page HTML to bumble_page_debug.html for inspection")
+            except Exception as e:
+                print(f"{YELLOW} Could not save HTML: {e}")
         
         # Wait a bit more for profile to load
         time.sleep(3)
         
-        # Check what elements are visible
+        # Check what elements are visible (one in-page sweep for all probes)
         print(f"{CYAN} Inspecting page structure...")
         try:
-            # Try to find any profile-related elements
-            all_buttons = browser.find_elements(By.TAG_NAME, 'button')
-            print(f"{CYAN} Found {len(all_buttons)} button elements on page")
-            
             # Look for common profile card selectors
             test_selectors = [
                 '.encounters-story-viewer',
@@ -2618,21 +3625,14 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                 'main',
             ]
             
-            for selector in test_selectors:
-                try:
-                    elements = browser.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        print(f"{CYAN} Found {len(elements)} element(s) with selector: {selector}")
-                        for i, elem in enumerate(elements[:3]):  # Show first 3
-                            try:
-                                text = elem.text[:100] if elem.text else "No text"
-                                tag = elem.tag_name
-                                classes = elem.get_attribute('class')[:50] if elem.get_attribute('class') else "No class"
-                                print(f"{CYAN}   [{i}] {tag} | class={classes} | text={text}...")
-                            except:
-                                pass
-                except Exception:
-                    pass
+            inspection = browser.execute_script(_INSPECT_PAGE_JS, test_selectors) or {}
+            print(f"{CYAN} Found {inspection.get('buttons', 0)} button elements on page")
+            for probe in inspection.get('probes', []):
+                print(f"{CYAN} Found {probe['count']} element(s) with selector: {probe['selector']}")
+                for i, sample in enumerate(probe.get('samples', [])):
+                    text = sample.get('text') or "No text"
+                    classes = sample.get('cls') or "No class"
+                    print(f"{CYAN}   [{i}] {sample.get('tag')} | class={classes} | text={text}...")
         except Exception as e:
             print(f"{YELLOW} Error inspecting page: {e}")
         
@@ -2642,7 +3642,8 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
         daily_limit_hit = False  # Track if we hit the daily limit gracefully
         
         # Loop detection: Track recent profile fingerprints to detect infinite loops
-        recent_profile_fingerprints = []
+        recent_profile_fingerprints = deque(maxlen=5)
+        seen_quick_fingerprints = _FingerprintSet()  # Lets extract_profile_data bail early on repeats
         max_loop_detection_count = 3  # Number of same fingerprints before restart
         max_restarts = 3  # Maximum browser restarts per session
         restart_count = 0
@@ -2653,29 +3654,63 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
             if not output_file:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 suffix = '_backup' if save_to_notion else ''
-                json_backup_file = f"bumble_profiles_{timestamp}{suffix}.json"
+                # Append-only JSONL keeps incremental saves O(1) per profile
+                json_backup_file = f"bumble_profiles_{timestamp}{suffix}.jsonl"
             else:
                 json_backup_file = output_file
-            # Initialize empty JSON file
+            # Initialize backup file. JSONL targets are touched in append mode
+            # so a caller-supplied file keeps earlier lines instead of being
+            # truncated; writes rely on default buffering (no per-line fsync).
             try:
-                with open(json_backup_file, 'w', encoding='utf-8') as f:
-                    json.dump([], f, indent=2, ensure_ascii=False)
+                if json_backup_file.endswith('.jsonl'):
+                    # Held open for the session; one fd, no per-profile reopen
+                    jsonl_writer = _JsonlBackupWriter(json_backup_file)
+                else:
+                    _atomic_write_bytes(json_backup_file, _dumps_indent_bytes([]))
                 print(f"{CYAN} Initialized JSON backup file: {json_backup_file}")
             except Exception as e:
                 print(f"{YELLOW} Warning: Could not initialize JSON backup file: {e}")
                 json_backup_file = None
-        
+            if json_backup_file and not json_backup_file.endswith('.jsonl'):
+                # Crash-safety for the buffered array path
+                atexit.register(flush_profiles_to_json, all_profiles, json_backup_file)
+
+        # Background save worker: the scrape loop queues JSONL backup appends
+        # and Notion uploads instead of blocking on disk and network RTT
+        # between swipes. Bounded so memory cannot balloon if saves lag.
+        if save_to_notion or jsonl_writer is not None:
+            save_queue = queue.Queue(maxsize=32)
+            threading.Thread(
+                target=_save_worker,
+                args=(save_queue, jsonl_writer, merge_duplicates, force_save,
+                      backup_failures),
+                daemon=True,
+            ).start()
+
         while True:
             # Check limit
             if limit and profile_count >= limit:
                 print(f"{CYAN} Reached limit of {limit} profiles")
                 break
             
+            # Cheap end-state probe before paying for a full extraction:
+            # current_url is one wire call vs extraction's dozens
+            try:
+                loop_url = browser.current_url.lower()
+                if 'empty' in loop_url or 'out-of-people' in loop_url:
+                    print(f"{CYAN} No more profiles available (detected in URL)")
+                    if profile_count > 0:
+                        print(f"{CYAN} Successfully extracted {profile_count} profile(s) before stopping")
+                    break
+            except Exception:
+                pass
+            
             dismiss_consent_iframe(browser)
             print(f"{CYAN} Profile {profile_count + 1}: Extracting data...")
             
             # Extract profile data BEFORE swiping
-            profile_data = extract_profile_data(browser, gender=gender)
+            profile_data = extract_profile_data(browser, gender=gender,
+                                                seen_fingerprints=seen_quick_fingerprints)
             
             # Create fingerprint for loop detection (even if name is missing)
             # We need to extract partial data to create fingerprint even when name extraction fails
@@ -2687,81 +3722,58 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                 # Profile data is None (name missing), but we still need to detect loops
                 # Try to extract partial data for fingerprinting
                 try:
-                    # Quick extraction of key fields for fingerprinting
+                    # One in-page sweep for all fingerprint fields
                     partial_data = {}
-                    try:
-                        age_elem = browser.find_element(By.CSS_SELECTOR, '.encounters-story-profile__age')
-                        age_text = age_elem.text.strip()
-                        # import re # Already imported globally
-                        age_match = re.search(r'(\d{2})', age_text)
+                    raw = browser.execute_script(_PARTIAL_FINGERPRINT_JS) or {}
+                    
+                    age_text = raw.get('age')
+                    if age_text:
+                        age_match = _RE_AGE.search(age_text)
                         if age_match:
                             partial_data["age"] = int(age_match.group(1))
-                    except:
-                        pass
                     
-                    try:
-                        location_elem = browser.find_element(By.CSS_SELECTOR, '.location-widget__town')
-                        partial_data["location"] = location_elem.text.strip() if location_elem else None
-                    except:
-                        pass
+                    if raw.get('location'):
+                        partial_data["location"] = raw['location']
                     
-                    try:
-                        badge_elems = browser.find_elements(By.CSS_SELECTOR, '.encounters-story-about__badge .pill__title')
-                        partial_data["badges"] = [badge.text.strip() for badge in badge_elems if badge.text.strip()]
-                    except:
-                        pass
+                    if raw.get('badges'):
+                        partial_data["badges"] = raw['badges']
                     
-                    try:
-                        # Extract question titles (keys) for fingerprinting
-                        qa_sections = browser.find_elements(By.CSS_SELECTOR, '.encounters-story-section--question')
-                        qa_dict = {}
-                        for section in qa_sections:
-                            try:
-                                question_title_elem = section.find_element(By.CSS_SELECTOR, '.encounters-story-section__heading-title h2, .encounters-story-section__heading-title')
-                                question_title = question_title_elem.text.strip() if question_title_elem else None
-                                if not question_title:
-                                    question_title = browser.execute_script("return arguments[0].textContent || arguments[0].innerText || '';", question_title_elem)
-                                    question_title = question_title.strip() if question_title else None
-                                if question_title:
-                                    qa_dict[question_title] = "exists"
-                            except:
-                                pass
-                        if qa_dict:
-                            partial_data["question_answers"] = qa_dict
-                    except Exception as e:
-                        print(f"{YELLOW} Error extracting question answers for fingerprint: {e}")
-                        pass
+                    qa_keys = raw.get('qa_keys') or []
+                    if qa_keys:
+                        partial_data["question_answers"] = {title: "exists" for title in qa_keys}
                     
-                    try:
-                        img_elems = browser.find_elements(By.CSS_SELECTOR, '.encounters-album__photo img')
-                        partial_data["image_urls"] = [img.get_attribute('src') for img in img_elems[:3] if img.get_attribute('src')]
-                    except:
-                        pass
+                    if raw.get('image_urls'):
+                        partial_data["image_urls"] = raw['image_urls']
                     
                     if partial_data:
                         current_fingerprint = create_profile_fingerprint(partial_data)
-                        safe_print(f"{CYAN} Created fingerprint from partial data (name missing): {current_fingerprint[:80]}...")
-                        safe_print(f"{CYAN} Recent fingerprints count: {len(recent_profile_fingerprints)}")
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("%s Created fingerprint from partial data (name missing): %s (%s...)",
+                                      CYAN, current_fingerprint, _debug_fingerprint_str(partial_data)[:80])
+                            log.debug("%s Recent fingerprints count: %d", CYAN, len(recent_profile_fingerprints))
                     else:
                         safe_print(f"{YELLOW} Warning: Could not extract any partial data for fingerprinting")
                 except Exception as e:
                     safe_print(f"{YELLOW} Could not create fingerprint from partial data: {e}")
-                    import traceback
                     traceback.print_exc()
             
             # Check for infinite loop: same profile extracted repeatedly
             if current_fingerprint:
-                safe_print(f"{CYAN} Current fingerprint: {current_fingerprint[:80]}...")
-                safe_print(f"{CYAN} Recent fingerprints: {[fp[:40] + '...' if len(fp) > 40 else fp for fp in recent_profile_fingerprints[-3:]]}")
-                if len(recent_profile_fingerprints) >= max_loop_detection_count:
+                recent_tail = list(recent_profile_fingerprints)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("%s Current fingerprint: %s...", CYAN, current_fingerprint[:80])
+                    log.debug("%s Recent fingerprints: %s", CYAN,
+                              [fp[:40] + '...' if len(fp) > 40 else fp for fp in recent_tail[-3:]])
+                if len(recent_tail) >= max_loop_detection_count:
                     # Check if last N fingerprints are the same
-                    recent_same = all(fp == current_fingerprint for fp in recent_profile_fingerprints[-max_loop_detection_count:])
+                    recent_same = all(fp == current_fingerprint for fp in recent_tail[-max_loop_detection_count:])
                     if recent_same:
                         print(f"{RED} ERROR: Infinite loop detected - same profile extracted {max_loop_detection_count} times consecutively")
                         safe_print(f"{YELLOW} Fingerprint: {current_fingerprint}")
                         
-                        # Save HTML for debugging
-                        html_file = save_stuck_profile_html(browser, profile_count)
+                        # Save HTML for debugging (opt-in via --debug)
+                        html_file = save_stuck_profile_html(browser, profile_count) if _DEBUG_DUMPS else ""
+
                         
                         # Restart browser if enabled and under limit
                         if restart_count < max_restarts:
@@ -2770,10 +3782,10 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                             try:
                                 browser = restart_browser(browser, cookie_file, headless, location, chrome_version)
                                 # Clear fingerprint history after restart
-                                recent_profile_fingerprints = []
+                                recent_profile_fingerprints.clear()
                                 consecutive_failures = 0
                                 print(f"{GREEN} Browser restarted successfully, continuing...")
-                                time.sleep(5)  # Wait for page to load
+                                _wait_for_encounters_card(browser, 10)
                                 continue  # Skip to next iteration
                             except Exception as e:
                                 print(f"{RED} Browser restart failed: {e}")
@@ -2784,50 +3796,47 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                             break
                 
                 # Add current fingerprint to recent list (keep last 5)
-                recent_profile_fingerprints.append(current_fingerprint)
-                if len(recent_profile_fingerprints) > 5:
-                    recent_profile_fingerprints.pop(0)
+                recent_profile_fingerprints.append(current_fingerprint)  # maxlen=5 evicts the oldest
+            
+            if profile_data and profile_data.get("_duplicate"):
+                # Already extracted this profile - swipe past it without re-saving
+                print(f"{CYAN} Skipping duplicate profile, moving to next...")
+                if no_swipe:
+                    print(f"{CYAN} No-swipe mode: Cannot move past duplicate without swiping")
+                    break
+                swipe_success = swipe_left(browser) if dislike else swipe_right(browser)
+                if not swipe_success:
+                    handle_match_popup(browser)
+                time.sleep(delay)
+                continue
             
             if not profile_data:
                 consecutive_failures += 1
                 print(f"{YELLOW} Warning: Could not extract profile data - no profile visible (failure {consecutive_failures}/{max_consecutive_failures})")
                 
                 # Check if we hit the daily swipe limit (vote quota)
-                try:
-                    blocker_elem = browser.find_element(By.CSS_SELECTOR, '.encounters-user__blocker, [data-qa-role="encounters-blocker-vote-quota"]')
-                    if blocker_elem and blocker_elem.is_displayed():
-                        # Check for the specific limit message
-                        try:
-                            title_elem = blocker_elem.find_element(By.CSS_SELECTOR, '[data-qa-role="cta-box-title"], .cta-box__title')
-                            title_text = title_elem.text.lower() if title_elem else ""
-                            if 'end of the line' in title_text or 'hit the end' in title_text:
-                                print(f"{CYAN} Daily swipe limit reached: 'You've hit the end of the line — for today!'")
-                                print(f"{CYAN} Successfully extracted {profile_count} profile(s) before hitting limit")
-                                daily_limit_hit = True
-                                break
-                        except:
-                            # If we found the blocker element, it's likely the limit
-                            print(f"{CYAN} Daily swipe limit detected (encounters-blocker-vote-quota)")
-                            print(f"{CYAN} Successfully extracted {profile_count} profile(s) before hitting limit")
-                            daily_limit_hit = True
-                            break
-                except NoSuchElementException:
-                    pass  # Blocker not found, continue with other checks
-                except Exception as e:
-                    print(f"{YELLOW} Error checking for swipe limit: {e}")
+                blocker = check_daily_limit(browser)
+                if blocker and blocker.get('visible'):
+                    title_text = blocker.get('title', '')
+                    if 'end of the line' in title_text or 'hit the end' in title_text:
+                        print(f"{CYAN} Daily swipe limit reached: 'You've hit the end of the line — for today!'")
+                    else:
+                        # Blocker present without the expected title - still the limit
+                        print(f"{CYAN} Daily swipe limit detected (encounters-blocker-vote-quota)")
+                    print(f"{CYAN} Successfully extracted {profile_count} profile(s) before hitting limit")
+                    daily_limit_hit = True
+                    break
                 
-                # Check if we hit the end (no more profiles)
-                page_source = browser.page_source.lower()
-                end_indicators = [
-                    'no more profiles', 'out of people', 'no one new', 
-                    'no one around', 'all caught up', 'see you tomorrow',
-                    'come back tomorrow', 'no matches', 'empty state',
-                    'end of the line', 'hit the end', 'vote quota',
-                    'upgrade to bumble boost', 'wait until tomorrow'
-                ]
-                if any(indicator in page_source for indicator in end_indicators):
+                # Check if we hit the end (no more profiles). The probe runs
+                # in-page against the visible text, returning only the matched
+                # indicators instead of the whole DOM serialization.
+                try:
+                    matched_indicators = browser.execute_script(_END_STATE_JS, _END_INDICATORS) or []
+                except Exception:
+                    matched_indicators = []
+                if matched_indicators:
                     # Check if it's a daily limit (vote quota, end of the line)
-                    if any(indicator in page_source for indicator in ['end of the line', 'hit the end', 'vote quota', 'wait until tomorrow']):
+                    if not _DAILY_LIMIT_INDICATORS.isdisjoint(matched_indicators):
                         daily_limit_hit = True
                         print(f"{CYAN} Daily limit detected in page content")
                     print(f"{CYAN} No more profiles available (detected end state)")
@@ -2892,33 +3901,58 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                         time.sleep(delay)
                     time.sleep(1)
                     continue
+                # Strip the internal fingerprint before anything persists the dict
+                profile_data.pop("_fingerprint", None)
+
+                # Bind the display fields once per profile instead of paying
+                # a dict lookup at every message below
+                name_display = profile_data.get('name', 'Unknown')
+                age_display = profile_data.get('age', '?')
+                name_placeholder = profile_data.get('_name_placeholder')
+
                 # STEP 0: Upload images to S3 if enabled (do this before any saving)
                 if s3_handler and profile_data.get('image_urls'):
                     try:
                         profile_data = s3_handler.process_profile_images(profile_data)
                     except Exception as e:
-                        print(f"{YELLOW} S3 upload failed for {profile_data.get('name', 'Unknown')}: {e}")
+                        print(f"{YELLOW} S3 upload failed for {name_display}: {e}")
                         # Continue with original URLs as fallback
                         profile_data['s3_image_urls'] = profile_data.get('image_urls', [])
                 
-                # STEP 1: Save to JSON immediately (backup) - ALWAYS do this first
+                # STEP 1: Save to JSON immediately (backup) - ALWAYS do this first.
+                # JSONL targets are queued to the background worker (which
+                # appends and prints status); legacy array targets would pay a
+                # full read-modify-rewrite per profile, so they flush the
+                # in-memory list every 10 profiles (plus atexit and final save).
                 json_saved = False
                 if json_backup_file:
-                    json_saved = save_profile_to_json(profile_data, json_backup_file)
-                    if json_saved:
-                        name_display = profile_data.get('name', 'Unknown')
-                        if profile_data.get("_name_placeholder"):
-                            safe_print(f"{CYAN} [SAVE] Saved to JSON backup (placeholder name): {name_display} ({profile_data.get('age', '?')})")
+                    if jsonl_writer is not None and save_queue is not None:
+                        save_queue.put(('backup', dict(profile_data)))
+                        # Worker reports per-profile status; failed appends
+                        # land in backup_failures and are checked at the drain
+                        json_saved = True
+                    elif json_backup_file.endswith('.jsonl'):
+                        json_saved = save_profile_to_json(profile_data, json_backup_file)
+                    elif (profile_count + 1) % 10 == 0:
+                        json_saved = flush_profiles_to_json(all_profiles + [profile_data], json_backup_file)
+                    else:
+                        json_saved = True  # Buffered in all_profiles until the next flush
+                    if jsonl_writer is not None:
+                        pass  # Status printed by the background worker
+                    elif json_saved:
+                        if name_placeholder:
+                            safe_print(f"{CYAN} [SAVE] Saved to JSON backup (placeholder name): {name_display} ({age_display})")
                         else:
-                            safe_print(f"{CYAN} [SAVE] Saved to JSON backup: {name_display} ({profile_data.get('age', '?')})")
+                            safe_print(f"{CYAN} [SAVE] Saved to JSON backup: {name_display} ({age_display})")
                     else:
-                        safe_print(f"{RED} [FAIL] Failed to save {profile_data.get('name', 'Unknown')} to JSON backup")
-                
-                # STEP 2: Save to Notion if enabled (after JSON backup)
-                notion_saved = False
-                if save_to_notion:
-                    notion_saved = save_profile_to_notion(profile_data, merge_duplicates=merge_duplicates, force_save=force_save)
-                    # Note: save_profile_to_notion already prints status messages
+                        safe_print(f"{RED} [FAIL] Failed to save {name_display} to JSON backup")
+                if not json_saved:
+                    incremental_ok = False
+
+                # STEP 2: Queue for Notion if enabled (after JSON backup);
+                # the background worker saves and prints status messages
+                if save_to_notion and save_queue is not None:
+                    save_queue.put(('notion', dict(profile_data)))
                 
                 # Always add to list for final JSON save (redundancy)
                 all_profiles.append(profile_data)
@@ -2926,11 +3960,10 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                 
                 if not save_to_notion and not json_backup_file:
                     # Only print extraction message if neither Notion nor JSON backup is enabled
-                    name_display = profile_data.get('name', 'Unknown')
-                    if profile_data.get("_name_placeholder"):
-                        print(f"{GREEN} Extracted (placeholder name): {name_display} ({profile_data.get('age', '?')})")
+                    if name_placeholder:
+                        print(f"{GREEN} Extracted (placeholder name): {name_display} ({age_display})")
                     else:
-                        print(f"{GREEN} Extracted: {name_display} ({profile_data.get('age', '?')})")
+                        print(f"{GREEN} Extracted: {name_display} ({age_display})")
             else:
                 print(f"{RED} ERROR: Profile data is None or missing name - this should not happen after placeholder generation")
                 consecutive_failures += 1
@@ -2966,28 +3999,28 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
             else:
                 # Swipe to see next profile
                 if dislike:
-                    print(f"{CYAN} Swiping left (dislike) on profile {profile_count}...")
+                    safe_print(f"{CYAN} Swiping left (dislike) on profile {profile_count}...")
                     swipe_success = swipe_left(browser)
                 else:
-                    print(f"{CYAN} Swiping right (like) on profile {profile_count}...")
+                    safe_print(f"{CYAN} Swiping right (like) on profile {profile_count}...")
                     swipe_success = swipe_right(browser)
                 
                 if not swipe_success:
                     print(f"{YELLOW} Warning: Swipe failed - profile may have already been swiped")
                 
-                # Wait for next profile to load
-                time.sleep(delay)
-                
-                # Add random delay variation (0-1 second) to appear more human-like
-                if delay > 0:
-                    random_delay = random.uniform(0, min(1.0, delay * 0.5))
-                    time.sleep(random_delay)
-                
+                # One sleep against a target timestamp instead of three stacked
+                # stalls (delay + jitter + fixed 1s): the popup check runs
+                # inside the window, so its round trip overlaps the wait and
+                # clock drift between calls no longer adds up
+                jitter = random.uniform(0, min(1.0, delay * 0.5)) if delay > 0 else 0.0
+                target = time.monotonic() + delay + jitter
+
                 # Handle match popup if it appears
                 handle_match_popup(browser)
-                
-                # Wait a bit more for new profile to load
-                time.sleep(1)
+
+                remaining = target - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
         
         # Save all profiles
         if not all_profiles:
@@ -2999,7 +4032,18 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                 raise RuntimeError("No profiles extracted")
         
         print(f"{GREEN} Successfully extracted {len(all_profiles)} profile(s)")
-        
+
+        # Drain the background worker before consolidating so every queued
+        # backup line and Notion upload has landed
+        if save_queue is not None:
+            print(f"{CYAN} Waiting for pending background saves to finish...")
+            save_queue.join()
+            save_queue.put(None)
+            if backup_failures:
+                # The JSONL file has gaps; fall through to the full rewrite
+                print(f"{YELLOW} {len(backup_failures)} backup append(s) failed; forcing final rewrite")
+                incremental_ok = False
+
         # Final JSON save (redundancy check - profiles should already be saved incrementally)
         # This ensures we have a complete file even if incremental saves failed
         if output_format == 'json':
@@ -3010,39 +4054,34 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                 suffix = '_backup' if save_to_notion else ''
                 final_json_file = f"bumble_profiles_{timestamp}{suffix}.json"
             
-            # Final save to ensure completeness
-            try:
-                with open(final_json_file, 'w', encoding='utf-8') as f:
-                    json.dump(all_profiles, f, indent=2, ensure_ascii=False)
-                print(f"{GREEN} Final JSON backup saved: {final_json_file} ({len(all_profiles)} profiles)")
-            except Exception as e:
-                print(f"{YELLOW} Warning: Could not save final JSON backup: {e}")
+            # Final save only when the incremental writes left gaps: if every
+            # profile already landed, the end-of-run rewrite is dead work
+            if final_json_file.endswith('.jsonl'):
+                if incremental_ok:
+                    print(f"{GREEN} JSONL backup verified complete; skipping redundant consolidation")
+                else:
+                    # Some appends failed, so the JSONL on disk is incomplete;
+                    # write the authoritative in-memory list instead of
+                    # consolidating the file with the gaps
+                    consolidated = final_json_file[:-len('.jsonl')] + '.json'
+                    try:
+                        _atomic_write_bytes(consolidated, _dumps_indent_bytes(all_profiles))
+                        print(f"{GREEN} Final JSON backup saved: {consolidated} ({len(all_profiles)} profiles)")
+                    except Exception as e:
+                        print(f"{YELLOW} Warning: Could not save final JSON backup: {e}")
+            elif incremental_ok and profile_count % 10 == 0 and json_backup_file:
+                # The every-10 flush covered the whole list, nothing unflushed
+                print(f"{GREEN} JSON backup verified complete; skipping redundant rewrite")
+            else:
+                try:
+                    _atomic_write_bytes(final_json_file, _dumps_indent_bytes(all_profiles))
+                    print(f"{GREEN} Final JSON backup saved: {final_json_file} ({len(all_profiles)} profiles)")
+                except Exception as e:
+                    print(f"{YELLOW} Warning: Could not save final JSON backup: {e}")
             
             output_file = final_json_file
         else:  # CSV
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                if all_profiles:
-                    fieldnames = [
-                        'extracted_at', 'name', 'age', 'bio', 'job', 'education', 
-                        'location', 'from_location', 'preferences', 'badges', 
-                        'question_answers', 'spotify_artists', 'image_urls'
-                    ]
-                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                    writer.writeheader()
-                    for profile in all_profiles:
-                        # Convert lists/dicts to strings for CSV
-                        row = profile.copy()
-                        if 'image_urls' in row and isinstance(row['image_urls'], list):
-                            row['image_urls'] = '; '.join(row['image_urls'])
-                        if 'badges' in row and isinstance(row['badges'], list):
-                            row['badges'] = '; '.join(row['badges'])
-                        if 'spotify_artists' in row and isinstance(row['spotify_artists'], list):
-                            row['spotify_artists'] = '; '.join(row['spotify_artists'])
-                        if 'question_answers' in row and isinstance(row['question_answers'], dict):
-                            # Convert dict to string format: "Q1: A1 | Q2: A2"
-                            qa_pairs = [f"{q}: {a}" for q, a in row['question_answers'].items()]
-                            row['question_answers'] = ' | '.join(qa_pairs)
-                        writer.writerow(row)
+            _write_profiles_csv(output_file, all_profiles)
         
         if output_format == 'json':
             print(f"{GREEN} JSON backup file: {output_file}")
@@ -3061,6 +4100,12 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
         
     except KeyboardInterrupt:
         print(f"\n{YELLOW} Interrupted by user")
+        if save_queue is not None:
+            # Best-effort bounded drain so queued saves land before we
+            # consolidate; don't hang forever if the worker is stuck mid-retry
+            deadline = time.time() + 5
+            while not save_queue.empty() and time.time() < deadline:
+                time.sleep(0.1)
         if all_profiles:
             print(f"{CYAN} Saving {len(all_profiles)} profile(s) extracted so far...")
             # Use existing JSON backup file if available, otherwise create partial file
@@ -3070,30 +4115,28 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                     partial_file = f"bumble_profiles_{timestamp}_partial.json"
                 # Final save of all profiles to ensure completeness
-                try:
-                    with open(partial_file, 'w', encoding='utf-8') as f:
-                        json.dump(all_profiles, f, indent=2, ensure_ascii=False)
-                    print(f"{GREEN} Partial JSON backup saved: {partial_file} ({len(all_profiles)} profiles)")
-                except Exception as e:
-                    print(f"{YELLOW} Warning: Could not save partial JSON backup: {e}")
+                if partial_file.endswith('.jsonl'):
+                    consolidated = convert_jsonl_to_json(partial_file)
+                    if consolidated:
+                        print(f"{GREEN} Partial JSON backup saved: {consolidated} ({len(all_profiles)} profiles)")
+                else:
+                    try:
+                        _atomic_write_bytes(partial_file, _dumps_indent_bytes(all_profiles))
+                        print(f"{GREEN} Partial JSON backup saved: {partial_file} ({len(all_profiles)} profiles)")
+                    except Exception as e:
+                        print(f"{YELLOW} Warning: Could not save partial JSON backup: {e}")
             else:
-                with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                    if all_profiles:
-                        fieldnames = ['extracted_at', 'name', 'age', 'bio', 'job', 'education', 'location', 'preferences', 'image_urls']
-                        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                        writer.writeheader()
-                        for profile in all_profiles:
-                            row = profile.copy()
-                            if 'image_urls' in row and isinstance(row['image_urls'], list):
-                                row['image_urls'] = '; '.join(row['image_urls'])
-                            writer.writerow(row)
+                _write_profiles_csv(output_file, all_profiles, _CSV_PARTIAL_FIELDNAMES)
             print(f"{GREEN} Partial data saved to: {output_file}")
     except Exception as e:
         print(f"{RED} Error scraping profiles: {e}")
-        import traceback
         traceback.print_exc()
         raise RuntimeError(f"Error scraping profiles: {e}") from e
     finally:
+        if jsonl_writer is not None:
+            jsonl_writer.close()
+        if _NOTION_WRITER is not None:
+            _NOTION_WRITER.close()
         if browser:
             if keep_browser_open:
                 print(f"{CYAN} Keeping browser open for debugging (use --keep-browser-open to auto-close)")
@@ -3105,6 +4148,11 @@ def scrape_profiles(cookie_file: str = None, limit: int = None, delay: float = 1
                 except KeyboardInterrupt:
                     print(f"\n{CYAN} Closing browser...")
                     browser.quit()
+            elif worker_slot is not None:
+                # Park for the next invocation of this worker; atexit quits
+                # whatever is still parked when the process ends
+                print(f"{CYAN} Parking browser for worker {worker_slot} reuse")
+                _DRIVER_CACHE[worker_slot] = browser
             else:
                 print(f"{CYAN} Closing browser...")
                 browser.quit()
@@ -3154,6 +4202,8 @@ def main():
                         help='Force Chrome major version for matching ChromeDriver (e.g., 144)')
     parser.add_argument('--login', action='store_true', default=False,
                         help='Open browser for manual login and save cookies (ignores other flags)')
+    parser.add_argument('--debug', action='store_true', default=False,
+                        help='Write page/profile HTML dumps to disk for debugging (large files)')
     
     args = parser.parse_args()
     
@@ -3164,7 +4214,8 @@ def main():
     
     if args.workers > 1:
         print(f"{CYAN} Launching {args.workers} workers in parallel...")
-        # Convert args to dict for pickling
+        # Convert args to dict for pickling; workers treat it as read-only
+        # and merge into a local dict, so one shared dict serves them all
         args_dict = vars(args)
         # Ensure force_save is passed
         args_dict['force_save'] = args_dict.get('force_save', False)
@@ -3176,7 +4227,7 @@ def main():
             
         with ProcessPoolExecutor(max_workers=args.workers) as executor:
             future_to_worker = {
-                executor.submit(scrape_worker, i, args.workers, args_dict.copy()): i
+                executor.submit(scrape_worker, i, args.workers, args_dict): i
                 for i in range(args.workers)
             }
 
@@ -3216,7 +4267,8 @@ def main():
             force_save=args.force_save,
             login_mode=args.login,
             require_bio=args.require_bio,
-            chrome_version=args.chrome_version
+            chrome_version=args.chrome_version,
+            debug=args.debug
         )
 
 
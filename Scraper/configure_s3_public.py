@@ -1,11 +1,25 @@
 import boto3
+import logging
 import os
 import sys
 import json
 from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Faster serializer, optional
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """Serialize to a JSON string, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
 def configure_public_access():
     # Load env from backend root
     backend_root = Path(__file__).resolve().parent.parent.parent.parent
@@ -23,14 +37,32 @@ def configure_public_access():
 
     # Initialize S3 client (try to detect region or default)
     # Most buckets work with generic s3 client, but BPA/Policy often need regional client
-    # Let's try to get location first
-    s3_simple = boto3.client('s3', aws_access_key_id=access_key, aws_secret_access_key=secret_key)
-    try:
-        location = s3_simple.get_bucket_location(Bucket=bucket)['LocationConstraint']
-        region = location if location else 'us-east-1'
-    except:
-        region = 'us-east-1'
-        
+    # Region resolution needs a throwaway bootstrap client, so cache the
+    # answer: S3_REGION env var first, then a dotfile next to .env, and only
+    # probe get_bucket_location when both miss (once per bucket, not per run)
+    region_cache = backend_root / '.region-cache'
+    region = os.environ.get('S3_REGION')
+    if not region and region_cache.exists():
+        try:
+            region = region_cache.read_text().strip() or None
+        except OSError:
+            region = None
+    if not region:
+        s3_simple = boto3.client('s3', aws_access_key_id=access_key, aws_secret_access_key=secret_key)
+        try:
+            location = s3_simple.get_bucket_location(Bucket=bucket)['LocationConstraint']
+            region = location if location else 'us-east-1'
+        except ClientError as e:
+            # Narrow catch: don't swallow KeyboardInterrupt/SystemExit or
+            # hide credential-resolution bugs behind the default region
+            logging.getLogger(__name__).debug("get_bucket_location failed: %s", e)
+            region = 'us-east-1'
+        try:
+            region_cache.write_text(region)
+        except OSError:
+            pass
+
+
     print(f"[*] Target Region: {region}")
     s3 = boto3.client(
         's3',
@@ -39,9 +71,26 @@ def configure_public_access():
         region_name=region
     )
 
+    policy = {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Sid": "PublicReadGetObject",
+                "Effect": "Allow",
+                "Principal": "*",
+                "Action": "s3:GetObject",
+                "Resource": f"arn:aws:s3:::{bucket}/*"
+            }
+        ]
+    }
+
     print(f"[*] Attempting to disable 'Block Public Access' for bucket: {bucket}")
-    try:
-        s3.put_public_access_block(
+    print(f"[*] Attempting to apply Public Read bucket policy...")
+    # The two mutations are independent requests to the same endpoint;
+    # issuing them concurrently makes setup latency max(t1, t2) not t1 + t2
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        bpa_future = ex.submit(
+            s3.put_public_access_block,
             Bucket=bucket,
             PublicAccessBlockConfiguration={
                 'BlockPublicAcls': False,
@@ -50,28 +99,30 @@ def configure_public_access():
                 'RestrictPublicBuckets': False
             }
         )
+        policy_future = ex.submit(s3.put_bucket_policy, Bucket=bucket, Policy=_dumps(policy))
+
+    bpa_ok = True
+    try:
+        bpa_future.result()
         print("✅ SUCCESS: Block Public Access disabled.")
     except ClientError as e:
+        bpa_ok = False
         print(f"❌ FAILED to disable Block Public Access: {e}")
         print("   (This usually means your credentials don't have 's3:PutBucketPublicAccessBlock' permission)")
 
-    print(f"\n[*] Attempting to apply Public Read bucket policy...")
-    policy = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Sid": "PublicReadGetObject",
-                "Effect": "Allow",
-                "Principal": "*",
-                "Action": "s3:GetObject",
-                "Resource": f"arn:aws:s3:::{bucket}/*"
-            }
-        ]
-    }
     try:
-        s3.put_bucket_policy(Bucket=bucket, Policy=json.dumps(policy))
+        policy_future.result()
         print("✅ SUCCESS: Bucket policy updated to ALLOW PUBLIC READ.")
     except ClientError as e:
+        # If the policy landed while Block Public Access was still flipping
+        # off, one retry after it has completed usually succeeds
+        if bpa_ok:
+            try:
+                s3.put_bucket_policy(Bucket=bucket, Policy=_dumps(policy))
+                print("✅ SUCCESS: Bucket policy updated to ALLOW PUBLIC READ (on retry).")
+                return
+            except ClientError:
+                pass
         print(f"❌ FAILED to update bucket policy: {e}")
         print("   (This usually means your credentials don't have 's3:PutBucketPolicy' permission)")
 
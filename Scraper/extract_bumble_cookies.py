@@ -12,10 +12,17 @@ from glob import glob
 from os.path import expanduser, exists, join
 import os
 from platform import system
+from concurrent.futures import ThreadPoolExecutor
 from sqlite3 import OperationalError, connect
+from urllib.parse import quote
 import json
 import sys
 
+try:
+    import orjson  # Faster serializer, optional
+except ImportError:
+    orjson = None
+
 # Color output (simple ASCII for cross-platform compatibility)
 GREEN = "[OK]"
 RED = "[X]"
@@ -23,222 +30,233 @@ YELLOW = "[!]"
 CYAN = "[*]"
 
 
-def has_bumble_cookies(cookiefile, is_firefox=True):
-    """Check if a cookie file contains Bumble cookies."""
+# Platform and browser locations never change within a run, so resolve them
+# once at import instead of per get_*_cookie_files call
+_PLATFORM = system()
+_HOME = expanduser("~")
+
+
+def _expand(path):
+    """Expand a leading ~/ against the home dir cached at import."""
+    return join(_HOME, path[2:]) if path.startswith("~/") else path
+
+if _PLATFORM == "Windows":
+    _FIREFOX_PROFILE_DIRS = [
+        "~/AppData/Roaming/Mozilla/Firefox/Profiles",
+        "~/AppData/Roaming/Mozilla/Firefox Developer Edition/Profiles",
+    ]
+    _CHROME_BASE_PATHS = ["~/AppData/Local/Google/Chrome/User Data"]
+    _EDGE_BASE_PATHS = ["~/AppData/Local/Microsoft/Edge/User Data"]
+elif _PLATFORM == "Darwin":  # macOS
+    _FIREFOX_PROFILE_DIRS = [
+        "~/Library/Application Support/Firefox/Profiles",
+        "~/Library/Application Support/Firefox Developer Edition/Profiles",
+    ]
+    _CHROME_BASE_PATHS = ["~/Library/Application Support/Google/Chrome"]
+    _EDGE_BASE_PATHS = ["~/Library/Application Support/Microsoft Edge"]
+else:  # Linux
+    _FIREFOX_PROFILE_DIRS = [
+        "~/.mozilla/firefox",
+        "~/.mozilla/firefox-developer-edition",
+    ]
+    _CHROME_BASE_PATHS = ["~/.config/google-chrome"]
+    _EDGE_BASE_PATHS = ["~/.config/microsoft-edge"]
+
+
+# Raw Bumble cookie rows cached per (path, mtime, schema) so detection and
+# extraction share one SQLite open per database instead of two
+_PROBE_CACHE = {}
+
+# Modern Firefox schema has a baseDomain column; older ones only have host.
+# One PRAGMA table_info decides which predicate applies, so each database
+# gets exactly one prepared SELECT instead of a try/except query ladder.
+_FIREFOX_BASEDOMAIN_QUERY = "SELECT name, value, host, path, expiry, isSecure, isHttpOnly FROM moz_cookies WHERE (baseDomain='bumble.com' OR baseDomain='.bumble.com') LIMIT 500"
+_FIREFOX_HOST_QUERY = "SELECT name, value, host, path, expiry, isSecure, isHttpOnly FROM moz_cookies WHERE host LIKE '%bumble.com' LIMIT 500"
+
+# host_key LIKE '%bumble.com' is a superset of the exact-host and dot-prefix
+# matches the old three-query fallback covered
+_CHROME_EDGE_QUERY = "SELECT name, value, host_key, path, expires_utc, is_secure, is_httponly FROM cookies WHERE host_key LIKE '%bumble.com' LIMIT 500"
+
+
+def _open_ro(path):
+    """
+    Open a cookie database strictly read-only. mode=ro + immutable=1 + nolock=1
+    disables file locking and -wal/-journal sidecar probing entirely, which is
+    the bulk of the fixed cost when probing many profile databases we never
+    write to.
+    """
+    conn = connect(
+        f"file:{quote(path)}?immutable=1&mode=ro&nolock=1&cache=shared",
+        uri=True,
+        check_same_thread=False,
+    )
+    # sqlite3.execute takes one statement at a time, so apply PRAGMAs separately
+    for pragma in ("PRAGMA query_only=1", "PRAGMA temp_store=MEMORY", "PRAGMA mmap_size=67108864"):
+        try:
+            conn.execute(pragma)
+        except OperationalError:
+            pass
+    return conn
+
+
+def _probe(cookiefile, is_firefox=True):
+    """
+    Open a cookie database once and fetch the raw Bumble rows, caching the
+    result by (path, mtime) so detection and extraction don't both pay the
+    SQLite open + scan. Returns a (possibly empty) row list, or None on error.
+    """
     try:
-        if is_firefox:
-            conn = connect(f"file:{cookiefile}?immutable=1", uri=True)
-            try:
-                # Try modern Firefox cookie schema first - check for Bumble cookies
-                result = conn.execute(
-                    "SELECT COUNT(*) FROM moz_cookies WHERE baseDomain='bumble.com' OR baseDomain='.bumble.com'"
-                ).fetchone()
-                if result and result[0] > 0:
-                    return True
-            except OperationalError:
-                # Fallback to host-based query
-                result = conn.execute(
-                    "SELECT COUNT(*) FROM moz_cookies WHERE host LIKE '%bumble.com'"
-                ).fetchone()
-                if result and result[0] > 0:
-                    return True
-        else:
-            # Chrome/Edge cookie schema
-            conn = connect(f"file:{cookiefile}?immutable=1", uri=True)
-            result = conn.execute(
-                "SELECT COUNT(*) FROM cookies WHERE host_key LIKE '%bumble.com'"
-            ).fetchone()
-            if result and result[0] > 0:
-                return True
-        conn.close()
+        cache_key = (cookiefile, os.path.getmtime(cookiefile), is_firefox)
+    except OSError:
+        cache_key = None
+    if cache_key is not None and cache_key in _PROBE_CACHE:
+        return _PROBE_CACHE[cache_key]
+
+    try:
+        conn = _open_ro(cookiefile)
+        try:
+            if is_firefox:
+                columns = {col[1] for col in conn.execute("PRAGMA table_info(moz_cookies)").fetchall()}
+                query = _FIREFOX_BASEDOMAIN_QUERY if 'baseDomain' in columns else _FIREFOX_HOST_QUERY
+            else:
+                query = _CHROME_EDGE_QUERY
+            rows = conn.execute(query).fetchall()
+        finally:
+            conn.close()
     except Exception:
         # Silently fail - don't print warnings during discovery
-        pass
-    return False
+        return None
+    if cache_key is not None:
+        _PROBE_CACHE[cache_key] = rows
+    return rows
 
 
-def get_firefox_cookie_files():
-    """Get Firefox cookie files, checking both regular Firefox and Firefox Developer Edition."""
-    platform = system()
-    
-    # Define all possible Firefox profile locations
-    if platform == "Windows":
-        cookie_patterns = [
-            "~/AppData/Roaming/Mozilla/Firefox/Profiles/*/cookies.sqlite",
-            "~/AppData/Roaming/Mozilla/Firefox Developer Edition/Profiles/*/cookies.sqlite",
-        ]
-    elif platform == "Darwin":  # macOS
-        cookie_patterns = [
-            "~/Library/Application Support/Firefox/Profiles/*/cookies.sqlite",
-            "~/Library/Application Support/Firefox Developer Edition/Profiles/*/cookies.sqlite",
-        ]
-    else:  # Linux
-        cookie_patterns = [
-            "~/.mozilla/firefox/*/cookies.sqlite",
-            "~/.mozilla/firefox-developer-edition/*/cookies.sqlite",
-        ]
-    
-    # Collect all cookie files from all locations
-    all_cookiefiles = []
-    for pattern in cookie_patterns:
-        found_files = glob(expanduser(pattern))
-        all_cookiefiles.extend(found_files)
-    
-    if not all_cookiefiles:
-        return []
-    
-    # Prioritize cookie files that contain Bumble cookies
+def has_bumble_cookies(cookiefile, is_firefox=True):
+    """Check if a cookie file contains Bumble cookies."""
+    return bool(_probe(cookiefile, is_firefox=is_firefox))
+
+
+def _prioritize_by_bumble(cookie_files, is_firefox):
+    """
+    Probe the candidate databases concurrently and return the list with
+    Bumble-bearing files first. Each probe is an independent SQLite open plus
+    a small SELECT that blocks on I/O, so a thread pool collapses the wall
+    time to roughly the slowest single open; results land in _PROBE_CACHE,
+    making the later extraction pass free.
+    """
+    if len(cookie_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(cookie_files))) as executor:
+            results = list(executor.map(lambda f: _probe(f, is_firefox=is_firefox), cookie_files))
+    else:
+        results = [_probe(f, is_firefox=is_firefox) for f in cookie_files]
+
     prioritized = []
     others = []
-    
-    for cookiefile in all_cookiefiles:
-        if has_bumble_cookies(cookiefile, is_firefox=True):
+    for cookiefile, rows in zip(cookie_files, results):
+        if rows:
             prioritized.append(cookiefile)
         else:
             others.append(cookiefile)
-    
     return prioritized + others
 
 
-def get_chrome_cookie_files():
-    """Get Chrome cookie files from all profile directories."""
-    platform = system()
-    
-    if platform == "Windows":
-        base_paths = [
-            "~/AppData/Local/Google/Chrome/User Data",
-        ]
-    elif platform == "Darwin":  # macOS
-        base_paths = [
-            "~/Library/Application Support/Google/Chrome",
-        ]
-    else:  # Linux
-        base_paths = [
-            "~/.config/google-chrome",
-        ]
+def get_firefox_cookie_files():
+    """Get Firefox cookie files, checking both regular Firefox and Firefox Developer Edition."""
+    # Collect all cookie files from all locations. One scandir pass per
+    # Profiles dir replaces the glob walks: is_dir() reuses dirent data, so
+    # each candidate costs a single stat on cookies.sqlite
+    all_cookiefiles = []
+    seen = set()
+    for profile_base in _FIREFOX_PROFILE_DIRS:
+        profiles_dir = _expand(profile_base)
+        try:
+            entries = os.scandir(profiles_dir)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                candidate = join(entry.path, "cookies.sqlite")
+                if candidate not in seen and os.path.isfile(candidate):
+                    seen.add(candidate)
+                    all_cookiefiles.append(candidate)
+
+    if not all_cookiefiles:
+        return []
     
+    # Prioritize cookie files that contain Bumble cookies
+    return _prioritize_by_bumble(all_cookiefiles, is_firefox=True)
+
+
+def _chromium_cookie_files(base_paths):
+    """
+    Collect Cookies databases from Chromium-style profile layouts (Default
+    plus 'Profile *' directories) with one scandir pass per base path and a
+    single stat per candidate, deduplicated across overlapping matches.
+    """
     cookie_files = []
+    seen = set()
     for base_path in base_paths:
-        expanded_base = expanduser(base_path)
-        if not exists(expanded_base):
+        expanded_base = _expand(base_path)
+        try:
+            entries = os.scandir(expanded_base)
+        except OSError:
             continue
-        
-        # Check Default profile first
-        default_cookies = expanduser(f"{base_path}/Default/Cookies")
-        if exists(default_cookies):
-            cookie_files.append(default_cookies)
-        
-        # Check other profiles
-        profile_pattern = expanduser(f"{base_path}/Profile */Cookies")
-        cookie_files.extend(glob(profile_pattern))
-        
-        # Also check numbered profiles
-        numbered_pattern = expanduser(f"{base_path}/Profile [0-9]*/Cookies")
-        cookie_files.extend(glob(numbered_pattern))
-    
+        with entries:
+            profile_dirs = []
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name == "Default":
+                    # Default profile keeps priority over the numbered ones
+                    profile_dirs.insert(0, entry.path)
+                elif entry.name.startswith("Profile "):
+                    profile_dirs.append(entry.path)
+        for profile_dir in profile_dirs:
+            candidate = join(profile_dir, "Cookies")
+            if candidate not in seen and os.path.isfile(candidate):
+                seen.add(candidate)
+                cookie_files.append(candidate)
+    return cookie_files
+
+
+def get_chrome_cookie_files():
+    """Get Chrome cookie files from all profile directories."""
+    cookie_files = _chromium_cookie_files(_CHROME_BASE_PATHS)
+
     # Prioritize cookie files that contain Bumble cookies
-    prioritized = []
-    others = []
-    
-    for cookiefile in cookie_files:
-        if has_bumble_cookies(cookiefile, is_firefox=False):
-            prioritized.append(cookiefile)
-        else:
-            others.append(cookiefile)
-    
-    return prioritized + others
+    return _prioritize_by_bumble(cookie_files, is_firefox=False)
 
 
 def get_edge_cookie_files():
     """Get Edge cookie files from all profile directories."""
-    platform = system()
-    
-    if platform == "Windows":
-        base_paths = [
-            "~/AppData/Local/Microsoft/Edge/User Data",
-        ]
-    elif platform == "Darwin":  # macOS
-        base_paths = [
-            "~/Library/Application Support/Microsoft Edge",
-        ]
-    else:  # Linux
-        base_paths = [
-            "~/.config/microsoft-edge",
-        ]
-    
-    cookie_files = []
-    for base_path in base_paths:
-        expanded_base = expanduser(base_path)
-        if not exists(expanded_base):
-            continue
-        
-        # Check Default profile first
-        default_cookies = expanduser(f"{base_path}/Default/Cookies")
-        if exists(default_cookies):
-            cookie_files.append(default_cookies)
-        
-        # Check other profiles
-        profile_pattern = expanduser(f"{base_path}/Profile */Cookies")
-        cookie_files.extend(glob(profile_pattern))
-        
-        # Also check numbered profiles
-        numbered_pattern = expanduser(f"{base_path}/Profile [0-9]*/Cookies")
-        cookie_files.extend(glob(numbered_pattern))
-    
+    cookie_files = _chromium_cookie_files(_EDGE_BASE_PATHS)
+
     # Prioritize cookie files that contain Bumble cookies
-    prioritized = []
-    others = []
-    
-    for cookiefile in cookie_files:
-        if has_bumble_cookies(cookiefile, is_firefox=False):
-            prioritized.append(cookiefile)
-        else:
-            others.append(cookiefile)
-    
-    return prioritized + others
+    return _prioritize_by_bumble(cookie_files, is_firefox=False)
 
 
 def extract_cookies_from_firefox(cookiefile):
     """Extract Bumble cookies from Firefox cookie database."""
     try:
-        conn = connect(f"file:{cookiefile}?immutable=1", uri=True)
-        
-        # Try multiple query strategies
-        queries = [
-            # Try baseDomain first (modern Firefox schema)
-            "SELECT name, value, host, path, expiry, isSecure, isHttpOnly FROM moz_cookies WHERE (baseDomain='bumble.com' OR baseDomain='.bumble.com')",
-            # Fallback to host-based query
-            "SELECT name, value, host, path, expiry, isSecure, isHttpOnly FROM moz_cookies WHERE (host='bumble.com' OR host='.bumble.com' OR host='www.bumble.com' OR host LIKE '%.bumble.com')",
-            # Try with any Bumble domain
-            "SELECT name, value, host, path, expiry, isSecure, isHttpOnly FROM moz_cookies WHERE host LIKE '%bumble.com'",
-        ]
-        
-        for query in queries:
-            try:
-                cursor = conn.execute(query)
-                rows = cursor.fetchall()
-                
-                if rows:
-                    cookies = []
-                    for row in rows:
-                        cookie = {
-                            'name': row[0],
-                            'value': row[1],
-                            'domain': row[2] if row[2].startswith('.') else f".{row[2]}" if not row[2].startswith('.') and '.' in row[2] else row[2],
-                            'path': row[3] or '/',
-                            'expiry': row[4] if row[4] else None,
-                            'secure': bool(row[5]) if row[5] is not None else True,
-                            'httpOnly': bool(row[6]) if row[6] is not None else False,
-                        }
-                        cookies.append(cookie)
-                    
-                    conn.close()
-                    return cookies
-            except OperationalError:
-                continue
-        
-        conn.close()
-        
+        # Rows come from the shared probe cache: if discovery already opened
+        # this database, extraction reuses the fetched rows for free
+        rows = _probe(cookiefile, is_firefox=True)
+        if rows:
+            cookies = []
+            for row in rows:
+                cookie = {
+                    'name': row[0],
+                    'value': row[1],
+                    'domain': row[2] if row[2].startswith('.') else f".{row[2]}" if not row[2].startswith('.') and '.' in row[2] else row[2],
+                    'path': row[3] or '/',
+                    'expiry': row[4] if row[4] else None,
+                    'secure': bool(row[5]) if row[5] is not None else True,
+                    'httpOnly': bool(row[6]) if row[6] is not None else False,
+                }
+                cookies.append(cookie)
+            return cookies
     except Exception as e:
         print(f"{YELLOW} Warning: Could not extract from Firefox {cookiefile}: {e}")
     return None
@@ -247,56 +265,36 @@ def extract_cookies_from_firefox(cookiefile):
 def extract_cookies_from_chrome_edge(cookiefile):
     """Extract Bumble cookies from Chrome/Edge cookie database."""
     try:
-        # Try read-only access first
-        conn = connect(f"file:{cookiefile}?immutable=1", uri=True)
-        
-        queries = [
-            "SELECT name, value, host_key, path, expires_utc, is_secure, is_httponly FROM cookies WHERE host_key LIKE '%bumble.com'",
-            "SELECT name, value, host_key, path, expires_utc, is_secure, is_httponly FROM cookies WHERE host_key LIKE '%.bumble.com'",
-            "SELECT name, value, host_key, path, expires_utc, is_secure, is_httponly FROM cookies WHERE host_key='www.bumble.com'",
-        ]
-        
-        for query in queries:
-            try:
-                cursor = conn.execute(query)
-                rows = cursor.fetchall()
-                
-                if rows:
-                    cookies = []
-                    for row in rows:
-                        host_key = row[2]
-                        # Chrome/Edge uses host_key directly (no dot prefix needed)
-                        domain = host_key if host_key.startswith('.') else f".{host_key}" if '.' in host_key else host_key
-                        
-                        # Handle encrypted values (Chrome/Edge may encrypt on Windows/macOS)
-                        cookie_value = row[1]
-                        if isinstance(cookie_value, bytes):
-                            try:
-                                cookie_value = cookie_value.decode('utf-8')
-                            except UnicodeDecodeError:
-                                # Value is encrypted, skip this cookie
-                                continue
-                        
-                        cookie = {
-                            'name': row[0],
-                            'value': cookie_value,
-                            'domain': domain,
-                            'path': row[3] or '/',
-                            'expiry': row[4] if row[4] else None,
-                            'secure': bool(row[5]) if row[5] is not None else True,
-                            'httpOnly': bool(row[6]) if row[6] is not None else False,
-                        }
-                        cookies.append(cookie)
-                    
-                    conn.close()
-                    return cookies
-            except OperationalError:
-                continue
-            except Exception:
-                continue
-        
-        conn.close()
-        
+        # Same shared probe cache as Firefox: one open per database
+        rows = _probe(cookiefile, is_firefox=False)
+        if rows:
+            cookies = []
+            for row in rows:
+                host_key = row[2]
+                # Chrome/Edge uses host_key directly (no dot prefix needed)
+                domain = host_key if host_key.startswith('.') else f".{host_key}" if '.' in host_key else host_key
+
+                # Handle encrypted values (Chrome/Edge may encrypt on Windows/macOS)
+                cookie_value = row[1]
+                if isinstance(cookie_value, bytes):
+                    try:
+                        cookie_value = cookie_value.decode('utf-8')
+                    except UnicodeDecodeError:
+                        # Value is encrypted, skip this cookie
+                        continue
+
+                cookie = {
+                    'name': row[0],
+                    'value': cookie_value,
+                    'domain': domain,
+                    'path': row[3] or '/',
+                    'expiry': row[4] if row[4] else None,
+                    'secure': bool(row[5]) if row[5] is not None else True,
+                    'httpOnly': bool(row[6]) if row[6] is not None else False,
+                }
+                cookies.append(cookie)
+            if cookies:
+                return cookies
     except Exception as e:
         print(f"{YELLOW} Warning: Could not extract from Chrome/Edge {cookiefile}: {e}")
     return None
@@ -426,20 +424,34 @@ def extract_bumble_cookies(browser=None, output_file='bumble_cookies.json', quie
         sys.exit(1)
     
     # Check if we got authentication cookies or just load balancer cookies
-    # Bumble uses 'session' as the main authentication cookie
-    auth_cookie_names = ['session', 'BumbleID', 'sessionid', 'access_token', 'id_token', '__cf_bm', 'bumble_session']
-    found_auth_cookies = any(c['name'] in auth_cookie_names for c in cookies)
-    found_only_load_balancer = all(c['name'] in ['AWSALB', 'AWSALBCORS', 'g_state', '_ga', '_gid', 'dnsDisplayed', 'ccpaApplies', 'ccpaConsentAll'] for c in cookies)
+    # Bumble uses 'session' as the main authentication cookie.
+    # One walk over the list covers both checks and the names for the log,
+    # with frozenset membership instead of O(K) list scans per cookie.
+    auth_cookie_names = frozenset(('session', 'BumbleID', 'sessionid', 'access_token', 'id_token', '__cf_bm', 'bumble_session'))
+    load_balancer_names = frozenset(('AWSALB', 'AWSALBCORS', 'g_state', '_ga', '_gid', 'dnsDisplayed', 'ccpaApplies', 'ccpaConsentAll'))
+    cookie_names = []
+    found_auth_cookies = False
+    found_only_load_balancer = True
+    for c in cookies:
+        name = c['name']
+        cookie_names.append(name)
+        if name in auth_cookie_names:
+            found_auth_cookies = True
+        if name not in load_balancer_names:
+            found_only_load_balancer = False
     
     # Save cookies to file
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(cookies, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                f.write(orjson.dumps(cookies, option=orjson.OPT_INDENT_2).decode('utf-8'))
+            else:
+                json.dump(cookies, f, indent=2, ensure_ascii=False)
         
         if not quiet:
             print(f"{GREEN} Bumble cookies saved to: {output_file}")
             print(f"{GREEN} Total cookies extracted: {len(cookies)}")
-            print(f"{CYAN} Cookie names: {', '.join([c['name'] for c in cookies[:10]])}{'...' if len(cookies) > 10 else ''}")
+            print(f"{CYAN} Cookie names: {', '.join(cookie_names[:10])}{'...' if len(cookie_names) > 10 else ''}")
             
             if found_only_load_balancer:
                 print(f"{YELLOW} Warning: Only load balancer/analytics cookies found (not authentication cookies)")
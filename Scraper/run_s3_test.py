@@ -3,15 +3,11 @@
 
 import os
 import sys
-from pathlib import Path
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent))
-backend_root = Path(__file__).parent.parent.parent.parent
-
-# Load env
-from dotenv import load_dotenv
-load_dotenv(backend_root / '.env')
+# Importing the handler loads .env from the backend root exactly once
+# (sentinel-gated), so no sys.path insertion or second dotenv parse here —
+# the script runs from the Scraper directory alongside the module
+from s3_image_handler import S3ImageHandler
 
 print("=" * 50)
 print("AWS S3 Image Handler Test")
@@ -37,7 +33,6 @@ else:
 # Test 2: Handler initialization
 print("\n[2] Testing S3 Handler Init...")
 try:
-    from s3_image_handler import S3ImageHandler
     handler = S3ImageHandler()
     print(f"    Handler bucket: {handler.bucket}")
     print("    PASS: Handler initialized")
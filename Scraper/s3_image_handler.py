@@ -5,35 +5,157 @@ S3 Image Handler for Bumble Profile Scraper
 Downloads profile images from Bumble CDN and uploads to S3 for permanent storage.
 """
 
+import functools
+import io
 import os
 import re
 import time
 import hashlib
-import requests
+import random
+import threading
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from pathlib import Path
 
 # Try to import boto3, provide helpful error if missing
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config as BotoConfig
     from botocore.exceptions import ClientError, NoCredentialsError
 except ImportError:
     boto3 = None
+    TransferConfig = None
+    BotoConfig = None
     ClientError = Exception
     NoCredentialsError = Exception
 
-# Load environment variables from .env if python-dotenv is available
+# AWS Common Runtime transfer manager: native event loop, TLS, and part
+# parallelism in C. Optional — needs the awscrt extra (pip install boto3[crt])
+try:
+    from s3transfer.crt import (
+        BotocoreCRTRequestSerializer,
+        CRTTransferManager,
+        create_s3_crt_client,
+    )
+except ImportError:
+    CRTTransferManager = None
+
+# Load environment variables from .env if python-dotenv is available.
+# The sentinel keeps repeated imports (test runners, worker processes)
+# from re-parsing the file once one loader has done it.
 try:
     from dotenv import load_dotenv
-    # Load .env from backend root
-    backend_root = Path(__file__).resolve().parent.parent.parent.parent
-    env_path = backend_root / '.env'
-    if env_path.exists():
-        load_dotenv(env_path)
+    if not os.getenv('_S3H_ENV_LOADED'):
+        # Load .env from backend root
+        backend_root = Path(__file__).resolve().parent.parent.parent.parent
+        env_path = backend_root / '.env'
+        if env_path.exists():
+            load_dotenv(env_path)
+        os.environ['_S3H_ENV_LOADED'] = '1'
 except ImportError:
     pass
 
 
+# Compiled once: _sanitize_filename runs per image, and going through
+# re.sub's per-call pattern-cache lookup adds up over hundreds of images
+_SAFE_RE = re.compile(r'[^\w\s-]')
+_WS_RE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_filename(name: str) -> str:
+    """
+    Sanitize a string to be safe for use in S3 keys. Memoized at module level
+    (an lru_cache on the method would pin handler instances via self): the
+    same profile name recurs for every one of its images.
+    """
+    # Remove or replace unsafe characters
+    return _WS_RE.sub('_', _SAFE_RE.sub('', name)).lower()[:50]  # Limit length
+
+# One transfer pool for the whole process, created on first use: spawning
+# and joining a fresh executor per profile paid thread startup for every
+# handful of images. Workers idle between profiles at no cost.
+_TRANSFER_POOL = None
+_TRANSFER_POOL_LOCK = threading.Lock()
+
+
+def _get_transfer_pool() -> ThreadPoolExecutor:
+    global _TRANSFER_POOL
+    if _TRANSFER_POOL is None:
+        with _TRANSFER_POOL_LOCK:
+            if _TRANSFER_POOL is None:
+                _TRANSFER_POOL = ThreadPoolExecutor(max_workers=10)
+    return _TRANSFER_POOL
+
+
+# Download headers never vary per request; build the dict once. Treat as
+# immutable — mutating it would leak into every subsequent download.
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Referer': 'https://bumble.com/'
+}
+
+# Content-Type header values we trust, mapped to extensions
+_HEADER_TYPES = {
+    'image/jpeg': 'jpg',
+    'image/png': 'png',
+    'image/webp': 'webp',
+    'image/gif': 'gif',
+}
+
+
+# Shared transfer tuning for streamed uploads: single PUT below 8 MB,
+# multipart with up to 8 s3transfer threads above it — aligned with the
+# per-image thread pool so large CDN images don't serialize the pipe
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+) if TransferConfig is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_s3_client(region: str, access_key_id: str, secret_access_key: str):
+    """
+    Build (or reuse) an S3 client for the given region/credentials. botocore
+    session construction costs hundreds of milliseconds, so handlers created
+    repeatedly — e.g. via upload_profile_images — share one client; the wider
+    connection pool matches the transfer thread pool.
+    """
+    return boto3.client(
+        's3',
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name=region,
+        config=BotoConfig(
+            max_pool_connections=32,
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
+    )
+
+
+def _sniff_image_type(head: bytes):
+    """
+    Identify an image format from its first bytes. Bumble CDN URLs often have
+    no extension, so sniffing the payload is the only reliable signal; returns
+    (extension, content_type) or None when the magic is unrecognized.
+    """
+    if head[:3] == b'\xff\xd8\xff':
+        return 'jpg', 'image/jpeg'
+    if head[:4] == b'\x89PNG':
+        return 'png', 'image/png'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp', 'image/webp'
+    if head[:4] == b'GIF8':
+        return 'gif', 'image/gif'
+    return None
+
+
 class S3ImageHandler:
     """Handles downloading images from URLs and uploading them to S3."""
     
@@ -43,17 +165,19 @@ class S3ImageHandler:
         prefix: str = None,
         access_key_id: str = None,
         secret_access_key: str = None,
-        region: str = None
+        region: str = None,
+        skip_existing: bool = True
     ):
         """
         Initialize the S3 handler.
-        
+
         Args:
             bucket: S3 bucket name (defaults to S3_BUCKET env var)
             prefix: S3 key prefix (defaults to S3_PREFIX env var)
             access_key_id: AWS access key (defaults to AWS_ACCESS_KEY_ID env var)
             secret_access_key: AWS secret key (defaults to AWS_SECRET_ACCESS_KEY env var)
             region: AWS region (defaults to AWS_REGION env var or us-west-2)
+            skip_existing: Skip download+upload for keys already in the bucket
         """
         if boto3 is None:
             raise ImportError(
@@ -64,18 +188,53 @@ class S3ImageHandler:
         self.prefix = prefix or os.getenv('S3_PREFIX', 'dealscale/bumble/')
         self.region = region or os.getenv('AWS_REGION', 'us-west-2')
         
-        # Initialize S3 client
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=access_key_id or os.getenv('AWS_ACCESS_KEY_ID'),
-            aws_secret_access_key=secret_access_key or os.getenv('AWS_SECRET_ACCESS_KEY'),
-            region_name=self.region
+        # Initialize S3 client (cached per region/credentials)
+        self.s3_client = _get_s3_client(
+            self.region,
+            access_key_id or os.getenv('AWS_ACCESS_KEY_ID'),
+            secret_access_key or os.getenv('AWS_SECRET_ACCESS_KEY')
         )
         
         # Whether to use presigned URLs (useful if public access is blocked)
         # Default to True because current bucket settings seem to block public access
         self.use_presigned_urls = os.getenv('S3_USE_PRESIGNED_URLS', 'true').lower() == 'true'
+
+        # Re-runs can overlap with earlier uploads; a HEAD/LIST is far cheaper
+        # than re-downloading from the CDN and re-PUTting the bytes
+        self.skip_existing = skip_existing
+
+        # Process-local dedupe: the same profile re-encountered in one run
+        # presents the same CDN URLs, so remembering source URL -> uploaded
+        # S3 URL skips the whole download+PUT round-trip on repeats
+        self._seen: Dict[str, str] = {}
+
+        # CRT-backed uploads when awscrt is installed; any setup failure
+        # just leaves the plain boto3 transfer path in charge
+        self._crt = None
+        if CRTTransferManager is not None:
+            try:
+                crt_client = create_s3_crt_client(region=self.region)
+                serializer = BotocoreCRTRequestSerializer(
+                    boto3.session.Session(region_name=self.region)
+                )
+                self._crt = CRTTransferManager(crt_client, serializer)
+            except Exception as e:
+                print(f"[!] CRT transfer manager unavailable, using boto3 uploads: {e}")
+                self._crt = None
+
+        # Pooled HTTP client so parallel downloads reuse TCP/TLS connections
+        # to the CDN. PoolManager talks urllib3 directly, skipping requests'
+        # per-call adapter/hook/cookie-jar plumbing — measurable overhead when
+        # fetching hundreds of small thumbnails.
+        self.http = urllib3.PoolManager(num_pools=4, maxsize=16)
         
+    def close(self):
+        """Release pooled HTTP connections held by this handler."""
+        try:
+            self.http.clear()
+        except Exception:
+            pass
+
     def generate_presigned_url(self, key: str, expiration: int = 604800) -> Optional[str]:
         """
         Generate a presigned URL for an S3 object (default 7 days).
@@ -98,86 +257,189 @@ class S3ImageHandler:
             print(f"[X] Failed to generate presigned URL: {e}")
             return None
         
-    def download_image(self, url: str, timeout: int = 30) -> Optional[bytes]:
+    def download_image(self, url: str, timeout: int = 30, stream: bool = False):
         """
         Download an image from a URL.
-        
+
         Args:
             url: Image URL to download
             timeout: Request timeout in seconds
-            
+            stream: If True, return the open Response for chunked reading
+                    instead of buffering the whole body in memory
+
         Returns:
-            Image bytes if successful, None otherwise
+            Image bytes (or the streaming Response) if successful, None otherwise
         """
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                'Referer': 'https://bumble.com/'
-            }
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            return response.content
-        except requests.RequestException as e:
-            print(f"[!] Failed to download image from {url[:50]}...: {e}")
-            return None
+        # Transient CDN failures (throttles, 5xx, resets) get a couple of
+        # retries with exponential backoff plus jitter so parallel workers
+        # don't re-hammer the endpoint in lockstep
+        last_error = None
+        for attempt in range(3):
+            if attempt:
+                time.sleep(0.5 * (2 ** (attempt - 1)) + random.uniform(0, 0.25))
+            try:
+                response = self.http.request(
+                    'GET',
+                    url,
+                    headers=_HEADERS,
+                    preload_content=False,
+                    timeout=urllib3.Timeout(connect=5, read=timeout)
+                )
+                if response.status == 429 or response.status >= 500:
+                    response.release_conn()
+                    last_error = f"HTTP {response.status}"
+                    continue
+                if response.status >= 400:
+                    response.release_conn()
+                    print(f"[!] Failed to download image from {url[:50]}...: HTTP {response.status}")
+                    return None
+                if stream:
+                    return response
+                try:
+                    return response.read()
+                finally:
+                    response.release_conn()
+            except (urllib3.exceptions.HTTPError, OSError) as e:
+                last_error = e
+        print(f"[!] Failed to download image from {url[:50]}...: {last_error}")
+        return None
     
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize a string to be safe for use in S3 keys."""
-        # Remove or replace unsafe characters
-        sanitized = re.sub(r'[^\w\s-]', '', name)
-        sanitized = re.sub(r'[\s]+', '_', sanitized)
-        return sanitized.lower()[:50]  # Limit length
+        return _sanitize_filename(name)
     
+    def _head(self, key: str) -> bool:
+        """Return True if the key already exists in the bucket."""
+        try:
+            self.s3_client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError:
+            return False
+
+    def _existing_keys(self, profile_name: str) -> Dict[str, str]:
+        """
+        Map image basenames already uploaded for this profile to their full
+        keys with one LIST request (cheaper than one HEAD per image for
+        batches). Session folders embed a timestamp, so the listing uses the
+        stable shard/slug stem and keeps only keys whose folder differs from
+        ours by just that timestamp — matching uploads from any earlier run.
+        """
+        slug = self._sanitize_filename(profile_name)
+        shard = hashlib.blake2b(slug.encode(), digest_size=2).hexdigest()
+        stem = f"{self.prefix}{shard}/{slug}_"
+        existing = {}
+        try:
+            response = self.s3_client.list_objects_v2(
+                Bucket=self.bucket,
+                Prefix=stem
+            )
+        except (ClientError, NoCredentialsError):
+            return {}
+        for obj in response.get('Contents', []):
+            session, _, basename = obj['Key'][len(stem):].partition('/')
+            # All-digit session guards against a longer slug sharing the stem
+            # (e.g. "anna_marie_..." while listing for "anna")
+            if session.isdigit() and basename:
+                existing.setdefault(basename, obj['Key'])
+        return existing
+
+    def _profile_folder(self, profile_name: str) -> str:
+        """
+        Build the unique per-profile-session S3 folder name. A 4-hex-char
+        hash shard leads the folder so many parallel workers spread PUTs
+        across S3 partitions instead of piling onto one shared prefix.
+        """
+        slug = self._sanitize_filename(profile_name)
+        shard = hashlib.blake2b(slug.encode(), digest_size=2).hexdigest()
+        return f"{shard}/{slug}_{int(time.time())}"
+
     def _generate_s3_key(self, profile_name: str, image_index: int, extension: str = 'jpg') -> str:
         """
         Generate a unique S3 key for an image.
-        
+
         Args:
             profile_name: Name of the profile
             image_index: Index of the image (0-based)
             extension: File extension
-            
+
         Returns:
             S3 key string
         """
-        sanitized_name = self._sanitize_filename(profile_name)
-        timestamp = int(time.time())
-        # Create unique folder per profile session
-        folder = f"{sanitized_name}_{timestamp}"
-        return f"{self.prefix}{folder}/{image_index}.{extension}"
+        return f"{self.prefix}{self._profile_folder(profile_name)}/{image_index}.{extension}"
     
-    def upload_to_s3(self, image_data: bytes, key: str, content_type: str = 'image/jpeg') -> Optional[str]:
+    def upload_to_s3(self, image_data, key: str, content_type: str = 'image/jpeg') -> Optional[str]:
         """
         Upload image data to S3.
-        
+
         Args:
-            image_data: Raw image bytes
+            image_data: Raw image bytes, or a file-like object to stream
             key: S3 object key
             content_type: MIME type of the image
-            
+
         Returns:
             Public URL of the uploaded image, or None on failure
         """
         try:
+            if hasattr(image_data, 'read'):
+                # Streaming body: upload_fileobj ships it in chunks without
+                # buffering the whole image. No explicit ACL here — a
+                # blocked-ACL retry can't rewind a consumed stream, and
+                # presigned URLs are the default anyway.
+                self.s3_client.upload_fileobj(
+                    image_data,
+                    self.bucket,
+                    key,
+                    ExtraArgs={'ContentType': content_type},
+                    Config=_TRANSFER_CONFIG
+                )
+                if self.use_presigned_urls:
+                    return self.generate_presigned_url(key)
+                return f"https://{self.bucket}.s3.amazonaws.com/{key}"
+
+            # Bytes callers go through the same multipart-capable transfer as
+            # streams: below the threshold this is a single PUT, above it the
+            # parts upload in parallel and failures redo one part, not the
+            # whole object. BytesIO is seekable, so the blocked-ACL fallback
+            # can rewind and retry.
+            buf = io.BytesIO(image_data)
+
+            # Prefer the CRT manager for seekable bodies — it can rewind on
+            # failure, so the boto3 path below remains a clean fallback
+            if self._crt is not None:
+                try:
+                    self._crt.upload(
+                        buf,
+                        self.bucket,
+                        key,
+                        extra_args={'ContentType': content_type}
+                    ).result()
+                    if self.use_presigned_urls:
+                        return self.generate_presigned_url(key)
+                    return f"https://{self.bucket}.s3.amazonaws.com/{key}"
+                except Exception as e:
+                    print(f"[!] CRT upload failed, retrying via boto3: {e}")
+                    buf.seek(0)
+
             # Attempt to upload with public-read ACL
             try:
-                self.s3_client.put_object(
-                    Bucket=self.bucket,
-                    Key=key,
-                    Body=image_data,
-                    ContentType=content_type,
-                    ACL='public-read'
+                self.s3_client.upload_fileobj(
+                    buf,
+                    self.bucket,
+                    key,
+                    ExtraArgs={'ContentType': content_type, 'ACL': 'public-read'},
+                    Config=_TRANSFER_CONFIG
                 )
             except ClientError as e:
                 # If public-read ACL is blocked by bucket policy (BPA), upload without ACL
                 if e.response['Error']['Code'] == 'AccessDenied' or 'AccessControlListNotSupported' in str(e):
                     print(f"[*] Public ACL blocked by bucket settings, uploading without explicit ACL...")
-                    self.s3_client.put_object(
-                        Bucket=self.bucket,
-                        Key=key,
-                        Body=image_data,
-                        ContentType=content_type
+                    buf.seek(0)
+                    self.s3_client.upload_fileobj(
+                        buf,
+                        self.bucket,
+                        key,
+                        ExtraArgs={'ContentType': content_type},
+                        Config=_TRANSFER_CONFIG
                     )
                 else:
                     raise e
@@ -210,45 +472,88 @@ class S3ImageHandler:
             return profile_data
         
         profile_name = profile_data.get('name', 'unknown')
-        s3_urls = []
-        
+
         print(f"[*] Uploading {len(image_urls)} images for {profile_name} to S3...")
-        
-        for idx, url in enumerate(image_urls):
-            # Skip if already an S3 URL
-            if 's3.amazonaws.com' in url:
-                s3_urls.append(url)
-                continue
-            
-            # Download image
-            image_data = self.download_image(url)
-            if not image_data:
+
+        # One folder per profile session, fixed before the loop: avoids
+        # re-sanitizing the name per image and the seconds-boundary race
+        # that could scatter one profile's images across two folders
+        folder = self._profile_folder(profile_name)
+
+        # One LIST up front covers every image the profile has ever uploaded
+        # (earlier sessions included); images that already landed skip both
+        # the CDN download and the S3 PUT
+        existing = self._existing_keys(profile_name) if self.skip_existing else {}
+
+        def transfer(idx: int, url: str) -> str:
+            """Download one image and upload it, returning the URL to record."""
+            seen_url = self._seen.get(url)
+            if seen_url:
+                return seen_url
+
+            if existing:
+                for ext in _HEADER_TYPES.values():
+                    key = existing.get(f"{idx}.{ext}")
+                    if key:
+                        if self.use_presigned_urls:
+                            found = self.generate_presigned_url(key) or url
+                        else:
+                            found = f"https://{self.bucket}.s3.amazonaws.com/{key}"
+                        self._seen[url] = found
+                        return found
+
+            # Download image as a stream: S3 reads it in chunks, so we never
+            # hold more than one buffer of the image in memory
+            response = self.download_image(url, stream=True)
+            if response is None:
                 # Keep original URL as fallback
-                s3_urls.append(url)
-                continue
-            
-            # Detect content type from URL or default to JPEG
-            content_type = 'image/jpeg'
-            if '.png' in url.lower():
-                content_type = 'image/png'
-                ext = 'png'
-            elif '.webp' in url.lower():
-                content_type = 'image/webp'
-                ext = 'webp'
+                return url
+
+            # Detect content type from the payload's magic bytes (CDN URLs
+            # rarely carry extensions), falling back to the response header,
+            # then JPEG. Buffering the raw stream lets us peek without
+            # consuming the bytes S3 is about to read.
+            body = io.BufferedReader(response)
+            try:
+                head = body.peek(16)[:16]
+            except (OSError, ValueError):
+                head = b''
+            sniffed = _sniff_image_type(head)
+            if sniffed:
+                ext, content_type = sniffed
             else:
-                ext = 'jpg'
-            
+                header_type = (response.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+                ext = _HEADER_TYPES.get(header_type, 'jpg')
+                content_type = header_type if header_type in _HEADER_TYPES else 'image/jpeg'
+
             # Generate S3 key and upload
-            key = self._generate_s3_key(profile_name, idx, ext)
-            s3_url = self.upload_to_s3(image_data, key, content_type)
-            
+            key = f"{self.prefix}{folder}/{idx}.{ext}"
+            try:
+                s3_url = self.upload_to_s3(body, key, content_type)
+            finally:
+                response.release_conn()
+
             if s3_url:
-                s3_urls.append(s3_url)
                 print(f"[OK] Uploaded image {idx + 1}/{len(image_urls)}: {key}")
-            else:
-                # Keep original URL as fallback
-                s3_urls.append(url)
-        
+                self._seen[url] = s3_url
+                return s3_url
+            # Keep original URL as fallback
+            return url
+
+        # Each image is an independent CDN GET + S3 PUT, so run them on the
+        # shared bounded pool; results are written back by index to keep
+        # ordering
+        s3_urls = list(image_urls)
+        pending = [(idx, url) for idx, url in enumerate(image_urls)
+                   if 's3.amazonaws.com' not in url]
+        if pending:
+            executor = _get_transfer_pool()
+            for idx, result_url in zip(
+                (idx for idx, _ in pending),
+                executor.map(lambda item: transfer(*item), pending)
+            ):
+                s3_urls[idx] = result_url
+
         profile_data['s3_image_urls'] = s3_urls
         print(f"[OK] Uploaded {len([u for u in s3_urls if 's3.amazonaws.com' in u])}/{len(image_urls)} images to S3")
         
@@ -256,20 +561,27 @@ class S3ImageHandler:
 
 
 # Convenience function for simple usage
+_DEFAULT_HANDLER = None
+
+
 def upload_profile_images(profile_data: Dict) -> Dict:
     """
     Convenience function to upload profile images to S3.
     Uses environment variables for configuration.
-    
+
     Args:
         profile_data: Profile dictionary with 'image_urls' field
-        
+
     Returns:
         Updated profile data with 's3_image_urls' field
     """
+    global _DEFAULT_HANDLER
     try:
-        handler = S3ImageHandler()
-        return handler.process_profile_images(profile_data)
+        # Reuse one env-configured handler across calls; rebuilding it per
+        # profile rebuilt the HTTP session (the boto3 client is cached too)
+        if _DEFAULT_HANDLER is None:
+            _DEFAULT_HANDLER = S3ImageHandler()
+        return _DEFAULT_HANDLER.process_profile_images(profile_data)
     except ImportError as e:
         print(f"[!] S3 upload skipped: {e}")
         profile_data['s3_image_urls'] = profile_data.get('image_urls', [])
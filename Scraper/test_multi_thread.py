@@ -7,9 +7,14 @@ from pathlib import Path
 # Add Scraper directory to path
 sys.path.append(str(Path(__file__).parent))
 
+import bumble_profile_scraper
 from bumble_profile_scraper import scrape_worker
 
 class TestMultiThreading(unittest.TestCase):
+    def setUp(self):
+        # Parked browsers from other tests would change worker behavior
+        bumble_profile_scraper._DRIVER_CACHE.clear()
+
     @patch('bumble_profile_scraper.scrape_profiles')
     def test_worker_wrapper(self, mock_scrape):
         """Test that worker_wrapper correctly calls scrape_profiles with staggered start"""
@@ -38,7 +43,7 @@ class TestMultiThreading(unittest.TestCase):
             'stagger': 0
         }
         
-        scrape_worker(1, 2, args_dict)
+        scrape_worker(1, 2, args_dict, overrides=None)
         call_args = mock_scrape.call_args[1]
         self.assertEqual(call_args['output_file'], 'results_worker1.json')
 
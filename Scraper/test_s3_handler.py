@@ -8,6 +8,7 @@ import os
 import sys
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -25,144 +26,161 @@ class TestS3ImageHandler(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        """Set up test fixtures."""
+        """Set up test fixtures shared across the class."""
         cls.test_image_url = "https://images.pexels.com/photos/220453/pexels-photo-220453.jpeg?w=100"
         cls.test_profile_name = "TestUser"
-        
-    def test_handler_initialization(self):
-        """Test S3ImageHandler initializes with credentials from environment."""
+        # Build the handler once: every construction rebuilds a botocore
+        # session + signer + endpoint resolver, which dominates short runs
+        cls.handler = None
+        cls.skip_reason = None
+        cls.init_error = None
         try:
             from s3_image_handler import S3ImageHandler
-            handler = S3ImageHandler()
-            
-            self.assertIsNotNone(handler.bucket)
-            self.assertIsNotNone(handler.s3_client)
-            print(f"✅ Handler initialized with bucket: {handler.bucket}")
+            cls.handler = S3ImageHandler()
         except ImportError as e:
-            self.skipTest(f"boto3 not installed: {e}")
+            cls.skip_reason = f"boto3 not installed: {e}"
         except Exception as e:
-            self.fail(f"Failed to initialize handler: {e}")
-    
+            cls.init_error = e
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared handler's pooled connections."""
+        if cls.handler is not None:
+            cls.handler.close()
+
+    def _require_handler(self):
+        """Return the shared handler, skipping or failing as appropriate."""
+        if self.skip_reason:
+            self.skipTest(self.skip_reason)
+        if self.init_error:
+            self.fail(f"Failed to initialize handler: {self.init_error}")
+        return self.handler
+
+    def test_handler_initialization(self):
+        """Test S3ImageHandler initializes with credentials from environment."""
+        handler = self._require_handler()
+        self.assertIsNotNone(handler.bucket)
+        self.assertIsNotNone(handler.s3_client)
+        print(f"✅ Handler initialized with bucket: {handler.bucket}")
+
     def test_image_download(self):
         """Test downloading an image from URL."""
+        handler = self._require_handler()
         try:
-            from s3_image_handler import S3ImageHandler
-            handler = S3ImageHandler()
-            
             image_data = handler.download_image(self.test_image_url)
-            
+
             self.assertIsNotNone(image_data)
             self.assertGreater(len(image_data), 0)
             print(f"✅ Downloaded image: {len(image_data)} bytes")
-        except ImportError:
-            self.skipTest("boto3 not installed")
         except Exception as e:
             self.fail(f"Failed to download image: {e}")
-    
+
     def test_s3_key_generation(self):
         """Test S3 key generation format."""
+        handler = self._require_handler()
         try:
-            from s3_image_handler import S3ImageHandler
-            handler = S3ImageHandler()
-            
             key = handler._generate_s3_key(self.test_profile_name, 0)
-            
+
             self.assertIn(handler.prefix, key)
             self.assertIn(self.test_profile_name.lower().replace(" ", "_"), key)
             self.assertTrue(key.endswith('.jpg'))
+            # Keys are sharded under a 4-hex-char segment after the prefix
+            shard = key[len(handler.prefix):].split('/', 1)[0]
+            self.assertRegex(shard, r'^[0-9a-f]{4}$')
             print(f"✅ Generated S3 key: {key}")
-        except ImportError:
-            self.skipTest("boto3 not installed")
         except Exception as e:
             self.fail(f"Failed to generate S3 key: {e}")
-    
+
     def test_full_upload_flow(self):
         """Test complete image upload to S3."""
+        handler = self._require_handler()
         try:
-            from s3_image_handler import S3ImageHandler
-            handler = S3ImageHandler()
-            
             # Download image
             image_data = handler.download_image(self.test_image_url)
             self.assertIsNotNone(image_data)
-            
+
             # Generate key
             key = handler._generate_s3_key(self.test_profile_name, 0)
-            
+
             # Upload to S3
             s3_url = handler.upload_to_s3(image_data, key)
-            
+
             self.assertIsNotNone(s3_url)
             self.assertIn("s3.amazonaws.com", s3_url)
             print(f"✅ Uploaded to S3: {s3_url}")
-            
+
             return s3_url
-        except ImportError:
-            self.skipTest("boto3 not installed")
         except Exception as e:
             self.fail(f"Failed to upload image: {e}")
-    
+
     def test_process_profile_images(self):
         """Test processing a complete profile with images."""
+        handler = self._require_handler()
         try:
-            from s3_image_handler import S3ImageHandler
-            handler = S3ImageHandler()
-            
             # Create mock profile data
             profile_data = {
                 "name": "TestProfile",
                 "age": 25,
                 "image_urls": [self.test_image_url]
             }
-            
+
             # Process profile images
             result = handler.process_profile_images(profile_data)
-            
+
             self.assertIn("s3_image_urls", result)
             self.assertEqual(len(result["s3_image_urls"]), 1)
             self.assertIn("s3.amazonaws.com", result["s3_image_urls"][0])
             print(f"✅ Profile processed with S3 URLs: {result['s3_image_urls']}")
-        except ImportError:
-            self.skipTest("boto3 not installed")
         except Exception as e:
             self.fail(f"Failed to process profile: {e}")
 
 
 class TestS3Integration(unittest.TestCase):
     """Integration tests for S3 with real AWS calls."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Read env config and build the S3 client once for the class."""
+        cls.access_key = os.getenv('AWS_ACCESS_KEY_ID')
+        cls.secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
+        cls.bucket = os.getenv('S3_BUCKET')
+        cls.prefix = os.getenv('S3_PREFIX', 'dealscale/bumble/')
+        cls.s3 = None
+        try:
+            import boto3
+            cls.s3 = boto3.client(
+                's3',
+                aws_access_key_id=cls.access_key,
+                aws_secret_access_key=cls.secret_key
+            )
+        except ImportError:
+            pass
+
     def test_aws_credentials_present(self):
         """Test that AWS credentials are configured."""
-        access_key = os.getenv('AWS_ACCESS_KEY_ID')
-        secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
-        bucket = os.getenv('S3_BUCKET')
-        
-        self.assertIsNotNone(access_key, "AWS_ACCESS_KEY_ID not set")
-        self.assertIsNotNone(secret_key, "AWS_SECRET_ACCESS_KEY not set")
-        self.assertIsNotNone(bucket, "S3_BUCKET not set")
-        
-        print(f"✅ AWS credentials configured for bucket: {bucket}")
-        print(f"   Access Key ID: {access_key[:4]}...{access_key[-4:]}")
-    
+        self.assertIsNotNone(self.access_key, "AWS_ACCESS_KEY_ID not set")
+        self.assertIsNotNone(self.secret_key, "AWS_SECRET_ACCESS_KEY not set")
+        self.assertIsNotNone(self.bucket, "S3_BUCKET not set")
+
+        print(f"✅ AWS credentials configured for bucket: {self.bucket}")
+        print(f"   Access Key ID: {self.access_key[:4]}...{self.access_key[-4:]}")
+
     def test_s3_bucket_access(self):
         """Test that we can access the S3 bucket."""
+        if self.s3 is None:
+            self.skipTest("boto3 not installed")
         try:
-            import boto3
             from botocore.exceptions import ClientError
-            
-            s3 = boto3.client(
-                's3',
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
-            )
-            
-            bucket = os.getenv('S3_BUCKET')
-            
-            # Try to list objects (limited)
-            response = s3.list_objects_v2(
+
+            bucket = self.bucket
+
+            # Try to list objects (limited); skip owner metadata — this
+            # check only cares whether the bucket answers at all
+            response = self.s3.list_objects_v2(
                 Bucket=bucket,
-                Prefix=os.getenv('S3_PREFIX', 'dealscale/bumble/'),
-                MaxKeys=1
+                Prefix=self.prefix,
+                MaxKeys=1,
+                FetchOwner=False
             )
             
             print(f"✅ Successfully accessed bucket: {bucket}")
@@ -170,9 +188,7 @@ class TestS3Integration(unittest.TestCase):
                 print(f"   Found {len(response['Contents'])} existing object(s)")
             else:
                 print("   Bucket is accessible (empty or no matching prefix)")
-                
-        except ImportError:
-            self.skipTest("boto3 not installed")
+
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'AccessDenied':
@@ -190,29 +206,37 @@ def run_tests():
     print("=" * 60)
     print()
     
-    # Create test suite
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestS3Integration))
-    suite.addTests(loader.loadTestsFromTestCase(TestS3ImageHandler))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
+    test_classes = (TestS3Integration, TestS3ImageHandler)
+
+    if os.getenv('PARALLEL_TESTS') == '1':
+        # Most of these tests block on S3/CDN round-trips, so running the
+        # two classes in separate threads overlaps the network waits. The
+        # interleaved output is why this stays opt-in.
+        suites = [loader.loadTestsFromTestCase(c) for c in test_classes]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda s: unittest.TextTestRunner(verbosity=2).run(s),
+                suites
+            ))
+    else:
+        suite = unittest.TestSuite()
+        for c in test_classes:
+            suite.addTests(loader.loadTestsFromTestCase(c))
+        runner = unittest.TextTestRunner(verbosity=2)
+        results = [runner.run(suite)]
+
     # Print summary
     print()
     print("=" * 60)
     print("Test Summary")
     print("=" * 60)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped)}")
-    
-    if result.wasSuccessful():
+    print(f"Tests run: {sum(r.testsRun for r in results)}")
+    print(f"Failures: {sum(len(r.failures) for r in results)}")
+    print(f"Errors: {sum(len(r.errors) for r in results)}")
+    print(f"Skipped: {sum(len(r.skipped) for r in results)}")
+
+    if all(r.wasSuccessful() for r in results):
         print("\n✅ All tests passed!")
         return 0
     else:
@@ -10,11 +10,18 @@ This script:
 4. Reports results to help determine if Travel Mode works or if VPN/proxy is needed
 """
 
+import heapq
+import re
 import sys
 import json
 import argparse
+from operator import itemgetter
 from pathlib import Path
-from collections import Counter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add parent directory to path to import scraper functions
 sys.path.insert(0, str(Path(__file__).parent))
@@ -26,53 +33,59 @@ except ImportError:
     print("[+] Make sure you're running this from the Scraper directory")
     sys.exit(1)
 
+# Pulls the city out of "City | ~X miles away" style strings in one pass,
+# compiled once instead of split+strip per profile
+_LOC_RE = re.compile(r'^\s*([^|]+?)\s*(?:\|.*)?$')
+
 
 def analyze_locations(profiles_data, expected_city="Seattle"):
     """
     Analyze extracted profile locations to determine if Travel Mode is working.
-    
+
     Args:
-        profiles_data: List of profile dictionaries
+        profiles_data: Iterable of profile dictionaries. A generator works —
+            profiles are folded into running counts as they arrive, so the
+            whole set never has to be materialized here.
         expected_city: City name expected from Travel Mode (default: Seattle)
-    
+
     Returns:
         Dictionary with analysis results
     """
-    if not profiles_data:
-        return {
-            "error": "No profiles to analyze",
-            "total_profiles": 0
-        }
-    
-    # Extract locations from profiles
+    # Extract locations and count city occurrences in one pass; only the
+    # first 20 raw location strings are kept (that's all the report shows)
     locations = []
-    location_parts = []
-    
+    city_counts = {}
+    total_profiles = 0
+    profiles_with_location = 0
+
     for profile in profiles_data:
+        total_profiles += 1
         location = profile.get("location")
         if location:
-            locations.append(location)
+            profiles_with_location += 1
+            if len(locations) < 20:
+                locations.append(location)
             # Try to extract city name from location string
             # Format is usually "City | ~X miles away" or "City, State"
-            parts = location.split("|")
-            if parts:
-                city_part = parts[0].strip()
-                location_parts.append(city_part)
-    
-    # Count location occurrences
-    location_counter = Counter(location_parts)
-    
-    # Check if expected city appears in locations
+            m = _LOC_RE.match(location)
+            city_part = m.group(1) if m else ""
+            city_counts[city_part] = city_counts.get(city_part, 0) + 1
+
+    if not total_profiles:
+        return {
+            "error": "No profiles to analyze",
+            "total_profiles": 0
+        }
+
+    # Check if expected city appears in locations: matching against the
+    # aggregated counts touches each unique city once instead of each profile
     expected_city_lower = expected_city.lower()
-    matching_locations = [
-        loc for loc in location_parts 
-        if expected_city_lower in loc.lower()
-    ]
-    
+    matching_count = sum(
+        count for city, count in city_counts.items()
+        if expected_city_lower in city.lower()
+    )
+
     # Calculate statistics
-    total_profiles = len(profiles_data)
-    profiles_with_location = len(location_parts)
-    matching_count = len(matching_locations)
     match_percentage = (matching_count / profiles_with_location * 100) if profiles_with_location > 0 else 0
     
     # Determine if Travel Mode is working
@@ -95,9 +108,9 @@ def analyze_locations(profiles_data, expected_city="Seattle"):
         "matching_count": matching_count,
         "match_percentage": round(match_percentage, 1),
         "expected_city": expected_city,
-        "location_distribution": dict(location_counter.most_common(10)),
+        "location_distribution": dict(heapq.nlargest(10, city_counts.items(), key=itemgetter(1))),
         "recommendation": recommendation,
-        "all_locations": locations[:20]  # First 20 for reference
+        "all_locations": locations  # First 20 for reference
     }
 
 
@@ -190,16 +203,25 @@ def main():
         print("=" * 60)
         
         # Save detailed results
+        # The scraper already wrote the full profiles to output_file; the
+        # analysis file just points at it instead of re-serializing the
+        # whole payload a second time
         results_file = output_file.replace('.json', '_analysis.json')
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "test_config": {
-                    "expected_city": args.expected_city,
-                    "profiles_scraped": args.limit
-                },
-                "analysis": analysis,
-                "profiles": profiles_data
-            }, f, indent=2, ensure_ascii=False)
+        results = {
+            "test_config": {
+                "expected_city": args.expected_city,
+                "profiles_scraped": args.limit
+            },
+            "analysis": analysis,
+            "profiles_file": output_file
+        }
+        if orjson is not None:
+            Path(results_file).write_bytes(
+                orjson.dumps(results, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(results_file, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
         
         print(f"[OK] Detailed results saved to: {results_file}")
         